@@ -5,15 +5,96 @@ This example demonstrates:
 2. Job status tracking
 3. Retry logic with exponential backoff
 4. Redis backend for persistence
+5. Micro-batching LLM calls across concurrently running jobs
 """
 
 import asyncio
+import sys
+from typing import List, Optional, Tuple, Union
+
 from rapidai import App, LLM, background, JobStatus, get_queue
 
 app = App(title="Background Jobs Example")
 llm = LLM("claude-3-haiku-20240307")
 
 
+def summary_prompt(content: str) -> str:
+    """Build the summarization prompt for a document."""
+    return f"Summarize this text in one sentence:\n\n{content}"
+
+
+async def process_document_batch(items: List[str]) -> List[Union[str, BaseException]]:
+    """Summarize a batch of documents with all LLM calls in flight at once.
+
+    A failed call is returned in place of its summary, so one bad document
+    does not fail the rest of the batch.
+    """
+    return await asyncio.gather(
+        *[llm.complete(summary_prompt(item)) for item in items], return_exceptions=True
+    )
+
+
+class SummaryBatcher:
+    """Coalesces summarization requests from concurrent jobs into batches.
+
+    Requests arriving within ``max_wait_ms`` of each other (up to ``max_batch``)
+    are dispatched together via :func:`process_document_batch`, so N queued
+    documents cost roughly one LLM round-trip instead of N serial ones.
+    """
+
+    def __init__(self, max_batch: int = 32, max_wait_ms: int = 20):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._pending: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, content: str) -> str:
+        """Queue a document for summarization and wait for its result."""
+        if self._pending is None:
+            self._pending = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put((content, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for one item, then drain more until the window closes."""
+        batch = [await self._pending.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._pending.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Dispatch batches for as long as the worker is alive."""
+        while True:
+            batch = await self._collect_batch()
+            contents = [content for content, _ in batch]
+            results = await process_document_batch(contents)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+summarizer = SummaryBatcher(max_batch=32, max_wait_ms=20)
+
+
 # Define background job with retry logic
 @background(max_retries=3)
 async def process_document(doc_id: str, content: str):
@@ -23,8 +104,8 @@ async def process_document(doc_id: str, content: str):
     # Simulate processing
     await asyncio.sleep(2)
 
-    # Generate summary using LLM
-    summary = await llm.complete(f"Summarize this text in one sentence:\n\n{content}")
+    # Generate summary using LLM (batched with other in-flight jobs)
+    summary = await summarizer.submit(content)
 
     return {"doc_id": doc_id, "summary": summary, "status": "completed"}
 
@@ -62,13 +143,13 @@ async def get_job_status(job_id: str):
     response = {
         "job_id": result.job_id,
         "status": result.status,
-        "created_at": result.created_at.isoformat(),
+        "created_at": result.created_at,
         "attempts": result.attempts,
         "max_retries": result.max_retries,
     }
 
     if result.is_done:
-        response["completed_at"] = result.completed_at.isoformat()
+        response["completed_at"] = result.completed_at
         response["duration"] = result.duration
 
         if result.status == JobStatus.COMPLETED:
@@ -109,34 +190,44 @@ async def list_jobs(status: str = None):
 
     return {
         "jobs": [
-            {"job_id": job.job_id, "status": job.status, "created_at": job.created_at.isoformat()}
+            {"job_id": job.job_id, "status": job.status, "created_at": job.created_at}
             for job in jobs
         ],
         "total": len(jobs),
     }
 
 
-@app.route("/health", methods=["GET"])
+@app.route("/health", methods=["GET"], static=True)
 async def health():
     """Health check endpoint."""
     return {"status": "healthy", "service": "background-jobs-example"}
 
 
+BANNER = """\
+Background Jobs Example
+==================================================
+
+Endpoints:
+  POST /documents/process - Queue document for processing
+  GET  /jobs/<job_id>     - Get job status
+  POST /jobs/<job_id>/cancel - Cancel a job
+  POST /email/send        - Send email asynchronously
+  GET  /jobs              - List all jobs
+
+Example usage:
+  curl -X POST http://localhost:8000/documents/process \\
+    -H "Content-Type: application/json" \\
+    -d '{"doc_id": "doc-123", "content": "RapidAI is a Python framework..."}'
+
+  curl http://localhost:8000/jobs/<job_id>
+
+Starting server on http://localhost:8000
+==================================================
+"""
+
+
 if __name__ == "__main__":
-    print("Background Jobs Example")
-    print("=" * 50)
-    print("\nEndpoints:")
-    print("  POST /documents/process - Queue document for processing")
-    print("  GET  /jobs/<job_id>     - Get job status")
-    print("  POST /jobs/<job_id>/cancel - Cancel a job")
-    print("  POST /email/send        - Send email asynchronously")
-    print("  GET  /jobs              - List all jobs")
-    print("\nExample usage:")
-    print('  curl -X POST http://localhost:8000/documents/process \\')
-    print('    -H "Content-Type: application/json" \\')
-    print('    -d \'{"doc_id": "doc-123", "content": "RapidAI is a Python framework..."}\'')
-    print("\n  curl http://localhost:8000/jobs/<job_id>")
-    print("\nStarting server on http://localhost:8000")
-    print("=" * 50)
+    # One write instead of a print() per line
+    sys.stdout.write(BANNER)
 
     app.run(port=8000)
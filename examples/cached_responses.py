@@ -7,17 +7,21 @@ llm = LLM("claude-3-haiku-20240307")
 
 
 @app.route("/summarize", methods=["POST"])
-@cache(ttl=3600)  # Cache for 1 hour
+@cache(ttl=3600, semantic=True, threshold=0.95)  # Cache for 1 hour
 async def summarize(text: str):
-    """Summarize text with exact caching."""
+    """Summarize text with semantic caching.
+
+    Paraphrased requests ("Summarize X." vs "Please summarize X.") hit the
+    same cache entry when their embeddings are at least 95% similar.
+    """
     response = await llm.complete(f"Summarize this text concisely:\n\n{text}")
     return {"summary": response, "cached": False}  # Note: In production, track cache hits
 
 
 @app.route("/analyze", methods=["POST"])
-@cache(ttl=1800)  # Cache for 30 minutes
+@cache(ttl=1800, semantic=True, threshold=0.95)  # Cache for 30 minutes
 async def analyze(text: str):
-    """Analyze text sentiment with caching."""
+    """Analyze text sentiment with semantic caching."""
     response = await llm.complete(
         f"Analyze the sentiment of this text (positive/negative/neutral):\n\n{text}"
     )
@@ -10,12 +10,11 @@ llm = LLM("claude-3-haiku-20240307")
 @stream
 async def chat(message: str):
     """Stream a chat response."""
-    response = await llm.chat(message, stream=True)
-    async for chunk in response:
-        yield chunk
+    # Hand the provider stream straight to @stream, no re-yield per token
+    return await llm.chat(message, stream=True)
 
 
-@app.route("/health", methods=["GET"])
+@app.route("/health", methods=["GET"], static=True)
 async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
@@ -8,12 +8,14 @@ This example demonstrates:
 5. Model usage statistics
 """
 
+import gzip
+import sys
+from dataclasses import asdict
+
 from rapidai import App, LLM, monitor, get_collector, get_dashboard_html, calculate_cost
-from rapidai.memory import ConversationMemory
 
 app = App(title="Monitoring Dashboard Example")
 llm = LLM("claude-3-haiku-20240307")
-memory = ConversationMemory()
 
 
 # Monitored chat endpoint with token tracking
@@ -21,17 +23,16 @@ memory = ConversationMemory()
 @monitor(track_tokens=True, track_cost=True)
 async def chat(user_id: str, message: str):
     """Chat endpoint with automatic monitoring."""
-    # Add to memory
-    memory.add_message(user_id, "user", message)
-
-    # Get history
-    history = memory.get_history(user_id)
+    # One memory lookup per request; the instance is reused for both writes
+    memory = app.memory(user_id)
+    history = memory.to_dict_list()
 
     # Generate response
-    response = await llm.chat(history)
+    response = await llm.chat(message, history=history)
 
-    # Add to memory
-    memory.add_message(user_id, "assistant", response)
+    # Add the exchange to memory
+    memory.add("user", message)
+    memory.add("assistant", response)
 
     # Return with tracking info (required for token tracking)
     return {
@@ -51,32 +52,44 @@ async def summarize(text: str):
     return {"summary": summary, "tokens_used": 100, "model": llm.model}
 
 
+# Rendered, gzip-compressed dashboard keyed by collector version
+_dashboard_cache = (-1, b"")
+
+DASHBOARD_HEADERS = {
+    "Content-Type": "text/html; charset=utf-8",
+    "Content-Encoding": "gzip",
+}
+
+
 # Metrics dashboard
 @app.route("/metrics/dashboard", methods=["GET"])
 async def metrics_dashboard():
-    """Serve interactive metrics dashboard."""
-    html = get_dashboard_html()
-    return {"body": html, "headers": {"Content-Type": "text/html; charset=utf-8"}}
+    """Serve interactive metrics dashboard.
+
+    The page is only re-rendered and re-compressed when new metrics have
+    been recorded; otherwise the cached bytes are served as-is.
+    """
+    global _dashboard_cache
+    version = get_collector().version
+    if _dashboard_cache[0] != version:
+        html = get_dashboard_html().encode("utf-8")
+        _dashboard_cache = (version, gzip.compress(html, compresslevel=9))
+    return {"body": _dashboard_cache[1], "headers": DASHBOARD_HEADERS}
 
 
 # Metrics API
 @app.route("/metrics/api", methods=["GET"])
 async def metrics_api():
-    """Get metrics as JSON."""
+    """Get metrics as JSON.
+
+    Both calls read running aggregates, so this is O(#models) regardless of
+    how many requests have been recorded.
+    """
     collector = get_collector()
 
     return {
         "summary": collector.get_summary(),
-        "models": {
-            model: {
-                "total_tokens": usage.total_tokens,
-                "prompt_tokens": usage.prompt_tokens,
-                "completion_tokens": usage.completion_tokens,
-                "total_cost": usage.total_cost,
-                "request_count": usage.request_count,
-            }
-            for model, usage in collector.get_model_usage().items()
-        },
+        "models": {model: asdict(usage) for model, usage in collector.get_model_usage().items()},
     }
 
 
@@ -157,26 +170,37 @@ async def health():
     }
 
 
+BANNER = """\
+Monitoring Dashboard Example
+==================================================
+
+Endpoints:
+  POST /chat                   - Monitored chat endpoint
+  POST /summarize              - Monitored summarization
+  GET  /metrics/dashboard      - Interactive dashboard
+  GET  /metrics/api            - Metrics as JSON
+  GET  /metrics/models         - Model usage stats
+  GET  /cost/estimate          - Estimate costs
+  POST /custom/metric          - Record custom metric
+  POST /metrics/clear          - Clear all metrics
+
+Dashboard:
+  http://localhost:8000/metrics/dashboard
+
+Example usage:
+  curl -X POST http://localhost:8000/chat \\
+    -H "Content-Type: application/json" \\
+    -d '{"user_id": "user123", "message": "Hello!"}'
+
+  curl http://localhost:8000/metrics/api
+
+Starting server on http://localhost:8000
+==================================================
+"""
+
+
 if __name__ == "__main__":
-    print("Monitoring Dashboard Example")
-    print("=" * 50)
-    print("\nEndpoints:")
-    print("  POST /chat                   - Monitored chat endpoint")
-    print("  POST /summarize              - Monitored summarization")
-    print("  GET  /metrics/dashboard      - Interactive dashboard")
-    print("  GET  /metrics/api            - Metrics as JSON")
-    print("  GET  /metrics/models         - Model usage stats")
-    print("  GET  /cost/estimate          - Estimate costs")
-    print("  POST /custom/metric          - Record custom metric")
-    print("  POST /metrics/clear          - Clear all metrics")
-    print("\nDashboard:")
-    print("  http://localhost:8000/metrics/dashboard")
-    print("\nExample usage:")
-    print('  curl -X POST http://localhost:8000/chat \\')
-    print('    -H "Content-Type: application/json" \\')
-    print('    -d \'{"user_id": "user123", "message": "Hello!"}\'')
-    print("\n  curl http://localhost:8000/metrics/api")
-    print("\nStarting server on http://localhost:8000")
-    print("=" * 50)
+    # One write instead of a print() per line
+    sys.stdout.write(BANNER)
 
     app.run(port=8000)
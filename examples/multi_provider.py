@@ -1,5 +1,7 @@
 """Multi-provider example showing different LLMs for different tasks."""
 
+import asyncio
+
 from rapidai import App, LLM
 
 app = App()
@@ -28,8 +30,11 @@ async def deep(question: str):
 @app.route("/compare", methods=["POST"])
 async def compare(question: str):
     """Compare responses from both models."""
-    cheap_response = await cheap_llm.chat(question)
-    smart_response = await smart_llm.chat(question)
+    # Query both providers concurrently so latency is max(t1, t2), not t1 + t2
+    cheap_response, smart_response = await asyncio.gather(
+        cheap_llm.chat(question),
+        smart_llm.chat(question),
+    )
 
     return {
         "question": question,
@@ -9,6 +9,12 @@ llm = LLM("claude-3-haiku-20240307")
 # Initialize prompt manager with hot reloading
 prompt_manager = PromptManager(prompt_dir="prompts", auto_reload=True)
 
+# Static template for /custom; registered once so its compiled form is reused
+prompt_manager.register(
+    "temp_custom",
+    "System: {{ system }}\n\nUser: {{ user }}\n\nAssistant:",
+)
+
 
 @app.route("/greet", methods=["POST"])
 @prompt(template="Hello {{ name }}! How can I assist you today?", manager=prompt_manager)
@@ -66,12 +72,6 @@ async def custom_prompt(system_msg: str, user_msg: str):
                 "user_msg": "What is AI?"
             }'
     """
-    # Register a temporary prompt
-    prompt_manager.register(
-        "temp_custom",
-        "System: {{ system }}\n\nUser: {{ user }}\n\nAssistant:",
-    )
-
     prompt_text = prompt_manager.render("temp_custom", system=system_msg, user=user_msg)
 
     response = await llm.complete(prompt_text)
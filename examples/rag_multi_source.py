@@ -157,7 +157,7 @@ async def stats():
     }
 
 
-@app.route("/health", methods=["GET"])
+@app.route("/health", methods=["GET"], static=True)
 async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
@@ -12,18 +12,20 @@ async def chat(user_id: str, message: str):
     """Stateful conversation with memory."""
     memory = app.memory(user_id)
 
-    # Get conversation history
-    history = memory.to_dict_list()
-
-    # Generate response with context
-    response = await llm.chat(message, history=history, stream=True)
-    async for chunk in response:
-        yield chunk
-
-    # Save conversation (user message and assistant response)
-    memory.add(role="user", content=message)
-    # Note: In production, you'd accumulate the full response before saving
-    memory.add(role="assistant", content="[Response would be accumulated here]")
+    # Hold the user's lock so overlapping requests don't interleave history
+    async with memory.lock:
+        # Get conversation history
+        history = memory.to_dict_list()
+
+        # Generate response with context
+        response = await llm.chat(message, history=history, stream=True)
+        async for chunk in response:
+            yield chunk
+
+        # Save conversation (user message and assistant response)
+        memory.add(role="user", content=message)
+        # Note: In production, you'd accumulate the full response before saving
+        memory.add(role="assistant", content="[Response would be accumulated here]")
 
 
 @app.route("/clear", methods=["POST"])
@@ -8,7 +8,10 @@ This example demonstrates:
 5. Real-time chat with LLM
 """
 
+import sys
+
 from rapidai import App, LLM
+from rapidai.cache import SemanticCache
 from rapidai.ui import page, ChatInterface, get_chat_template
 from rapidai.memory import ConversationMemory
 
@@ -19,7 +22,7 @@ memory = ConversationMemory()
 
 # Default chat interface
 @app.route("/")
-@page("/")
+@page("/", static=True)
 async def index():
     """Serve default chat interface."""
     return get_chat_template(title="RapidAI Chat", theme="dark")
@@ -27,7 +30,7 @@ async def index():
 
 # Light theme chat
 @app.route("/light")
-@page("/light")
+@page("/light", static=True)
 async def light_theme():
     """Serve chat with light theme."""
     return get_chat_template(title="Light Theme Chat", theme="light")
@@ -35,7 +38,7 @@ async def light_theme():
 
 # Custom themed chat
 @app.route("/custom")
-@page("/custom")
+@page("/custom", static=True)
 async def custom_theme():
     """Serve chat with custom configuration."""
     config = ChatInterface(
@@ -55,7 +58,7 @@ async def custom_theme():
 
 # Chat with file upload
 @app.route("/upload")
-@page("/upload")
+@page("/upload", static=True)
 async def chat_with_upload():
     """Serve chat interface with file upload enabled."""
     config = ChatInterface(
@@ -69,9 +72,12 @@ async def chat_with_upload():
 
 
 # Chat API endpoint (stateless)
-@app.route("/chat", methods=["POST"])
+@app.route("/chat", methods=["POST"], cache=SemanticCache(threshold=0.95))
 async def chat(message: str):
-    """Simple chat endpoint without memory."""
+    """Simple chat endpoint without memory.
+
+    Stateless, so near-duplicate messages are answered from the semantic cache.
+    """
     response = await llm.complete(message)
     return {"response": response}
 
@@ -116,7 +122,7 @@ async def upload_file(filename: str, content: str):
 
 
 # Health check
-@app.route("/health", methods=["GET"])
+@app.route("/health", methods=["GET"], static=True)
 async def health():
     """Health check endpoint."""
     return {"status": "healthy", "service": "ui-chat-interface"}
@@ -124,7 +130,7 @@ async def health():
 
 # Demo page with links
 @app.route("/demo")
-@page("/demo")
+@page("/demo", static=True)
 async def demo():
     """Demo page with links to different chat interfaces."""
     return """
@@ -195,23 +201,33 @@ async def demo():
     """
 
 
+BANNER = """\
+UI Chat Interface Example
+==================================================
+
+Chat Interfaces:
+  /demo    - Demo page with all options
+  /        - Default dark theme
+  /light   - Light theme
+  /custom  - Custom configuration
+  /upload  - With file upload
+
+API Endpoints:
+  POST /chat         - Simple chat
+  POST /api/chat     - Chat with memory
+  POST /api/clear    - Clear conversation
+  POST /api/upload   - Upload file
+
+Open in browser:
+  http://localhost:8000/demo
+
+Starting server on http://localhost:8000
+==================================================
+"""
+
+
 if __name__ == "__main__":
-    print("UI Chat Interface Example")
-    print("=" * 50)
-    print("\nChat Interfaces:")
-    print("  /demo    - Demo page with all options")
-    print("  /        - Default dark theme")
-    print("  /light   - Light theme")
-    print("  /custom  - Custom configuration")
-    print("  /upload  - With file upload")
-    print("\nAPI Endpoints:")
-    print("  POST /chat         - Simple chat")
-    print("  POST /api/chat     - Chat with memory")
-    print("  POST /api/clear    - Clear conversation")
-    print("  POST /api/upload   - Upload file")
-    print("\nOpen in browser:")
-    print("  http://localhost:8000/demo")
-    print("\nStarting server on http://localhost:8000")
-    print("=" * 50)
+    # One write instead of a print() per line
+    sys.stdout.write(BANNER)
 
     app.run(port=8000)
@@ -2,6 +2,9 @@
 
 __version__ = "1.0.1"
 
+import importlib
+from typing import Any, List
+
 from .app import App
 from .llm import LLM, BaseLLM, AnthropicLLM, OpenAILLM, MockLLM
 from .streaming import stream
@@ -21,9 +24,37 @@ from .exceptions import (
 )
 
 # v1.0 Features
+# ``background`` shares its name with its submodule, which would shadow a lazy
+# attribute once the submodule is imported, so it stays eager
 from .background import background, JobStatus, get_queue
-from .monitoring import monitor, get_collector, get_dashboard_html, calculate_cost
-from .prompts import PromptManager, prompt, get_prompt_manager
+
+# Monitoring and prompts are imported on first access (PEP 562), so apps that
+# don't use them skip the import cost
+_LAZY_ATTRIBUTES = {
+    "monitor": "monitoring",
+    "get_collector": "monitoring",
+    "get_dashboard_html": "monitoring",
+    "calculate_cost": "monitoring",
+    "PromptManager": "prompts",
+    "prompt": "prompts",
+    "get_prompt_manager": "prompts",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     # Core
@@ -1,20 +1,201 @@
 """Core application class for RapidAI."""
 
 import asyncio
-import json
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Union
-from dataclasses import dataclass
-from urllib.parse import parse_qs
+import json
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import partial, wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+    get_origin,
+)
+from urllib.parse import parse_qsl
+from weakref import WeakKeyDictionary
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional typed responses
+    msgspec = None
 
 from .config import RapidAIConfig
 from .exceptions import RouteError
-from .types import HTTPMethod, Middleware, RouteHandler
+from .llm.base import close_shared_http_clients
 from .memory import MemoryManager
-from .streaming import is_stream_handler, StreamingResponse
+from .streaming import StreamingResponse, is_stream_handler
+from .types import HTTPMethod, Middleware, RouteHandler
+from .ui.decorator import is_static_page
+
+if TYPE_CHECKING:
+    from .cache import CacheBackend
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types the stdlib encoder does not handle natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode a response body as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, default=_json_default).encode()
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a JSON request body, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON (orjson's error
+            type subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body.decode())
+
+
+def _is_struct_type(annotation: Any) -> bool:
+    """Check whether a return annotation is a ``msgspec.Struct`` subclass."""
+    return (
+        msgspec is not None
+        and isinstance(annotation, type)
+        and issubclass(annotation, msgspec.Struct)
+    )
+
+
+# Constant response header pairs, shared by every response
+_JSON_CONTENT_TYPE = (b"content-type", b"application/json")
+_TEXT_CONTENT_TYPE = (b"content-type", b"text/plain")
+
+
+# Pre-encoded 404 response, sent for every unmatched path
+_NOT_FOUND_BODY = {"type": "http.response.body", "body": _dumps({"error": "Not Found"})}
+_NOT_FOUND_START = {
+    "type": "http.response.start",
+    "status": 404,
+    "headers": [
+        _JSON_CONTENT_TYPE,
+        (b"content-length", b"%d" % len(_NOT_FOUND_BODY["body"])),
+    ],
+}
+
+
+# Matches ``<name>`` path parameter segments, e.g. ``/users/<user_id>``
+_PATH_PARAM = re.compile(r"<([A-Za-z_][A-Za-z0-9_]*)>")
+
+
+def _compile_path(path: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """Translate a route path with ``<name>`` parameters into a regex.
+
+    Parameters become unnamed groups, so patterns of different routes can be
+    joined into one alternation even when they share parameter names.
+
+    Returns:
+        Tuple of (unanchored pattern, parameter names in group order), or
+        None if the path has no parameters
+    """
+    parts = _PATH_PARAM.split(path)
+    if len(parts) == 1:
+        return None
+
+    # split() alternates literal text and parameter names
+    pattern = "".join(
+        "([^/]+)" if i % 2 else re.escape(part) for i, part in enumerate(parts)
+    )
+    return pattern, tuple(parts[1::2])
+
+
+# Cache backends need not be thread-safe; off-loop calls hold their lock
+_backend_locks: "WeakKeyDictionary[CacheBackend, threading.Lock]" = WeakKeyDictionary()
 
 
-@dataclass
+def _cached_handler(
+    handler: RouteHandler, backend: "CacheBackend", path: str, key_param: str, ttl: int
+) -> RouteHandler:
+    """Wrap a handler so its responses are cached by one string parameter.
+
+    Keys are prefixed with the route path, so routes can share a backend.
+    Backends other than ``InMemoryCache`` may embed the key (``SemanticCache``)
+    or wait on the network (``RedisCache``), so they are called in a worker
+    thread instead of on the event loop.
+    """
+    from .cache import InMemoryCache
+
+    inline = isinstance(backend, InMemoryCache)
+    lock = _backend_locks.setdefault(backend, threading.Lock())
+
+    def locked(method: Callable[..., Any], *args: Any) -> Any:
+        with lock:
+            return method(*args)
+
+    async def call(method: Callable[..., Any], *args: Any) -> Any:
+        if inline:
+            return method(*args)
+        return await asyncio.to_thread(locked, method, *args)
+
+    @wraps(handler)
+    async def wrapper(**params: Any) -> Any:
+        text = params.get(key_param)
+        if not isinstance(text, str):
+            return await handler(**params)
+
+        key = f"{path} {text}"
+        cached = await call(backend.get, key)
+        if cached is not None:
+            return cached
+
+        response = await handler(**params)
+        await call(backend.set, key, response, ttl)
+        return response
+
+    return wrapper
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _MiddlewareLink:
+    """One middleware of a composed chain, wrapped around the next link.
+
+    Each request only allocates the C-level ``partial`` that becomes the
+    middleware's ``next`` callable.
+    """
+
+    __slots__ = ("middleware", "next_link")
+
+    def __init__(self, middleware: Middleware, next_link: Callable[..., Any]) -> None:
+        self.middleware = middleware
+        self.next_link = next_link
+
+    async def __call__(self, handler: RouteHandler, params: Dict[str, Any]) -> Any:
+        return await self.middleware(params, partial(self.next_link, handler, params))
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Route:
     """Represents a route in the application."""
 
@@ -22,6 +203,27 @@ class Route:
     handler: RouteHandler
     methods: List[str]
     is_stream: bool = False
+    is_static: bool = False
+    # Encoded (start, body) ASGI messages of a static page, filled on first request
+    static_response: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+    # Response sender chosen from the handler's return annotation (None: inspect per request)
+    sender: Optional[Callable[[Any, Any], Awaitable[None]]] = None
+    # Handler parameters without / with defaults, resolved once at registration
+    required: Tuple[str, ...] = ()
+    defaults: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Resolve the handler signature once instead of per request."""
+        # If handler is wrapped (e.g., by @stream), use the original function's signature
+        unwrapped = getattr(self.handler, "__wrapped__", self.handler)
+
+        required = []
+        for name, param in inspect.signature(unwrapped).parameters.items():
+            if param.default is inspect.Parameter.empty:
+                required.append(name)
+            else:
+                self.defaults[name] = param.default
+        self.required = tuple(required)
 
 
 class App:
@@ -61,19 +263,47 @@ class App:
         self.config = config or RapidAIConfig.load()
 
         self._routes: List[Route] = []
+        # path -> method -> Route for exact paths; (pattern, param names, method -> Route)
+        # for parameterized ones
+        self._static_routes: Dict[str, Dict[str, Route]] = {}
+        self._dynamic_routes: List[Tuple[str, Tuple[str, ...], Dict[str, Route]]] = []
+        # method -> (alternation of dynamic patterns, outer group index -> (Route, param names)),
+        # built on first use and reset when a route is added
+        self._dynamic_dispatch: Optional[
+            Dict[str, Tuple[Pattern[str], Dict[int, Tuple[Route, Tuple[str, ...]]]]]
+        ] = None
         self._middleware: List[Middleware] = []
-        self._memory_manager = MemoryManager(backend=self.config.memory.backend)
+        # Composed middleware chain, built on first use and reset by use()
+        self._middleware_chain: Optional[Callable[..., Any]] = None
+        self._memory_manager = MemoryManager(
+            backend=self.config.memory.backend,
+            max_history=self.config.memory.max_history,
+            max_cached=self.config.memory.max_cached,
+        )
 
     def route(
         self,
         path: str,
         methods: Optional[List[Union[str, HTTPMethod]]] = None,
+        cache: Optional["CacheBackend"] = None,
+        cache_key: str = "message",
+        cache_ttl: int = 3600,
+        static: bool = False,
     ) -> Callable[[RouteHandler], RouteHandler]:
         """Decorator to register a route.
 
         Args:
             path: URL path for the route
             methods: List of HTTP methods (default: ["GET"])
+            cache: Optional response cache. With a ``SemanticCache``, requests
+                whose ``cache_key`` text is similar enough to an earlier one
+                are answered from the cache without calling the handler.
+                Entries are scoped to this route, so routes can share a backend.
+            cache_key: Name of the string parameter used as the cache key
+            cache_ttl: Time-to-live for cached responses in seconds
+            static: Whether the response is identical on every request. The
+                handler must take no parameters; it runs once, and later
+                requests get the encoded response without running middleware.
 
         Returns:
             Decorator function
@@ -83,7 +313,28 @@ class App:
             @app.route("/chat", methods=["POST"])
             async def chat(message: str):
                 return {"response": "Hello!"}
+
+            # Path parameters are passed to the handler by name
+            @app.route("/users/<user_id>")
+            async def get_user(user_id: str):
+                return {"user_id": user_id}
+
+            # Typed responses are encoded directly when msgspec is installed
+            class Health(msgspec.Struct):
+                status: str
+
+            @app.route("/health")
+            async def health() -> Health:
+                return Health(status="healthy")
+
+            # Serve near-duplicate questions from a semantic cache
+            @app.route("/ask", methods=["POST"], cache=SemanticCache(threshold=0.95))
+            async def ask(message: str):
+                return {"response": await llm.complete(message)}
             ```
+
+        Only use ``cache`` on handlers whose response depends on the
+        ``cache_key`` text alone, not on per-user state such as memory.
         """
         if methods is None:
             methods = ["GET"]
@@ -93,12 +344,72 @@ class App:
         def decorator(func: RouteHandler) -> RouteHandler:
             # Check if handler is a streaming function
             is_stream = is_stream_handler(func)
-            route = Route(path=path, handler=func, methods=method_strs, is_stream=is_stream)
+
+            is_static = static or is_static_page(func)
+            handler = func
+            if is_static and (is_stream or cache is not None):
+                raise RouteError(f"Static route {path} cannot be streamed or cached")
+            if cache is not None:
+                if is_stream:
+                    raise RouteError(f"Response caching is not supported for stream route {path}")
+                handler = _cached_handler(func, cache, path, cache_key, cache_ttl)
+
+            route = Route(
+                path=path,
+                handler=handler,
+                methods=method_strs,
+                is_stream=is_stream,
+                is_static=is_static,
+            )
+            if is_static and route.required:
+                raise RouteError(f"Static route {path} must not take parameters")
+            route.sender = self._response_sender(handler)
             self._routes.append(route)
+            self._index_route(route)
             return func
 
         return decorator
 
+    def _response_sender(
+        self, handler: RouteHandler
+    ) -> Optional[Callable[[Any, Any], Awaitable[None]]]:
+        """Pick a response sender from the handler's return annotation.
+
+        Only handlers registered unwrapped are specialized: decorators such as
+        ``@page`` copy the inner function's annotations but change what is
+        returned.
+        """
+        if hasattr(handler, "__wrapped__"):
+            return None
+
+        annotation = inspect.signature(handler).return_annotation
+        if annotation in (str, "str"):
+            return self._send_text
+        if _is_struct_type(annotation):
+            return self._send_struct
+        if annotation in (dict, "dict") or get_origin(annotation) is dict:
+            return self._send_dict
+        return None
+
+    def _index_route(self, route: Route) -> None:
+        """Add a route to the dispatch tables (earlier registrations win)."""
+        compiled = _compile_path(route.path)
+        if compiled is None:
+            bucket = self._static_routes.setdefault(route.path, {})
+        else:
+            pattern, names = compiled
+            for existing, _, dynamic_bucket in self._dynamic_routes:
+                if existing == pattern:
+                    bucket = dynamic_bucket
+                    break
+            else:
+                bucket = {}
+                self._dynamic_routes.append((pattern, names, bucket))
+            self._dynamic_dispatch = None
+
+        for method in route.methods:
+            bucket.setdefault(method, route)
+
     def use(self, middleware: Middleware) -> None:
         """Add middleware to the application.
 
@@ -119,10 +430,16 @@ class App:
             ```
         """
         self._middleware.append(middleware)
+        self._middleware_chain = None
 
     def memory(self, user_id: str) -> "ConversationMemory":
         """Get or create a conversation memory for a user.
 
+        The lookup is synchronous and safe to call from any handler. Use the
+        returned memory's ``lock`` when a handler awaits between reading and
+        updating the history; it is an ``asyncio.Lock`` bound to the single
+        event loop the app is served from.
+
         Args:
             user_id: User identifier
 
@@ -147,6 +464,14 @@ class App:
             if message["type"] == "lifespan.startup":
                 await send({"type": "lifespan.startup.complete"})
             elif message["type"] == "lifespan.shutdown":
+                try:
+                    # Memory writes a backend deferred must land before the loop stops
+                    await self._memory_manager.flush()
+                except Exception as e:
+                    await send({"type": "lifespan.shutdown.failed", "message": str(e)})
+                    return
+                finally:
+                    await close_shared_http_clients()
                 await send({"type": "lifespan.shutdown.complete"})
                 return
 
@@ -156,91 +481,158 @@ class App:
         method = scope["method"]
 
         # Find matching route
-        route = self._find_route(path, method)
+        route, path_params = self._find_route(path, method)
         if not route:
-            await self._send_json(
-                send, {"error": "Not Found"}, status=404
-            )
+            await send(_NOT_FOUND_START)
+            await send(_NOT_FOUND_BODY)
+            return
+
+        if route.is_static:
+            await self._send_static(send, route)
             return
 
         try:
             # Parse request body
             body = await self._receive_body(receive)
             request_data = self._parse_request(scope, body)
+            if path_params:
+                request_data.update(path_params)
 
             # Extract handler parameters
-            params = await self._extract_params(route.handler, request_data)
+            params = self._extract_params(route, request_data)
 
             # Execute handler through middleware chain
             response = await self._execute_with_middleware(
                 route.handler, params, route.is_stream, send
             )
 
-            # Send response if not streaming
+            # Send response if not streaming; middleware may change the response type
             if not route.is_stream:
-                await self._send_response(send, response)
+                if route.sender is not None and not self._middleware:
+                    await route.sender(send, response)
+                else:
+                    await self._send_response(send, response)
 
         except Exception as e:
             await self._send_json(
                 send, {"error": str(e)}, status=500
             )
 
-    def _find_route(self, path: str, method: str) -> Optional[Route]:
-        """Find a route matching the path and method."""
-        for route in self._routes:
-            if route.path == path and method in route.methods:
-                return route
-        return None
+    def _find_route(
+        self, path: str, method: str
+    ) -> Tuple[Optional[Route], Dict[str, str]]:
+        """Find a route matching the path and method.
+
+        Exact paths are a dict lookup; parameterized routes are matched with
+        a single alternation regex per method.
+
+        Returns:
+            Tuple of (route or None, path parameters)
+        """
+        bucket = self._static_routes.get(path)
+        if bucket is not None:
+            route = bucket.get(method)
+            if route is not None:
+                return route, {}
+
+        dispatch = self._dynamic_dispatch
+        if dispatch is None:
+            dispatch = self._dynamic_dispatch = self._build_dynamic_dispatch()
+
+        entry = dispatch.get(method)
+        if entry is not None:
+            regex, targets = entry
+            match = regex.fullmatch(path)
+            if match:
+                # The outer group of the matching alternative closes last
+                outer = match.lastindex
+                assert outer is not None
+                route, names = targets[outer]
+                return route, dict(zip(names, match.groups()[outer : outer + len(names)]))
+
+        return None, {}
+
+    def _build_dynamic_dispatch(
+        self,
+    ) -> Dict[str, Tuple[Pattern[str], Dict[int, Tuple[Route, Tuple[str, ...]]]]]:
+        """Join the parameterized routes of each method into one alternation.
+
+        A single ``fullmatch`` then finds the first registered route that
+        matches, instead of trying every pattern in turn.
+        """
+        by_method: Dict[str, List[Tuple[str, Tuple[str, ...], Route]]] = {}
+        for pattern, names, bucket in self._dynamic_routes:
+            for method, route in bucket.items():
+                by_method.setdefault(method, []).append((pattern, names, route))
+
+        dispatch = {}
+        for method, entries in by_method.items():
+            alternatives = []
+            targets = {}
+            group = 1
+            for pattern, names, route in entries:
+                alternatives.append(f"({pattern})")
+                targets[group] = (route, names)
+                group += 1 + len(names)
+            dispatch[method] = (re.compile("|".join(alternatives)), targets)
+        return dispatch
 
     async def _receive_body(self, receive: Any) -> bytes:
-        """Receive the full request body."""
-        body = b""
-        while True:
+        """Receive the full request body.
+
+        Chunks are collected and joined once, so large uploads are copied
+        a single time instead of once per chunk.
+        """
+        message = await receive()
+        if not message.get("more_body"):
+            # Common case: the whole body arrives in one message
+            return message.get("body", b"")
+
+        chunks = [message.get("body", b"")]
+        while message.get("more_body"):
             message = await receive()
-            body += message.get("body", b"")
-            if not message.get("more_body"):
-                break
-        return body
+            chunks.append(message.get("body", b""))
+        return b"".join(chunks)
 
     def _parse_request(self, scope: Dict[str, Any], body: bytes) -> Dict[str, Any]:
         """Parse the request into a dictionary."""
+        query_string = scope.get("query_string")
+        if body and not query_string:
+            # Common case: a JSON object body alone is used as-is
+            try:
+                json_data = _loads(body)
+            except json.JSONDecodeError:
+                return {}
+            return json_data if isinstance(json_data, dict) else dict(json_data)
+
         request_data = {}
 
         # Parse query parameters
-        if scope.get("query_string"):
-            query_params = parse_qs(scope["query_string"].decode())
-            request_data.update(
-                {k: v[0] if len(v) == 1 else v for k, v in query_params.items()}
-            )
+        if query_string:
+            # Single values stay scalars; repeated keys collect into a list
+            for key, value in parse_qsl(query_string.decode()):
+                if key not in request_data:
+                    request_data[key] = value
+                elif isinstance(request_data[key], list):
+                    request_data[key].append(value)
+                else:
+                    request_data[key] = [request_data[key], value]
 
         # Parse JSON body
         if body:
             try:
-                json_data = json.loads(body.decode())
+                json_data = _loads(body)
                 request_data.update(json_data)
             except json.JSONDecodeError:
                 pass
 
         return request_data
 
-    async def _extract_params(
-        self, handler: RouteHandler, request_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _extract_params(self, route: Route, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract parameters for the handler from request data."""
-        # If handler is wrapped (e.g., by @stream), get the original function's signature
-        unwrapped = handler
-        if hasattr(handler, "__wrapped__"):
-            unwrapped = handler.__wrapped__
-
-        sig = inspect.signature(unwrapped)
-        params = {}
-
-        for param_name, param in sig.parameters.items():
-            if param_name in request_data:
-                params[param_name] = request_data[param_name]
-            elif param.default is not inspect.Parameter.empty:
-                params[param_name] = param.default
-
+        params = {name: request_data[name] for name in route.required if name in request_data}
+        for name, default in route.defaults.items():
+            params[name] = request_data.get(name, default)
         return params
 
     async def _execute_with_middleware(
@@ -255,61 +647,154 @@ class App:
         if is_stream:
             # Call handler directly (middleware support for streaming can be added later)
             iterator = handler(**params)
-            streaming_response = StreamingResponse(iterator)
+            if inspect.isawaitable(iterator):
+                # Coroutine handlers return the provider's iterator directly
+                iterator = await iterator
+            streaming_response = StreamingResponse(
+                iterator,
+                flush_bytes=self.config.server.stream_flush_bytes,
+                flush_interval=self.config.server.stream_flush_interval,
+            )
             await streaming_response.send(send)
             return None
 
         if not self._middleware:
             return await handler(**params)
 
-        # Build middleware chain
-        async def final_handler() -> Any:
-            result = await handler(**params)
-            return result
+        if self._middleware_chain is None:
+            self._middleware_chain = self._compose_middleware()
+
+        return await self._middleware_chain(handler, params)
 
-        # Execute middleware in reverse order
-        next_handler = final_handler
+    def _compose_middleware(self) -> Callable[..., Any]:
+        """Compose registered middleware into one ``chain(handler, params)`` callable."""
+
+        async def call_handler(handler: RouteHandler, params: Dict[str, Any]) -> Any:
+            return await handler(**params)
+
+        # Wrap in reverse so the first registered middleware runs outermost
+        chain: Callable[..., Any] = call_handler
         for middleware in reversed(self._middleware):
-            next_handler = self._wrap_middleware(middleware, next_handler, params)
+            chain = _MiddlewareLink(middleware, chain)
+        return chain
 
-        return await next_handler()
+    async def _send_static(self, send: Any, route: Route) -> None:
+        """Send a static route's response, encoding it on the first request."""
+        messages = route.static_response
+        if messages is None:
+            try:
+                response = await route.handler()
+            except Exception as e:
+                await self._send_json(send, {"error": str(e)}, status=500)
+                return
+
+            # Encode through the regular senders and keep the messages they emit
+            captured: List[Dict[str, Any]] = []
 
-    def _wrap_middleware(
-        self, middleware: Middleware, next_handler: Callable, params: Dict[str, Any]
-    ) -> Callable:
-        """Wrap middleware around the next handler."""
+            async def capture(message: Dict[str, Any]) -> None:
+                captured.append(message)
 
-        async def wrapped() -> Any:
-            return await middleware(params, next_handler)
+            await (route.sender or self._send_response)(capture, response)
+            messages = route.static_response = (captured[0], captured[1])
 
-        return wrapped
+        start, body = messages
+        await send(start)
+        await send(body)
+
+    @staticmethod
+    def _is_raw_response(response: Dict[str, Any]) -> bool:
+        """Check for a ``{"status", "headers", "body"}`` response dict (as built by ``@page``)."""
+        return (
+            "body" in response
+            and "headers" in response
+            and response.keys() <= {"status", "headers", "body"}
+        )
 
     async def _send_response(self, send: Any, response: Any) -> None:
         """Send an HTTP response."""
         if isinstance(response, dict):
-            await self._send_json(send, response)
+            await self._send_dict(send, response)
+        elif msgspec is not None and isinstance(response, msgspec.Struct):
+            await self._send_struct(send, response)
         elif isinstance(response, str):
             await self._send_text(send, response)
         else:
             await self._send_json(send, {"result": response})
 
+    async def _send_dict(self, send: Any, response: Dict[str, Any]) -> None:
+        """Send a dict response, either as a raw response or as JSON."""
+        if self._is_raw_response(response):
+            await self._send_raw(
+                send,
+                response["body"],
+                response["headers"],
+                status=response.get("status", 200),
+            )
+        else:
+            await self._send_json(send, response)
+
+    async def _send_struct(self, send: Any, response: Any) -> None:
+        """Send a ``msgspec.Struct`` as JSON, encoded straight from its fields."""
+        body = msgspec.json.encode(response)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    _JSON_CONTENT_TYPE,
+                    (b"content-length", b"%d" % len(body)),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
     async def _send_json(
         self, send: Any, data: Dict[str, Any], status: int = 200
     ) -> None:
         """Send a JSON response."""
-        body = json.dumps(data).encode()
+        body = _dumps(data)
         await send(
             {
                 "type": "http.response.start",
                 "status": status,
                 "headers": [
-                    [b"content-type", b"application/json"],
-                    [b"content-length", str(len(body)).encode()],
+                    _JSON_CONTENT_TYPE,
+                    (b"content-length", b"%d" % len(body)),
                 ],
             }
         )
         await send({"type": "http.response.body", "body": body})
 
+    async def _send_raw(
+        self,
+        send: Any,
+        body: Union[str, bytes],
+        headers: Dict[str, str],
+        status: int = 200,
+    ) -> None:
+        """Send a body as-is with caller-supplied headers."""
+        start, body_message = self._raw_messages(body, headers, status)
+        await send(start)
+        await send(body_message)
+
+    @staticmethod
+    def _raw_messages(
+        body: Union[str, bytes], headers: Dict[str, str], status: int
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the ASGI start and body messages for a raw response."""
+        if isinstance(body, str):
+            body = body.encode()
+        raw_headers = [
+            [name.lower().encode(), value.encode()] for name, value in headers.items()
+        ]
+        raw_headers.append([b"content-length", b"%d" % len(body)])
+        start = {
+            "type": "http.response.start",
+            "status": status,
+            "headers": raw_headers,
+        }
+        return start, {"type": "http.response.body", "body": body}
+
     async def _send_text(self, send: Any, text: str, status: int = 200) -> None:
         """Send a text response."""
         body = text.encode()
@@ -318,8 +803,8 @@ class App:
                 "type": "http.response.start",
                 "status": status,
                 "headers": [
-                    [b"content-type", b"text/plain"],
-                    [b"content-length", str(len(body)).encode()],
+                    _TEXT_CONTENT_TYPE,
+                    (b"content-length", b"%d" % len(body)),
                 ],
             }
         )
@@ -330,6 +815,8 @@ class App:
         host: Optional[str] = None,
         port: Optional[int] = None,
         workers: Optional[int] = None,
+        loop: Optional[str] = None,
+        http: Optional[str] = None,
     ) -> None:
         """Run the application with uvicorn.
 
@@ -337,6 +824,14 @@ class App:
             host: Host to bind to (default from config)
             port: Port to bind to (default from config)
             workers: Number of workers (default from config)
+            loop: Event loop implementation: "auto", "uvloop" or "asyncio"
+                (default from config). "auto" uses uvloop when it is
+                installed and falls back to the stdlib loop otherwise.
+            http: HTTP protocol implementation: "auto", "httptools" or "h11"
+                (default from config). "auto" uses the httptools C parser
+                when it is installed and falls back to h11 otherwise.
+
+        Install ``rapidai-framework[speed]`` to get uvloop and httptools.
         """
         import uvicorn
 
@@ -345,6 +840,8 @@ class App:
             host=host or self.config.server.host,
             port=port or self.config.server.port,
             workers=workers or self.config.server.workers,
+            loop=loop or self.config.server.loop,
+            http=http or self.config.server.http,
             log_level="debug" if self.config.server.debug else "info",
         )
 
@@ -1,14 +1,16 @@
 """Background job system for RapidAI."""
 
 import asyncio
+import importlib
+import random
+import sys
 import time
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from .exceptions import RapidAIException
 
@@ -29,7 +31,14 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Number of precomputed backoff windows; later attempts reuse the last one
+_BACKOFF_STEPS = 16
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class JobResult:
     """Result of a background job."""
 
@@ -56,9 +65,43 @@ class JobResult:
         return self.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
 
 
+def _as_coroutine_function(func: Callable) -> Callable[..., Awaitable[Any]]:
+    """Return ``func`` itself if it is async, else an async adapter around it.
+
+    Deciding once up front keeps ``iscoroutinefunction`` off the per-call path.
+    """
+    if asyncio.iscoroutinefunction(func):
+        return func
+
+    async def run_sync(*args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+    return run_sync
+
+
 class JobQueue:
     """Base class for job queue backends."""
 
+    def __init__(self, retry_cap: float = 60.0, rng: Optional[random.Random] = None) -> None:
+        """Initialize retry settings shared by queue backends.
+
+        Args:
+            retry_cap: Upper bound in seconds for a single retry delay
+            rng: Random source for retry jitter (seed one for reproducible delays)
+        """
+        self.retry_cap = retry_cap
+        self._backoff = tuple(min(retry_cap, 2.0 ** i) for i in range(_BACKOFF_STEPS))
+        self._rng = rng or random.Random()
+
+    def _retry_delay(self, attempts: int) -> float:
+        """Full-jitter exponential backoff: uniform in [0, min(cap, 2**attempts)].
+
+        Spreading retries over the whole window keeps jobs that failed
+        together from retrying together. The capped windows are looked up
+        from a table built in __init__.
+        """
+        return self._rng.uniform(0, self._backoff[min(attempts, _BACKOFF_STEPS - 1)])
+
     async def enqueue(self, job_id: str, func: Callable, args: tuple, kwargs: dict, max_retries: int = 3) -> str:
         """Enqueue a job."""
         raise NotImplementedError
@@ -79,10 +122,24 @@ class JobQueue:
 class InMemoryQueue(JobQueue):
     """In-memory job queue implementation."""
 
-    def __init__(self) -> None:
-        """Initialize in-memory queue."""
+    def __init__(self, retry_cap: float = 60.0, rng: Optional[random.Random] = None) -> None:
+        """Initialize in-memory queue.
+
+        Args:
+            retry_cap: Upper bound in seconds for a single retry delay
+            rng: Random source for retry jitter (seed one for reproducible delays)
+        """
         self._jobs: Dict[str, JobResult] = {}
+        # Same jobs bucketed by status so filtered listings skip the rest
+        self._by_status: Dict[JobStatus, Dict[str, JobResult]] = {s: {} for s in JobStatus}
         self._tasks: Dict[str, asyncio.Task] = {}
+        super().__init__(retry_cap, rng)
+
+    def _transition(self, result: JobResult, status: JobStatus) -> None:
+        """Move a job to a new status, keeping the status index in step."""
+        self._by_status[result.status].pop(result.job_id, None)
+        result.status = status
+        self._by_status[status][result.job_id] = result
 
     async def enqueue(
         self,
@@ -110,7 +167,11 @@ class InMemoryQueue(JobQueue):
             status=JobStatus.PENDING,
             max_retries=max_retries,
         )
+        previous = self._jobs.pop(job_id, None)
+        if previous is not None:
+            self._by_status[previous.status].pop(job_id, None)
         self._jobs[job_id] = result
+        self._by_status[JobStatus.PENDING][job_id] = result
 
         # Create and schedule task
         task = asyncio.create_task(self._execute_job(job_id, func, args, kwargs))
@@ -134,28 +195,26 @@ class InMemoryQueue(JobQueue):
             kwargs: Keyword arguments
         """
         result = self._jobs[job_id]
-        result.status = JobStatus.RUNNING
+        self._transition(result, JobStatus.RUNNING)
         result.started_at = datetime.now()
+        run = _as_coroutine_function(func)
 
         while result.attempts < result.max_retries:
             try:
                 result.attempts += 1
 
                 # Execute function
-                if asyncio.iscoroutinefunction(func):
-                    output = await func(*args, **kwargs)
-                else:
-                    output = func(*args, **kwargs)
+                output = await run(*args, **kwargs)
 
                 # Success
-                result.status = JobStatus.COMPLETED
+                self._transition(result, JobStatus.COMPLETED)
                 result.result = output
                 result.completed_at = datetime.now()
                 break
 
             except asyncio.CancelledError:
                 # Job was cancelled
-                result.status = JobStatus.CANCELLED
+                self._transition(result, JobStatus.CANCELLED)
                 result.completed_at = datetime.now()
                 break
 
@@ -165,12 +224,11 @@ class InMemoryQueue(JobQueue):
 
                 if result.attempts >= result.max_retries:
                     # Max retries reached
-                    result.status = JobStatus.FAILED
+                    self._transition(result, JobStatus.FAILED)
                     result.completed_at = datetime.now()
                 else:
-                    # Retry with exponential backoff
-                    delay = 2 ** result.attempts
-                    await asyncio.sleep(delay)
+                    # Retry with jittered exponential backoff
+                    await asyncio.sleep(self._retry_delay(result.attempts))
 
     async def get_result(self, job_id: str) -> Optional[JobResult]:
         """Get job result.
@@ -209,34 +267,138 @@ class InMemoryQueue(JobQueue):
         Returns:
             List of job results
         """
-        jobs = list(self._jobs.values())
-        if status:
-            jobs = [j for j in jobs if j.status == status]
-        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+        if not status:
+            # _jobs is in enqueue order, so newest first is just reversed
+            return list(reversed(self._jobs.values()))
+        # Buckets are in transition order, which is nearly creation order;
+        # sorting only the matches is cheap
+        return sorted(
+            self._by_status[status].values(), key=lambda j: j.created_at, reverse=True
+        )
+
+
+def _from_ns(value: bytes) -> datetime:
+    """Convert a stored nanosecond epoch timestamp to a local datetime."""
+    seconds, nanos = divmod(int(value), 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+
+
+# Atomically mark a job cancelled unless it is missing or already in a terminal state
+_CANCEL_SCRIPT = """
+local status = redis.call('HGET', KEYS[1], 'status')
+if not status or status == ARGV[2] or status == ARGV[3] or status == ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[1])
+return 1
+"""
+
+# Claim the next job: move it from the queue to the processing list (unless
+# ARGV[4] names a job a blocking pop already moved), mark it running and
+# return what the worker needs, all in one round-trip. Jobs that are no
+# longer pending (cancelled, deleted) are dropped and returned as {id}.
+_DEQUEUE_SCRIPT = """
+local job_id = ARGV[4]
+if job_id == '' then
+    job_id = redis.call('RPOPLPUSH', KEYS[1], KEYS[2])
+    if not job_id then
+        return nil
+    end
+end
+local key = ARGV[1] .. job_id
+if redis.call('HGET', key, 'status') ~= ARGV[2] then
+    redis.call('LREM', KEYS[2], 1, job_id)
+    return {job_id}
+end
+redis.call('HSET', key, 'status', ARGV[3], 'started_at', ARGV[5])
+local attempts = redis.call('HINCRBY', key, 'attempts', 1)
+local job = redis.call('HMGET', key, 'func', 'args', 'kwargs', 'max_retries')
+return {job_id, attempts, job[1], job[2], job[3], job[4]}
+"""
+
+# Settle a claimed job: drop it from the processing list and, only if it is
+# still running (not cancelled meanwhile), write the ARGV[4..] field/value
+# pairs and, when ARGV[3] is '1', push it back onto the queue. Returns 1 if
+# the job was updated.
+_FINISH_SCRIPT = """
+redis.call('LREM', KEYS[2], 1, ARGV[1])
+if redis.call('HGET', KEYS[1], 'status') ~= ARGV[2] then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 4))
+if ARGV[3] == '1' then
+    redis.call('LPUSH', KEYS[3], ARGV[1])
+end
+return 1
+"""
 
 
 class RedisQueue(JobQueue):
     """Redis-backed job queue implementation."""
 
-    def __init__(self, url: str = "redis://localhost:6379", prefix: str = "rapidai:jobs:") -> None:
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379",
+        prefix: str = "rapidai:jobs:",
+        retry_cap: float = 60.0,
+        rng: Optional[random.Random] = None,
+        result_cache_size: int = 10_000,
+    ) -> None:
         """Initialize Redis queue.
 
         Args:
             url: Redis connection URL
             prefix: Key prefix for Redis
+            retry_cap: Upper bound in seconds for a single retry delay
+            rng: Random source for retry jitter
+            result_cache_size: Finished jobs kept in process memory so
+                repeated polls skip Redis (0 disables)
         """
+        super().__init__(retry_cap, rng)
         try:
-            import redis
-        except ImportError:
-            raise JobError("redis package not installed. Install with: pip install redis")
-
-        self.client = redis.from_url(url, decode_responses=True)
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise JobError("redis package not installed. Install with: pip install redis") from e
+        try:
+            import msgpack
+        except ImportError as e:
+            raise JobError(
+                "msgpack package not installed. Install with: pip install msgpack"
+            ) from e
+
+        # Async, binary-safe client: commands never block the event loop;
+        # payload fields are raw msgpack and text fields are decoded where read
+        self.client = aioredis.from_url(url, decode_responses=False)
+        self._msgpack = msgpack
         self.prefix = prefix
+        self._cancel_script = self.client.register_script(_CANCEL_SCRIPT)
+        self._dequeue_script = self.client.register_script(_DEQUEUE_SCRIPT)
+        self._finish_script = self.client.register_script(_FINISH_SCRIPT)
+        # Completed, failed and cancelled jobs never change again (workers
+        # only settle jobs that are still running), so once one has been
+        # read it can be served locally.
+        self._finished: OrderedDict[str, JobResult] = OrderedDict()
+        self.result_cache_size = result_cache_size
 
     def _key(self, job_id: str) -> str:
         """Get Redis key for job."""
         return f"{self.prefix}{job_id}"
 
+    @property
+    def _index_key(self) -> str:
+        """Redis set holding the IDs of all known jobs."""
+        return f"{self.prefix}index"
+
+    @property
+    def _queue_key(self) -> str:
+        """Redis list of job IDs waiting to run (pushed left, popped right)."""
+        return f"{self.prefix}queue"
+
+    @property
+    def _processing_key(self) -> str:
+        """Redis list of job IDs claimed by a worker and not yet finished."""
+        return f"{self.prefix}processing"
+
     async def enqueue(
         self,
         job_id: str,
@@ -248,40 +410,49 @@ class RedisQueue(JobQueue):
         """Enqueue a job (Redis implementation).
 
         Note: Redis implementation stores job metadata only.
-        Actual execution happens via background workers.
+        Actual execution happens in worker processes running :meth:`work`,
+        which resolve the function with :func:`resolve_job_function`.
 
         Args:
             job_id: Unique job identifier
-            func: Function to execute (stored as reference)
-            args: Positional arguments (serialized)
-            kwargs: Keyword arguments (serialized)
+            func: Module-level function to execute (stored as an import path)
+            args: Positional arguments (msgpack-serialized)
+            kwargs: Keyword arguments (msgpack-serialized)
             max_retries: Maximum retry attempts
 
         Returns:
             Job ID
-        """
-        import pickle
 
-        result = JobResult(
-            job_id=job_id,
-            status=JobStatus.PENDING,
-            max_retries=max_retries,
-        )
+        Raises:
+            JobError: If the function is not importable or the arguments are
+                not msgpack-serializable
+        """
+        if "<locals>" in func.__qualname__:
+            raise JobError(f"Job function {func.__qualname__} must be defined at module level")
+        try:
+            packed_args = self._msgpack.packb(list(args), use_bin_type=True)
+            packed_kwargs = self._msgpack.packb(kwargs, use_bin_type=True)
+        except TypeError as e:
+            raise JobError(f"Job arguments are not serializable: {str(e)}") from e
 
-        # Store job data
+        # Store job data; timestamps are integer nanoseconds since the epoch
         data = {
             "job_id": job_id,
-            "status": result.status.value,
-            "created_at": result.created_at.isoformat(),
+            "status": JobStatus.PENDING.value,
+            "created_at": time.time_ns(),
             "max_retries": max_retries,
             "attempts": 0,
-            "func": pickle.dumps(func).hex(),
-            "args": pickle.dumps(args).hex(),
-            "kwargs": pickle.dumps(kwargs).hex(),
+            "func": f"{func.__module__}:{func.__qualname__}",
+            "args": packed_args,
+            "kwargs": packed_kwargs,
         }
 
-        self.client.hset(self._key(job_id), mapping=data)
-        self.client.lpush(f"{self.prefix}queue", job_id)
+        # Write the hash, index and queue the job in one round-trip
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.hset(self._key(job_id), mapping=data)
+            pipe.sadd(self._index_key, job_id)
+            pipe.lpush(self._queue_key, job_id)
+            await pipe.execute()
 
         return job_id
 
@@ -294,29 +465,48 @@ class RedisQueue(JobQueue):
         Returns:
             Job result or None if not found
         """
-        import pickle
+        cached = self._finished.get(job_id)
+        if cached is not None:
+            self._finished.move_to_end(job_id)
+            return cached
 
-        data = self.client.hgetall(self._key(job_id))
+        data = await self.client.hgetall(self._key(job_id))
         if not data:
             return None
 
-        # Reconstruct JobResult
+        return self._remember(self._from_hash(data))
+
+    def _remember(self, result: JobResult) -> JobResult:
+        """Cache a finished job locally; other results pass through untouched."""
+        if self.result_cache_size > 0 and result.status in (
+            JobStatus.COMPLETED,
+            JobStatus.FAILED,
+            JobStatus.CANCELLED,
+        ):
+            self._finished[result.job_id] = result
+            self._finished.move_to_end(result.job_id)
+            if len(self._finished) > self.result_cache_size:
+                self._finished.popitem(last=False)
+        return result
+
+    def _from_hash(self, data: Dict[bytes, bytes]) -> JobResult:
+        """Reconstruct a JobResult from a (binary) Redis job hash."""
         result = JobResult(
-            job_id=data["job_id"],
-            status=JobStatus(data["status"]),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            attempts=int(data["attempts"]),
-            max_retries=int(data["max_retries"]),
+            job_id=data[b"job_id"].decode(),
+            status=JobStatus(data[b"status"].decode()),
+            created_at=_from_ns(data[b"created_at"]),
+            attempts=int(data[b"attempts"]),
+            max_retries=int(data[b"max_retries"]),
         )
 
-        if "result" in data:
-            result.result = pickle.loads(bytes.fromhex(data["result"]))
-        if "error" in data:
-            result.error = data["error"]
-        if "started_at" in data:
-            result.started_at = datetime.fromisoformat(data["started_at"])
-        if "completed_at" in data:
-            result.completed_at = datetime.fromisoformat(data["completed_at"])
+        if b"result" in data:
+            result.result = self._msgpack.unpackb(data[b"result"], raw=False)
+        if b"error" in data:
+            result.error = data[b"error"].decode()
+        if b"started_at" in data:
+            result.started_at = _from_ns(data[b"started_at"])
+        if b"completed_at" in data:
+            result.completed_at = _from_ns(data[b"completed_at"])
 
         return result
 
@@ -329,11 +519,16 @@ class RedisQueue(JobQueue):
         Returns:
             True if cancelled, False otherwise
         """
-        result = await self.get_result(job_id)
-        if result and not result.is_done:
-            self.client.hset(self._key(job_id), "status", JobStatus.CANCELLED.value)
-            return True
-        return False
+        # Check and update server-side: one round-trip, no race with workers
+        cancelled = await self._cancel_script(
+            keys=[self._key(job_id)],
+            args=[
+                JobStatus.CANCELLED.value,
+                JobStatus.COMPLETED.value,
+                JobStatus.FAILED.value,
+            ],
+        )
+        return bool(cancelled)
 
     async def list_jobs(self, status: Optional[JobStatus] = None) -> List[JobResult]:
         """List jobs from Redis.
@@ -344,20 +539,212 @@ class RedisQueue(JobQueue):
         Returns:
             List of job results
         """
-        # Get all job keys
-        keys = self.client.keys(f"{self.prefix}*")
-        keys = [k for k in keys if not k.endswith(":queue")]
+        # Enumerate jobs from the index set rather than scanning the keyspace
+        job_ids = [job_id.decode() for job_id in await self.client.smembers(self._index_key)]
 
+        # Finished jobs come from the local cache; fetch the rest in a
+        # single round-trip
         jobs = []
-        for key in keys:
-            job_id = key.replace(self.prefix, "")
-            result = await self.get_result(job_id)
-            if result:
-                if status is None or result.status == status:
-                    jobs.append(result)
+        pending = []
+        for job_id in job_ids:
+            cached = self._finished.get(job_id)
+            if cached is None:
+                pending.append(job_id)
+            elif status is None or cached.status == status:
+                jobs.append(cached)
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for job_id in pending:
+                pipe.hgetall(self._key(job_id))
+            hashes = await pipe.execute()
+
+        stale = []
+        for job_id, data in zip(pending, hashes):
+            if not data:
+                # Hash was deleted or expired; drop it from the index
+                stale.append(job_id)
+                continue
+            if status is not None and data[b"status"].decode() != status.value:
+                continue
+            jobs.append(self._remember(self._from_hash(data)))
+
+        if stale:
+            await self.client.srem(self._index_key, *stale)
 
         return sorted(jobs, key=lambda j: j.created_at, reverse=True)
 
+    async def _claim(self, timeout: int) -> Optional[List[bytes]]:
+        """Claim the next job, blocking up to ``timeout`` seconds if none is queued.
+
+        Returns:
+            The dequeue script's reply, or None if the queue stayed empty
+        """
+        keys = [self._queue_key, self._processing_key]
+        args = [self.prefix, JobStatus.PENDING.value, JobStatus.RUNNING.value]
+        job = await self._dequeue_script(keys=keys, args=args + ["", time.time_ns()])
+        if job is not None:
+            return job
+
+        # Queue was empty: block until a job arrives, then claim that one
+        job_id = await self.client.brpoplpush(*keys, timeout=timeout)
+        if job_id is None:
+            return None
+        return await self._dequeue_script(keys=keys, args=args + [job_id, time.time_ns()])
+
+    async def run_next(self, timeout: int = 1) -> bool:
+        """Run one queued job in this process.
+
+        Args:
+            timeout: Seconds to wait for a job if the queue is empty
+
+        Returns:
+            True if a job was run, False if none was available
+        """
+        job = await self._claim(timeout)
+        if not job or len(job) == 1:
+            return False
+
+        job_id = job[0].decode()
+        attempts = int(job[1])
+        max_retries = int(job[5])
+        key = self._key(job_id)
+
+        try:
+            func = _as_coroutine_function(resolve_job_function(job[2].decode()))
+            args = self._msgpack.unpackb(job[3], raw=False)
+            kwargs = self._msgpack.unpackb(job[4], raw=False)
+            output = self._msgpack.packb(await func(*args, **kwargs), use_bin_type=True)
+        except Exception as e:
+            if attempts < max_retries:
+                # Leave the job in the processing list while it waits, so a
+                # crash here does not lose it
+                await self.client.hset(key, "error", str(e))
+                await asyncio.sleep(self._retry_delay(attempts))
+                await self._finish(job_id, {"status": JobStatus.PENDING.value}, requeue=True)
+                return True
+            update = {
+                "status": JobStatus.FAILED.value,
+                "error": str(e),
+                "completed_at": time.time_ns(),
+            }
+        else:
+            update = {
+                "status": JobStatus.COMPLETED.value,
+                "result": output,
+                "completed_at": time.time_ns(),
+            }
+
+        await self._finish(job_id, update)
+        return True
+
+    async def _finish(self, job_id: str, update: Dict[str, Any], requeue: bool = False) -> bool:
+        """Release a claimed job, applying ``update`` only if it is still running.
+
+        A job cancelled while it ran or waited for a retry stays cancelled.
+
+        Args:
+            job_id: Job identifier
+            update: Hash fields to set
+            requeue: Push the job back onto the queue (for a retry)
+
+        Returns:
+            True if the job was updated
+        """
+        fields = [item for pair in update.items() for item in pair]
+        updated = await self._finish_script(
+            keys=[self._key(job_id), self._processing_key, self._queue_key],
+            args=[job_id, JobStatus.RUNNING.value, "1" if requeue else "0", *fields],
+        )
+        return bool(updated)
+
+    async def work(self, timeout: int = 1) -> None:
+        """Run queued jobs one after another until cancelled.
+
+        Start this in each worker process (e.g. ``asyncio.run(queue.work())``);
+        several workers can share one queue.
+
+        Args:
+            timeout: Seconds each blocking wait for new jobs lasts
+        """
+        while True:
+            await self.run_next(timeout)
+
+
+def resolve_job_function(path: str) -> Callable:
+    """Import a job function from the ``module:qualname`` path stored by RedisQueue.
+
+    Args:
+        path: Import path, e.g. ``"myapp.jobs:process_document"``
+
+    Returns:
+        The function (for ``@background`` functions, the undecorated function,
+        since the module attribute at that path is the BackgroundJob wrapper)
+
+    Raises:
+        JobError: If the path cannot be resolved
+    """
+    module_name, _, qualname = path.partition(":")
+    try:
+        target: Any = importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            target = getattr(target, attr)
+    except (ImportError, AttributeError) as e:
+        raise JobError(f"Cannot resolve job function {path}: {str(e)}") from e
+    if isinstance(target, BackgroundJob):
+        target = target.func
+    return target
+
+
+class BackgroundJob:
+    """A function decorated with :func:`background`.
+
+    Calling it runs the function directly; ``enqueue`` hands it to the queue.
+    Attributes the class does not define (``__name__`` and so on) are read
+    from the wrapped function.
+    """
+
+    __slots__ = ("func", "queue", "max_retries", "_run", "__wrapped__")
+
+    def __init__(self, func: Callable, queue: JobQueue, max_retries: int = 3) -> None:
+        """Initialize background job.
+
+        Args:
+            func: Function to run
+            queue: Job queue used by ``enqueue``
+            max_retries: Maximum retry attempts on failure
+        """
+        self.func = func
+        self.queue = queue
+        self.max_retries = max_retries
+        self._run = _as_coroutine_function(func)
+        self.__wrapped__ = func
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "func":
+            # Not set yet (e.g. copy/pickle probing); don't recurse
+            raise AttributeError(name)
+        return getattr(self.func, name)
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob {getattr(self.func, '__qualname__', self.func)!r}>"
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Direct execution (for testing)."""
+        return await self._run(*args, **kwargs)
+
+    async def enqueue(self, *args: Any, **kwargs: Any) -> str:
+        """Enqueue job for background execution."""
+        job_id = str(uuid.uuid4())
+        return await self.queue.enqueue(job_id, self.func, args, kwargs, self.max_retries)
+
+    async def get_result(self, job_id: str) -> Optional[JobResult]:
+        """Get job result."""
+        return await self.queue.get_result(job_id)
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel job."""
+        return await self.queue.cancel(job_id)
+
 
 # Global queue instance
 _queue: Optional[JobQueue] = None
@@ -386,7 +773,9 @@ def get_queue(backend: str = "memory", **kwargs: Any) -> JobQueue:
     return _queue
 
 
-def background(max_retries: int = 3, queue: Optional[JobQueue] = None) -> Callable:
+def background(
+    max_retries: int = 3, queue: Optional[JobQueue] = None
+) -> Callable[[Callable], BackgroundJob]:
     """Decorator to run a function as a background job.
 
     Args:
@@ -412,31 +801,7 @@ def background(max_retries: int = 3, queue: Optional[JobQueue] = None) -> Callab
     """
     job_queue = queue or get_queue()
 
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            """Direct execution (for testing)."""
-            return await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-
-        async def enqueue(*args: Any, **kwargs: Any) -> str:
-            """Enqueue job for background execution."""
-            job_id = str(uuid.uuid4())
-            return await job_queue.enqueue(job_id, func, args, kwargs, max_retries)
-
-        async def get_result(job_id: str) -> Optional[JobResult]:
-            """Get job result."""
-            return await job_queue.get_result(job_id)
-
-        async def cancel(job_id: str) -> bool:
-            """Cancel job."""
-            return await job_queue.cancel(job_id)
-
-        # Attach helper methods
-        wrapper.enqueue = enqueue  # type: ignore
-        wrapper.get_result = get_result  # type: ignore
-        wrapper.cancel = cancel  # type: ignore
-        wrapper._original_func = func  # type: ignore
-
-        return wrapper
+    def decorator(func: Callable) -> "BackgroundJob":
+        return BackgroundJob(func, job_queue, max_retries)
 
     return decorator
@@ -1,13 +1,88 @@
 """Caching system for RapidAI."""
 
 import hashlib
+import heapq
 import json
+import math
+import pickle
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
 from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .exceptions import CacheError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speedup
+    xxhash = None
+
+
+def _hash_key(data: bytes) -> str:
+    """Hash serialized arguments into a cache key.
+
+    Uses xxh3 when ``xxhash`` is installed (keys are not security-sensitive),
+    otherwise falls back to a 128-bit BLAKE2b digest.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class _Mapping(tuple):  # type: ignore[type-arg]
+    """Order-independent stand-in for a dict inside a pickled cache key."""
+
+
+def _has_non_str_keys(value: Any) -> bool:
+    """Check whether any dict nested in ``value`` has a non-string key."""
+    if isinstance(value, dict):
+        return any(
+            not isinstance(key, str) or _has_non_str_keys(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_str_keys(item) for item in value)
+    return False
+
+
+def _canonical(value: Any) -> Any:
+    """Rebuild ``value`` with dicts as sorted item tuples, keeping key types."""
+    if isinstance(value, dict):
+        items = ((_canonical(key), _canonical(item)) for key, item in value.items())
+        return _Mapping(sorted(items, key=repr))
+    if type(value) in (list, tuple):
+        return type(value)(_canonical(item) for item in value)
+    return value
+
+
+def _serialize_key(args: Any, kwargs: Any) -> bytes:
+    """Serialize call arguments deterministically for hashing.
+
+    Uses orjson when it is installed, otherwise the stdlib encoder. JSON
+    turns every dict key into a string, so arguments with non-string keys
+    (``{1: "a"}`` vs ``{"1": "a"}``) are pickled instead, which keeps key
+    types; pickles start with a protocol byte and cannot collide with JSON.
+    """
+    if orjson is not None:
+        # Plain JSON arguments (the usual prompt strings and IDs) take the
+        # cheap encoding; OPT_NON_STR_KEYS alone more than doubles the cost.
+        # The two encodings cannot collide: one is an array, one an object.
+        try:
+            return orjson.dumps((args, kwargs), option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            if not _has_non_str_keys((args, kwargs)):
+                return orjson.dumps(
+                    {"args": args, "kwargs": kwargs},
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                )
+    elif not _has_non_str_keys((args, kwargs)):
+        return json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True).encode()
+    return pickle.dumps(_canonical((args, kwargs)), protocol=4)
+
 
 class CacheBackend:
     """Base class for cache backends."""
@@ -30,34 +105,71 @@ class CacheBackend:
 
 
 class InMemoryCache(CacheBackend):
-    """In-memory cache backend."""
+    """In-memory cache backend.
+
+    Entries are kept in least-recently-used order and bounded by
+    ``max_entries``. Expired entries are swept on ``set`` using a heap
+    ordered by expiry, so stale entries do not accumulate.
+    """
 
-    def __init__(self) -> None:
-        self._cache: Dict[str, tuple[Any, float]] = {}
+    def __init__(self, max_entries: int = 10_000) -> None:
+        """Initialize in-memory cache.
+
+        Args:
+            max_entries: Maximum number of entries before the least recently
+                used one is evicted
+        """
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
-        if key in self._cache:
-            value, expiry = self._cache[key]
+        entry = self._cache.get(key)
+        if entry is not None:
+            value, expiry = entry
             if time.time() < expiry:
+                self._cache.move_to_end(key)
                 return value
-            else:
-                del self._cache[key]
+            del self._cache[key]
         return None
 
     def set(self, key: str, value: Any, ttl: int = 3600) -> None:
         """Set value in cache with TTL."""
-        expiry = time.time() + ttl
+        now = time.time()
+        expiry = now + ttl
         self._cache[key] = (value, expiry)
+        self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expiry, key))
+
+        self._sweep(now)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired entries and heap records left behind by overwrites."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Only remove the entry if this record is its current expiry
+            if entry is not None and entry[1] == expiry:
+                del self._cache[key]
+
+        # Overwritten, deleted and evicted keys leave records behind; rebuild
+        # once they outnumber the live entries
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(expiry, key) for key, (_, expiry) in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
 
     def delete(self, key: str) -> None:
         """Delete value from cache."""
-        if key in self._cache:
-            del self._cache[key]
+        self._cache.pop(key, None)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._expiry_heap.clear()
 
 
 class RedisCache(CacheBackend):
@@ -108,26 +220,66 @@ class RedisCache(CacheBackend):
     def clear(self) -> None:
         """Clear all cache entries with prefix."""
         try:
-            # Delete all keys with the prefix
-            keys = self.client.keys(self.prefix + "*")
-            if keys:
-                self.client.delete(*keys)
+            # Walk the prefix with SCAN instead of blocking Redis with KEYS,
+            # unlinking in bounded batches
+            batch = []
+            for key in self.client.scan_iter(match=self.prefix + "*", count=1000):
+                batch.append(key)
+                if len(batch) >= 1000:
+                    self.client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                self.client.unlink(*batch)
         except Exception as e:
             raise CacheError(f"Redis clear error: {str(e)}")
 
 
 class SemanticCache(CacheBackend):
-    """Semantic cache using embeddings for similarity matching."""
+    """Semantic cache using embeddings for similarity matching.
+
+    Embeddings are stored unit-normalized as rows of one contiguous float32
+    matrix, with expiry times in a parallel array, so a lookup is a single
+    matrix-vector product and an argmax rather than a Python loop over
+    entries. Expired rows are masked out of lookups and compacted away once
+    they make up half of the matrix.
+
+    With ``quantize=True`` embeddings are stored as int8 with a per-row
+    scale, a quarter of the float32 footprint; scores stay within about
+    0.01 of the exact cosine similarity.
+    """
+
+    # Rows dequantized per step when scoring an int8 matrix
+    _SCORE_BLOCK_ROWS = 4096
 
-    def __init__(self, threshold: float = 0.85, embedding_model: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        quantize: bool = False,
+        capacity: int = 16,
+    ) -> None:
         """Initialize semantic cache.
 
         Args:
             threshold: Similarity threshold (0.0 to 1.0)
             embedding_model: Sentence transformer model name
+            quantize: Store embeddings as int8 instead of float32
+            capacity: Rows allocated up front; size it to the expected number
+                of entries to avoid regrowing the embedding matrix
         """
         self.threshold = threshold
-        self._cache: Dict[str, Tuple[Any, float, List[float]]] = {}  # key: (value, expiry, embedding)
+        self.quantize = quantize
+        self.capacity = max(1, capacity)
+        # Row i of _embeddings, _scales and _expiries belongs to _keys[i] and
+        # _values[i]; the arrays grow by doubling, so only the first _size rows
+        # are used. _scales is only kept for int8 storage.
+        self._keys: List[str] = []
+        self._values: List[Any] = []
+        self._embeddings: Any = None
+        self._scales: Any = None
+        self._expiries: Any = None
+        self._rows: Dict[str, int] = {}  # cache key -> row
+        self._exact: Dict[str, str] = {}  # sha256(normalized key) -> cache key
 
         try:
             from sentence_transformers import SentenceTransformer
@@ -139,38 +291,91 @@ class SemanticCache(CacheBackend):
 
         self.model = SentenceTransformer(embedding_model)
 
-    def _cosine_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
-        """Calculate cosine similarity between two embeddings.
+    @property
+    def _size(self) -> int:
+        """Number of rows in use."""
+        return len(self._keys)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Normalize text so trivial case/whitespace differences share a key.
 
         Args:
-            embedding1: First embedding vector
-            embedding2: Second embedding vector
+            text: Input text
 
         Returns:
-            Similarity score (0.0 to 1.0)
+            Lowercased text with collapsed whitespace
         """
-        import numpy as np
+        return " ".join(text.lower().split())
 
-        dot_product = np.dot(embedding1, embedding2)
-        norm1 = np.linalg.norm(embedding1)
-        norm2 = np.linalg.norm(embedding2)
+    def _digest(self, text: str) -> str:
+        """Hash normalized text for the exact-match fast path.
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+        Args:
+            text: Input text
 
-        return float(dot_product / (norm1 * norm2))
+        Returns:
+            Hex digest of the normalized text
+        """
+        return hashlib.sha256(self._normalize(text).encode()).hexdigest()
 
-    def _embed(self, text: str) -> List[float]:
-        """Generate embedding for text.
+    def _embed(self, text: str) -> Any:
+        """Generate a unit-length embedding for text.
 
         Args:
             text: Input text
 
         Returns:
-            Embedding vector
+            float32 embedding vector (all zeros if the model returns one)
+        """
+        import numpy as np
+
+        embedding = np.asarray(self.model.encode(text), dtype=np.float32)
+        squared = float(np.dot(embedding, embedding))
+        if squared > 0:
+            embedding *= 1.0 / math.sqrt(squared)
+        return embedding
+
+    def _embed_many(self, texts: List[str], batch_size: int = 32) -> Any:
+        """Generate unit-length embeddings for several texts in batched forward passes.
+
+        Args:
+            texts: Input texts
+            batch_size: Texts per model forward pass
+
+        Returns:
+            float32 matrix with one row per text
         """
-        embedding = self.model.encode(text)
-        return embedding.tolist()
+        import numpy as np
+
+        embeddings = np.asarray(
+            self.model.encode(texts, batch_size=batch_size), dtype=np.float32
+        ).reshape(len(texts), -1)
+        # einsum sums squares row by row without materializing embeddings**2
+        squared = np.einsum("ij,ij->i", embeddings, embeddings)
+        squared[squared == 0] = 1.0
+        embeddings *= (1.0 / np.sqrt(squared))[:, None]
+        return embeddings
+
+    def _compact(self, live: Any) -> None:
+        """Keep only the rows selected by a boolean mask over the used rows."""
+        import numpy as np
+
+        keep = np.flatnonzero(live)
+        for row in np.flatnonzero(~live):
+            key = self._keys[row]
+            digest = self._digest(key)
+            if self._exact.get(digest) == key:
+                del self._exact[digest]
+
+        count = len(keep)
+        self._embeddings[:count] = self._embeddings[keep]
+        self._expiries[:count] = self._expiries[keep]
+        if self._scales is not None:
+            self._scales[:count] = self._scales[keep]
+        self._keys = [self._keys[i] for i in keep]
+        self._values = [self._values[i] for i in keep]
+        self._rows = {key: i for i, key in enumerate(self._keys)}
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache using semantic similarity.
@@ -181,29 +386,60 @@ class SemanticCache(CacheBackend):
         Returns:
             Cached value if similar match found, None otherwise
         """
+        import numpy as np
+
+        current_time = time.time()
+
+        # Exact match on the normalized text skips embedding entirely
+        exact_key = self._exact.get(self._digest(key))
+        if exact_key is not None:
+            row = self._rows.get(exact_key)
+            if row is not None and current_time < self._expiries[row]:
+                return self._values[row]
+
+        size = self._size
+        if not size:
+            return None
+
+        live = self._expiries[:size] > current_time
+        live_count = int(np.count_nonzero(live))
+        if live_count * 2 <= size:
+            # Expired rows dominate: compact instead of scoring them
+            self._compact(live)
+            size = live_count
+            if not size:
+                return None
+            live = None
+
         # Generate embedding for query
         query_embedding = self._embed(key)
 
-        # Find most similar cached item
-        best_match = None
-        best_similarity = 0.0
-
-        current_time = time.time()
+        similarities = self._similarities(size, query_embedding)
+        if live is not None:
+            similarities[~live] = -1.0
+        best = int(np.argmax(similarities))
+        best_similarity = float(similarities[best])
 
-        for cache_key, (value, expiry, embedding) in list(self._cache.items()):
-            # Skip expired entries
-            if current_time >= expiry:
-                del self._cache[cache_key]
-                continue
+        if best_similarity > 0.0 and best_similarity >= self.threshold:
+            return self._values[best]
+        return None
 
-            # Calculate similarity
-            similarity = self._cosine_similarity(query_embedding, embedding)
+    def _similarities(self, size: int, query: Any) -> Any:
+        """Cosine similarity of the query against the first ``size`` rows."""
+        import numpy as np
 
-            if similarity > best_similarity and similarity >= self.threshold:
-                best_similarity = similarity
-                best_match = value
+        # Rows and query are unit length, so dot products are cosine similarities
+        if self._scales is None:
+            return self._embeddings[:size] @ query
 
-        return best_match
+        # Dequantize a block at a time so no float copy of the matrix is made
+        similarities = np.empty(size, dtype=np.float32)
+        for start in range(0, size, self._SCORE_BLOCK_ROWS):
+            stop = min(start + self._SCORE_BLOCK_ROWS, size)
+            out = similarities[start:stop]
+            np.matmul(self._embeddings[start:stop].astype(np.float32), query, out=out)
+            out *= self._scales[start:stop]
+        return similarities
 
     def set(self, key: str, value: Any, ttl: int = 3600) -> None:
         """Set value in cache with embedding.
@@ -213,9 +449,70 @@ class SemanticCache(CacheBackend):
             value: Value to cache
             ttl: Time-to-live in seconds
         """
+        self._store(key, value, time.time() + ttl, self._embed(key))
+
+    def set_many(self, items: Dict[str, Any], ttl: int = 3600, batch_size: int = 32) -> None:
+        """Set several values, embedding their keys in batches.
+
+        Embedding dominates the cost of ``set``; batching lets the model
+        encode many keys per forward pass, which is much faster than one
+        call per key when warming the cache.
+
+        Args:
+            items: Mapping of cache key (will be embedded) to value
+            ttl: Time-to-live in seconds
+            batch_size: Keys per model forward pass
+        """
+        if not items:
+            return
+
+        keys = list(items)
         expiry = time.time() + ttl
-        embedding = self._embed(key)
-        self._cache[key] = (value, expiry, embedding)
+        for key, embedding in zip(keys, self._embed_many(keys, batch_size)):
+            self._store(key, items[key], expiry, embedding)
+
+    def _store(self, key: str, value: Any, expiry: float, embedding: Any) -> None:
+        """Write an entry with a unit-length embedding into its row."""
+        import numpy as np
+
+        row = self._rows.get(key)
+        if row is None:
+            row = self._size
+            if self._embeddings is None:
+                dtype = np.int8 if self.quantize else np.float32
+                self._embeddings = np.empty((self.capacity, embedding.shape[0]), dtype=dtype)
+                self._expiries = np.empty(self.capacity, dtype=np.float64)
+                if self.quantize:
+                    self._scales = np.empty(self.capacity, dtype=np.float32)
+            elif row == self._embeddings.shape[0]:
+                self._embeddings = self._grow(self._embeddings)
+                self._expiries = self._grow(self._expiries)
+                if self._scales is not None:
+                    self._scales = self._grow(self._scales)
+            self._keys.append(key)
+            self._values.append(value)
+            self._rows[key] = row
+        else:
+            self._values[row] = value
+
+        if self._scales is not None:
+            # Symmetric scale so the largest component maps to +-127
+            scale = float(np.abs(embedding).max()) / 127.0 or 1.0
+            self._embeddings[row] = np.round(embedding / scale)
+            self._scales[row] = scale
+        else:
+            self._embeddings[row] = embedding
+        self._expiries[row] = expiry
+        self._exact[self._digest(key)] = key
+
+    @staticmethod
+    def _grow(array: Any) -> Any:
+        """Return a copy of ``array`` with twice as many rows."""
+        import numpy as np
+
+        grown = np.empty((2 * array.shape[0],) + array.shape[1:], dtype=array.dtype)
+        grown[: array.shape[0]] = array
+        return grown
 
     def delete(self, key: str) -> None:
         """Delete value from cache.
@@ -223,31 +520,53 @@ class SemanticCache(CacheBackend):
         Args:
             key: Cache key
         """
-        if key in self._cache:
-            del self._cache[key]
+        row = self._rows.pop(key, None)
+        if row is not None:
+            # Move the last entry into the freed row to keep rows contiguous
+            last = self._size - 1
+            if row != last:
+                moved = self._keys[last]
+                self._keys[row] = moved
+                self._values[row] = self._values[last]
+                self._embeddings[row] = self._embeddings[last]
+                self._expiries[row] = self._expiries[last]
+                if self._scales is not None:
+                    self._scales[row] = self._scales[last]
+                self._rows[moved] = row
+            self._keys.pop()
+            self._values.pop()
+        self._exact.pop(self._digest(key), None)
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
+        self._keys.clear()
+        self._values.clear()
+        self._embeddings = None
+        self._scales = None
+        self._expiries = None
+        self._rows.clear()
+        self._exact.clear()
 
 
 class CacheManager:
     """Manages caching for the application."""
 
-    def __init__(self, backend: str = "memory", ttl: int = 3600):
+    def __init__(self, backend: str = "memory", ttl: int = 3600, max_entries: int = 10_000):
         """Initialize cache manager.
 
         Args:
             backend: Cache backend ("memory", "redis")
             ttl: Default time-to-live in seconds
+            max_entries: Entry limit for the in-memory backend
         """
         self.ttl = ttl
+        self.max_entries = max_entries
         self.backend = self._create_backend(backend)
 
     def _create_backend(self, backend: str) -> CacheBackend:
         """Create cache backend instance."""
         if backend == "memory":
-            return InMemoryCache()
+            return InMemoryCache(max_entries=self.max_entries)
         elif backend == "redis":
             from .config import RapidAIConfig
             config = RapidAIConfig.load()
@@ -258,8 +577,7 @@ class CacheManager:
 
     def _make_key(self, *args: Any, **kwargs: Any) -> str:
         """Generate cache key from function arguments."""
-        key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return _hash_key(_serialize_key(args, kwargs))
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
@@ -307,20 +625,24 @@ def cache(
             return await llm.complete(question)
         ```
     """
-    # Create appropriate backend
-    if semantic:
-        backend = SemanticCache(threshold=threshold, embedding_model=embedding_model)
-    else:
-        cache_manager = CacheManager(ttl=ttl)
-        backend = cache_manager.backend
+    # Backends are created once per decorator, not per call, so results persist
+    # between calls. The exact-key manager also serves semantic calls that have
+    # no string argument to embed.
+    cache_manager = CacheManager(ttl=ttl)
+    semantic_backend = (
+        SemanticCache(threshold=threshold, embedding_model=embedding_model) if semantic else None
+    )
 
     def decorator(func: Callable) -> Callable:
+        func_id = f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            store: Any = cache_manager
+            cache_key = None
+
             # For semantic caching, use first string argument as key
-            if semantic:
-                # Find first string argument to use as semantic key
-                cache_key = None
+            if semantic_backend is not None:
                 for arg in args:
                     if isinstance(arg, str):
                         cache_key = arg
@@ -330,43 +652,25 @@ def cache(
                         if isinstance(value, str):
                             cache_key = value
                             break
+                if cache_key is not None:
+                    store = semantic_backend
 
-                if cache_key is None:
-                    # No string argument, fall back to regular caching
-                    cache_manager = CacheManager(ttl=ttl)
-                    cache_key = cache_manager._make_key(func.__name__, *args, **kwargs)
-                    cached_value = cache_manager.get(cache_key)
-                else:
-                    # Use semantic cache
-                    cached_value = backend.get(cache_key)
-
-                if cached_value is not None:
-                    return cached_value
-
-                # Call function
-                result = await func(*args, **kwargs)
-
-                # Cache result
-                backend.set(cache_key, result, ttl)
-
-                return result
-            else:
-                # Regular caching
-                cache_manager = CacheManager(ttl=ttl)
-                cache_key = cache_manager._make_key(func.__name__, *args, **kwargs)
+            if cache_key is None:
+                # Regular caching (or no string argument to embed)
+                cache_key = cache_manager._make_key(func_id, *args, **kwargs)
 
-                # Check cache
-                cached_value = cache_manager.get(cache_key)
-                if cached_value is not None:
-                    return cached_value
+            # Check cache
+            cached_value = store.get(cache_key)
+            if cached_value is not None:
+                return cached_value
 
-                # Call function
-                result = await func(*args, **kwargs)
+            # Call function
+            result = await func(*args, **kwargs)
 
-                # Cache result
-                cache_manager.set(cache_key, result, ttl)
+            # Cache result
+            store.set(cache_key, result, ttl)
 
-                return result
+            return result
 
         return wrapper
 
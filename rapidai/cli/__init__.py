@@ -1,13 +1,8 @@
 """CLI tool for RapidAI."""
 
 import click
-from rich.console import Console
 
-from .new import new_command
-from .dev import dev_command
-from .deploy import deploy_command
-
-console = Console()
+from ._console import get_console
 
 __version__ = "0.1.0"
 
@@ -35,12 +30,19 @@ def cli() -> None:
     default=".",
     help="Directory to create project in",
 )
-def new(project_name: str, template: str, directory: str) -> None:
+@click.option(
+    "--preview/--no-preview",
+    default=False,
+    help="Show a syntax-highlighted preview of the generated app.py",
+)
+def new(project_name: str, template: str, directory: str, preview: bool) -> None:
     """Create a new RapidAI project from a template.
 
     PROJECT_NAME: Name of the project to create
     """
-    new_command(project_name, template, directory)
+    from .new import new_command
+
+    new_command(project_name, template, directory, show_preview=preview)
 
 
 @cli.command("dev")
@@ -72,6 +74,8 @@ def new(project_name: str, template: str, directory: str) -> None:
 )
 def dev(port: int, host: str, reload: bool, app: str) -> None:
     """Run the development server with hot reload."""
+    from .dev import dev_command
+
     dev_command(port=port, host=host, reload=reload, app=app)
 
 
@@ -94,6 +98,8 @@ def deploy(platform: str, app_name: str | None, region: str | None) -> None:
 
     PLATFORM: Cloud platform to deploy to (fly, heroku, vercel, aws)
     """
+    from .deploy import deploy_command
+
     deploy_command(platform=platform, app_name=app_name, region=region)
 
 
@@ -114,6 +120,8 @@ def test(coverage: bool, verbose: bool) -> None:
     import subprocess
     import sys
 
+    console = get_console()
+
     cmd = ["pytest"]
     if coverage:
         cmd.extend(["--cov=.", "--cov-report=term-missing"])
@@ -148,6 +156,8 @@ def docs(serve: bool, port: int) -> None:
     import sys
     from pathlib import Path
 
+    console = get_console()
+
     docs_dir = Path("docs")
     if not docs_dir.exists():
         console.print("[yellow]No docs directory found. Creating basic structure...[/yellow]")
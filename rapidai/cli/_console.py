@@ -0,0 +1,25 @@
+"""Shared Rich console for CLI commands."""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """Return the CLI console, importing Rich on first use.
+
+    Rich is only needed once a command prints, so ``rapidai --help`` and
+    argument errors never pay for importing it.
+
+    Returns:
+        Console instance shared by all commands
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
@@ -1,30 +1,15 @@
 """Deployment command for RapidAI CLI."""
 
-import subprocess
+import os
+import shutil
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Set
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
+from ._console import get_console
 
-console = Console()
-
-
-def generate_fly_config(app_name: str, region: Optional[str] = None) -> str:
-    """Generate fly.toml configuration.
-
-    Args:
-        app_name: Application name
-        region: Region to deploy to
-
-    Returns:
-        fly.toml content
-    """
-    region_line = f'primary_region = "{region}"' if region else ""
-
-    return f'''# fly.toml
+# Deployment file contents; only fly.toml has per-app fields
+_FLY_TEMPLATE = '''# fly.toml
 app = "{app_name}"
 {region_line}
 
@@ -55,16 +40,10 @@ app = "{app_name}"
     path = "/health"
 '''
 
+_PROCFILE = """web: uvicorn app:app --host 0.0.0.0 --port $PORT
+"""
 
-def generate_procfile() -> str:
-    """Generate Procfile for Heroku."""
-    return '''web: uvicorn app:app --host 0.0.0.0 --port $PORT
-'''
-
-
-def generate_vercel_config() -> str:
-    """Generate vercel.json configuration."""
-    return '''{
+_VERCEL_JSON = """{
   "builds": [
     {
       "src": "app.py",
@@ -78,7 +57,57 @@ def generate_vercel_config() -> str:
     }
   ]
 }
-'''
+"""
+
+
+def generate_fly_config(app_name: str, region: Optional[str] = None) -> str:
+    """Generate fly.toml configuration.
+
+    Args:
+        app_name: Application name
+        region: Region to deploy to
+
+    Returns:
+        fly.toml content
+    """
+    region_line = f'primary_region = "{region}"' if region else ""
+    return _FLY_TEMPLATE.format(app_name=app_name, region_line=region_line)
+
+
+def generate_procfile() -> str:
+    """Generate Procfile for Heroku."""
+    return _PROCFILE
+
+
+def generate_vercel_config() -> str:
+    """Generate vercel.json configuration."""
+    return _VERCEL_JSON
+
+
+def _ask(question: str, default: str) -> str:
+    """Prompt for a value, or use the default when stdin is not a terminal."""
+    if not sys.stdin.isatty():
+        return default
+
+    from rich.prompt import Prompt
+
+    return Prompt.ask(question, default=default)
+
+
+def _confirm(question: str) -> bool:
+    """Ask a yes/no question; without a terminal the answer is no."""
+    if not sys.stdin.isatty():
+        return False
+
+    from rich.prompt import Confirm
+
+    return Confirm.ask(question)
+
+
+def _project_entries() -> Set[str]:
+    """Names in the current directory, read once instead of a stat per file."""
+    with os.scandir(".") as entries:
+        return {entry.name for entry in entries}
 
 
 def deploy_fly(app_name: Optional[str], region: Optional[str]) -> None:
@@ -88,31 +117,37 @@ def deploy_fly(app_name: Optional[str], region: Optional[str]) -> None:
         app_name: Application name
         region: Region to deploy to
     """
+    import subprocess
+
+    from rich.panel import Panel
+
+    console = get_console()
+
     console.print("[cyan]Deploying to Fly.io...[/cyan]")
     console.print()
 
     # Check if flyctl is installed
-    try:
-        subprocess.run(["flyctl", "version"], capture_output=True, check=True)
-    except FileNotFoundError:
+    if shutil.which("flyctl") is None:
         console.print("[red]Error: flyctl not found. Install from https://fly.io/docs/hands-on/install-flyctl/[/red]")
         return
 
     # Determine app name
     if not app_name:
-        app_name = Prompt.ask("Enter app name", default="rapidai-app")
+        app_name = _ask("Enter app name", default="rapidai-app")
+
+    existing = _project_entries()
 
     # Check if fly.toml exists
-    if not Path("fly.toml").exists():
+    if "fly.toml" not in existing:
         console.print("[yellow]No fly.toml found. Generating...[/yellow]")
         fly_config = generate_fly_config(app_name, region)
         Path("fly.toml").write_text(fly_config)
         console.print("[green]✓ Created fly.toml[/green]")
 
     # Check if requirements.txt exists
-    if not Path("requirements.txt").exists():
+    if "requirements.txt" not in existing:
         console.print("[yellow]Warning: No requirements.txt found[/yellow]")
-        if not Confirm.ask("Continue anyway?"):
+        if not _confirm("Continue anyway?"):
             return
 
     # Launch or deploy
@@ -140,38 +175,45 @@ def deploy_heroku(app_name: Optional[str], region: Optional[str]) -> None:
         app_name: Application name
         region: Region to deploy to
     """
+    import subprocess
+
+    console = get_console()
+
     console.print("[cyan]Deploying to Heroku...[/cyan]")
     console.print()
 
     # Check if heroku CLI is installed
-    try:
-        subprocess.run(["heroku", "version"], capture_output=True, check=True)
-    except FileNotFoundError:
+    if shutil.which("heroku") is None:
         console.print("[red]Error: heroku CLI not found. Install from https://devcenter.heroku.com/articles/heroku-cli[/red]")
         return
 
     # Determine app name
     if not app_name:
-        app_name = Prompt.ask("Enter app name", default="rapidai-app")
+        app_name = _ask("Enter app name", default="rapidai-app")
+
+    existing = _project_entries()
 
     # Check if Procfile exists
-    if not Path("Procfile").exists():
+    if "Procfile" not in existing:
         console.print("[yellow]No Procfile found. Generating...[/yellow]")
         Path("Procfile").write_text(generate_procfile())
         console.print("[green]✓ Created Procfile[/green]")
 
     # Check if requirements.txt exists
-    if not Path("requirements.txt").exists():
+    if "requirements.txt" not in existing:
         console.print("[red]Error: requirements.txt not found[/red]")
         return
 
-    # Create app if it doesn't exist
+    # Create the app with its buildpack in one CLI call; if creation fails
+    # (usually because the app already exists) set the buildpack separately
     console.print(f"[cyan]Creating Heroku app: {app_name}[/cyan]")
     region_flag = ["--region", region] if region else []
-    subprocess.run(["heroku", "create", app_name] + region_flag, check=False)
-
-    # Set buildpack
-    subprocess.run(["heroku", "buildpacks:set", "heroku/python", "-a", app_name], check=False)
+    created = subprocess.run(
+        ["heroku", "create", app_name, "--buildpack", "heroku/python"] + region_flag,
+        check=False,
+    )
+    if created.returncode != 0:
+        subprocess.run(["heroku", "buildpacks:set", "heroku/python", "-a", app_name], check=False)
 
     # Deploy
     console.print()
@@ -190,13 +232,17 @@ def deploy_vercel(app_name: Optional[str], region: Optional[str]) -> None:
         app_name: Application name
         region: Region to deploy to
     """
+    import subprocess
+
+    from rich.panel import Panel
+
+    console = get_console()
+
     console.print("[cyan]Deploying to Vercel...[/cyan]")
     console.print()
 
     # Check if vercel CLI is installed
-    try:
-        subprocess.run(["vercel", "--version"], capture_output=True, check=True)
-    except FileNotFoundError:
+    if shutil.which("vercel") is None:
         console.print("[red]Error: vercel CLI not found. Install with:[/red]")
         console.print("  npm install -g vercel")
         return
@@ -230,6 +276,8 @@ def deploy_aws(app_name: Optional[str], region: Optional[str]) -> None:
         app_name: Application name
         region: Region to deploy to
     """
+    console = get_console()
+
     console.print("[cyan]AWS Deployment[/cyan]")
     console.print()
     console.print("[yellow]AWS deployment is a manual process. Here's what you need to do:[/yellow]")
@@ -251,6 +299,14 @@ def deploy_aws(app_name: Optional[str], region: Optional[str]) -> None:
     console.print("[cyan]Recommended: Use AWS SAM or CDK for infrastructure as code[/cyan]")
 
 
+_DEPLOYERS: Dict[str, Callable[[Optional[str], Optional[str]], None]] = {
+    "fly": deploy_fly,
+    "heroku": deploy_heroku,
+    "vercel": deploy_vercel,
+    "aws": deploy_aws,
+}
+
+
 def deploy_command(platform: str, app_name: Optional[str], region: Optional[str]) -> None:
     """Deploy application to a cloud platform.
 
@@ -259,14 +315,9 @@ def deploy_command(platform: str, app_name: Optional[str], region: Optional[str]
         app_name: Application name
         region: Region to deploy to
     """
-    deployers = {
-        "fly": deploy_fly,
-        "heroku": deploy_heroku,
-        "vercel": deploy_vercel,
-        "aws": deploy_aws,
-    }
+    console = get_console()
 
-    deployer = deployers.get(platform)
+    deployer = _DEPLOYERS.get(platform)
     if deployer:
         deployer(app_name, region)
     else:
@@ -1,13 +1,8 @@
 """Development server command for RapidAI CLI."""
 
-import subprocess
-import sys
-from pathlib import Path
+import os
 
-from rich.console import Console
-from rich.panel import Panel
-
-console = Console()
+from ._console import get_console
 
 
 def dev_command(port: int, host: str, reload: bool, app: str) -> None:
@@ -19,9 +14,16 @@ def dev_command(port: int, host: str, reload: bool, app: str) -> None:
         reload: Enable auto-reload
         app: Application module path
     """
+    import subprocess
+    import sys
+
+    from rich.panel import Panel
+
+    console = get_console()
+
     # Check if app file exists
     app_file = app.split(":")[0].replace(".", "/") + ".py"
-    if not Path(app_file).exists():
+    if not os.path.isfile(app_file):
         console.print(f"[red]Error: Application file not found: {app_file}[/red]")
         console.print("[yellow]Make sure you're in the project directory or specify --app[/yellow]")
         console.print()
@@ -57,8 +59,14 @@ def dev_command(port: int, host: str, reload: bool, app: str) -> None:
             "--reload-exclude", ".git",
         ])
 
-    # Run uvicorn
+    # Run uvicorn. On POSIX it replaces this process, so the CLI's
+    # interpreter doesn't stay resident and Ctrl+C reaches uvicorn directly.
+    # Windows has no real exec, so it runs as a child there.
     try:
+        if os.name == "posix":
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execvp(cmd[0], cmd)
         subprocess.run(cmd, check=False)
     except KeyboardInterrupt:
         console.print("\n[yellow]Development server stopped[/yellow]")
@@ -1,29 +1,20 @@
 """Project scaffolding command for RapidAI CLI."""
 
-import shutil
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Callable, Dict
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
+from ._console import get_console
 
-console = Console()
+# Letters, digits, "-" and "_", with at least one letter or digit
+_PROJECT_NAME = re.compile(r"[\w-]*[^\W_][\w-]*")
 
 
-def get_template_files(template: str, project_name: str) -> Dict[str, str]:
-    """Get template files for the specified template type.
-
-    Args:
-        template: Template type (chatbot, rag, agent, api)
-        project_name: Name of the project
-
-    Returns:
-        Dictionary mapping file paths to file contents
-    """
-    templates: Dict[str, Dict[str, str]] = {
-        "chatbot": {
-            "app.py": f'''"""Simple chatbot application built with RapidAI."""
+def _chatbot_template(project_name: str) -> Dict[str, str]:
+    """Files for the chatbot template."""
+    return {
+        "app.py": f'''"""Simple chatbot application built with RapidAI."""
 
 from rapidai import App, LLM
 from rapidai.memory import ConversationMemory
@@ -61,19 +52,19 @@ async def clear_history(user_id: str):
 if __name__ == "__main__":
     app.run(port=8000)
 ''',
-            ".env": '''# LLM Provider API Keys
+        ".env": '''# LLM Provider API Keys
 ANTHROPIC_API_KEY=your-api-key-here
 # OPENAI_API_KEY=your-api-key-here
 
 # Application Settings
 DEBUG=true
 ''',
-            "requirements.txt": '''rapidai>=0.1.0
+        "requirements.txt": '''rapidai>=0.1.0
 rapidai[anthropic]
 # rapidai[openai]
 python-dotenv>=1.0.0
 ''',
-            "README.md": f'''# {project_name}
+        "README.md": f'''# {project_name}
 
 A chatbot application built with RapidAI.
 
@@ -111,9 +102,13 @@ curl -X POST http://localhost:8000/chat \\
 - Clear history endpoint
 - Simple and extensible
 ''',
-        },
-        "rag": {
-            "app.py": f'''"""RAG application built with RapidAI."""
+    }
+
+
+def _rag_template(project_name: str) -> Dict[str, str]:
+    """Files for the rag template."""
+    return {
+        "app.py": f'''"""RAG application built with RapidAI."""
 
 from rapidai import App, LLM
 from rapidai.rag import RAG
@@ -181,7 +176,7 @@ async def search(query: str, top_k: int = 5):
 if __name__ == "__main__":
     app.run(port=8000)
 ''',
-            ".env": '''# LLM Provider API Keys
+        ".env": '''# LLM Provider API Keys
 ANTHROPIC_API_KEY=your-api-key-here
 
 # RAG Configuration
@@ -192,11 +187,11 @@ RAPIDAI_CHUNKING_CHUNK_OVERLAP=50
 # Application Settings
 DEBUG=true
 ''',
-            "requirements.txt": '''rapidai>=0.1.0
+        "requirements.txt": '''rapidai>=0.1.0
 rapidai[anthropic,rag]
 python-dotenv>=1.0.0
 ''',
-            "README.md": f'''# {project_name}
+        "README.md": f'''# {project_name}
 
 A RAG (Retrieval-Augmented Generation) application built with RapidAI.
 
@@ -241,10 +236,14 @@ curl -X POST http://localhost:8000/ask \\
 - Context-aware answers
 - ChromaDB vector storage
 ''',
-            "docs/.gitkeep": "",
-        },
-        "agent": {
-            "app.py": f'''"""AI agent application built with RapidAI."""
+        "docs/.gitkeep": "",
+    }
+
+
+def _agent_template(project_name: str) -> Dict[str, str]:
+    """Files for the agent template."""
+    return {
+        "app.py": f'''"""AI agent application built with RapidAI."""
 
 from rapidai import App, LLM
 from rapidai.cache import cache
@@ -305,7 +304,7 @@ Always be concise and helpful."""
 if __name__ == "__main__":
     app.run(port=8000)
 ''',
-            ".env": '''# LLM Provider API Keys
+        ".env": '''# LLM Provider API Keys
 ANTHROPIC_API_KEY=your-api-key-here
 
 # Cache Settings
@@ -315,11 +314,11 @@ RAPIDAI_CACHE_TTL=3600
 # Application Settings
 DEBUG=true
 ''',
-            "requirements.txt": '''rapidai>=0.1.0
+        "requirements.txt": '''rapidai>=0.1.0
 rapidai[anthropic]
 python-dotenv>=1.0.0
 ''',
-            "README.md": f'''# {project_name}
+        "README.md": f'''# {project_name}
 
 An AI agent application built with RapidAI.
 
@@ -371,9 +370,13 @@ curl -X POST http://localhost:8000/chat \\
 - Interactive agent chat
 - Extensible architecture
 ''',
-        },
-        "api": {
-            "app.py": f'''"""REST API built with RapidAI."""
+    }
+
+
+def _api_template(project_name: str) -> Dict[str, str]:
+    """Files for the api template."""
+    return {
+        "app.py": f'''"""REST API built with RapidAI."""
 
 from rapidai import App, LLM
 from rapidai.middleware import cors, api_key_auth
@@ -423,7 +426,7 @@ async def health():
 if __name__ == "__main__":
     app.run(port=8000)
 ''',
-            ".env": '''# LLM Provider API Keys
+        ".env": '''# LLM Provider API Keys
 ANTHROPIC_API_KEY=your-api-key-here
 
 # API Settings
@@ -433,11 +436,11 @@ CORS_ORIGINS=*
 # Application Settings
 DEBUG=true
 ''',
-            "requirements.txt": '''rapidai>=0.1.0
+        "requirements.txt": '''rapidai>=0.1.0
 rapidai[anthropic]
 python-dotenv>=1.0.0
 ''',
-            "README.md": f'''# {project_name}
+        "README.md": f'''# {project_name}
 
 A REST API built with RapidAI.
 
@@ -492,22 +495,48 @@ curl -X POST http://localhost:8000/chat \\
 - Health check endpoint
 - Clean REST design
 ''',
-        },
     }
 
-    return templates.get(template, templates["chatbot"])
+
+_TEMPLATE_BUILDERS: Dict[str, Callable[[str], Dict[str, str]]] = {
+    "chatbot": _chatbot_template,
+    "rag": _rag_template,
+    "agent": _agent_template,
+    "api": _api_template,
+}
+
+
+def get_template_files(template: str, project_name: str) -> Dict[str, str]:
+    """Get template files for the specified template type.
+
+    Args:
+        template: Template type (chatbot, rag, agent, api)
+        project_name: Name of the project
+
+    Returns:
+        Dictionary mapping file paths to file contents
+    """
+    builder = _TEMPLATE_BUILDERS.get(template, _chatbot_template)
+    return builder(project_name)
 
 
-def new_command(project_name: str, template: str, directory: str) -> None:
+def new_command(
+    project_name: str, template: str, directory: str, show_preview: bool = False
+) -> None:
     """Create a new RapidAI project.
 
     Args:
         project_name: Name of the project
         template: Template type to use
         directory: Directory to create project in
+        show_preview: Print a syntax-highlighted preview of app.py
     """
+    from rich.panel import Panel
+
+    console = get_console()
+
     # Validate project name
-    if not project_name.replace("-", "").replace("_", "").isalnum():
+    if not _PROJECT_NAME.fullmatch(project_name):
         console.print("[red]Error: Project name must be alphanumeric (with - or _ allowed)[/red]")
         return
 
@@ -528,11 +557,15 @@ def new_command(project_name: str, template: str, directory: str) -> None:
         # Get template files
         files = get_template_files(template, project_name)
 
-        # Create files
+        # Create each subdirectory once, then the files; plain string paths
+        # avoid building a Path object per file
+        base = os.fspath(project_path)
+        full_paths = {file_path: os.path.join(base, file_path) for file_path in files}
+        for parent in {os.path.dirname(full_path) for full_path in full_paths.values()}:
+            os.makedirs(parent, exist_ok=True)
         for file_path, content in files.items():
-            full_path = project_path / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content)
+            with open(full_paths[file_path], "w", encoding="utf-8") as f:
+                f.write(content)
             console.print(f"  [green]✓[/green] Created {file_path}")
 
         # Create additional directories
@@ -552,9 +585,11 @@ def new_command(project_name: str, template: str, directory: str) -> None:
             border_style="green"
         ))
 
-        # Show app.py preview
+        # Show app.py preview (highlighting loads Pygments, so only on request)
         app_content = files.get("app.py", "")
-        if app_content:
+        if show_preview and app_content:
+            from rich.syntax import Syntax
+
             console.print("\n[cyan]Preview of app.py:[/cyan]")
             syntax = Syntax(app_content[:500] + "...", "python", theme="monokai", line_numbers=True)
             console.print(syntax)
@@ -563,4 +598,6 @@ def new_command(project_name: str, template: str, directory: str) -> None:
         console.print(f"[red]Error creating project: {e}[/red]")
         # Cleanup on error
         if project_path.exists():
+            import shutil
+
             shutil.rmtree(project_path)
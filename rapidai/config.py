@@ -1,36 +1,49 @@
 """Configuration management for RapidAI."""
 
-from typing import Any, Dict, Optional
-from pydantic import Field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
+import sys
 from pathlib import Path
-import yaml
-from dotenv import load_dotenv
 
-# Load .env file at module import time
-load_dotenv()
+if TYPE_CHECKING:
+    from .rag.config import RAGConfig
 
-# Import RAGConfig
-from .rag.config import RAGConfig
+_env_loaded = False
+
+
+def load_env() -> None:
+    """Load the .env file into the environment, once per process.
+
+    Called wherever settings or API keys are first read, rather than when
+    this module is imported, so commands that never read them skip it.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
 
 
 class LLMConfig(BaseSettings):
     """LLM configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="RAPIDAI_LLM_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="RAPIDAI_LLM_", extra="ignore", frozen=True)
 
     provider: str = "anthropic"
     model: str = "claude-3-5-sonnet-20241022"
     temperature: float = 0.7
     max_tokens: int = 4000
     timeout: int = 30
+    max_concurrency: int = 16
 
 
 class CacheConfig(BaseSettings):
     """Cache configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="RAPIDAI_CACHE_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="RAPIDAI_CACHE_", extra="ignore", frozen=True)
 
     backend: str = "memory"
     ttl: int = 3600
@@ -40,28 +53,34 @@ class CacheConfig(BaseSettings):
 class MemoryConfig(BaseSettings):
     """Memory configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="RAPIDAI_MEMORY_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="RAPIDAI_MEMORY_", extra="ignore", frozen=True)
 
     backend: str = "memory"
     max_history: int = 10
+    max_cached: int = 1024
     redis_url: Optional[str] = None
 
 
 class ServerConfig(BaseSettings):
     """Server configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="RAPIDAI_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="RAPIDAI_", extra="ignore", frozen=True)
 
     host: str = "0.0.0.0"
     port: int = 8000
     workers: int = 1
     debug: bool = True
+    loop: str = "auto"
+    http: str = "auto"
+    # Streaming responses coalesce events up to this size / delay
+    stream_flush_bytes: int = 4096
+    stream_flush_interval: float = 0.02
 
 
 class MonitoringConfig(BaseSettings):
     """Monitoring configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="RAPIDAI_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="RAPIDAI_", extra="ignore", frozen=True)
 
     track_costs: bool = True
     log_conversations: bool = False
@@ -71,7 +90,7 @@ class RapidAIConfig(BaseSettings):
     """Main configuration class for RapidAI."""
 
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="ignore"
+        env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True
     )
 
     llm: LLMConfig = Field(default_factory=LLMConfig)
@@ -79,15 +98,46 @@ class RapidAIConfig(BaseSettings):
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
     server: ServerConfig = Field(default_factory=ServerConfig)
     monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
-    rag: RAGConfig = Field(default_factory=RAGConfig)
+    # Raw ``rag:`` settings (or a ready RAGConfig); the RAGConfig is exposed
+    # as ``rag`` and built on first access, so the RAG package is only
+    # imported by apps that use it
+    rag_settings: Any = Field(default=None, alias="rag")
+    _rag: Optional["RAGConfig"] = PrivateAttr(default=None)
+
+    @field_validator("rag_settings")
+    @classmethod
+    def _check_rag_settings(cls, value: Any) -> Any:
+        """Accept a mapping of RAG settings or a RAGConfig instance."""
+        if value is None or isinstance(value, dict):
+            return value
+        # A RAGConfig instance means its module is already imported
+        rag_config = sys.modules.get("rapidai.rag.config")
+        if rag_config is not None and isinstance(value, rag_config.RAGConfig):
+            return value
+        raise ValueError("rag must be a mapping of RAG settings or a RAGConfig")
+
+    @property
+    def rag(self) -> "RAGConfig":
+        """RAG configuration."""
+        if self._rag is None:
+            if self.rag_settings is None or isinstance(self.rag_settings, dict):
+                from .rag.config import RAGConfig
+
+                self._rag = RAGConfig(**(self.rag_settings or {}))
+            else:
+                self._rag = self.rag_settings
+        return self._rag
 
     @classmethod
     def from_yaml(cls, path: str) -> "RapidAIConfig":
         """Load configuration from YAML file."""
+        load_env()
         yaml_path = Path(path)
         if not yaml_path.exists():
             return cls()
 
+        import yaml
+
         with open(yaml_path) as f:
             data = yaml.safe_load(f)
 
@@ -95,7 +145,28 @@ class RapidAIConfig(BaseSettings):
 
     @classmethod
     def load(cls, yaml_path: Optional[str] = None) -> "RapidAIConfig":
-        """Load configuration from environment and optionally from YAML."""
-        if yaml_path and os.path.exists(yaml_path):
-            return cls.from_yaml(yaml_path)
-        return cls()
+        """Load configuration from environment and optionally from YAML.
+
+        The result is cached per ``yaml_path``, so the app, cache and memory
+        managers share one validated instance. Call :meth:`reset_cache` after
+        changing the environment or the YAML file to pick the change up.
+        """
+        key = (cls, yaml_path)
+        config = _loaded.get(key)
+        if config is None:
+            load_env()
+            if yaml_path and os.path.exists(yaml_path):
+                config = cls.from_yaml(yaml_path)
+            else:
+                config = cls()
+            _loaded[key] = config
+        return config  # type: ignore[return-value]
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """Forget configurations cached by :meth:`load`."""
+        _loaded.clear()
+
+
+# Configurations returned by RapidAIConfig.load, keyed by (class, yaml_path)
+_loaded: Dict[Tuple[type, Optional[str]], RapidAIConfig] = {}
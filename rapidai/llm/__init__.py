@@ -1,11 +1,15 @@
 """LLM providers for RapidAI."""
 
 import os
+import re
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 from .base import BaseLLM, LLMConfig, MockLLM
 from .anthropic import AnthropicLLM
+from .cache import LLMCache
 from .openai import OpenAILLM
+from ..config import load_env
 from ..exceptions import LLMError
 
 
@@ -37,6 +41,9 @@ def LLM(
 
         # With custom parameters
         llm = LLM("claude-opus-4", temperature=0.9, max_tokens=8000)
+
+        # Cache deterministic responses
+        llm = LLM("gpt-4o-mini", temperature=0, cache=LLMCache())
         ```
     """
     # Auto-detect provider if not specified
@@ -54,6 +61,21 @@ def LLM(
         raise LLMError(f"Unknown provider: {provider}")
 
 
+# Substrings that identify each provider's model names
+_ANTHROPIC_MODEL = re.compile(r"claude|sonnet|opus|haiku", re.IGNORECASE)
+_OPENAI_MODEL = re.compile(r"gpt|o1|davinci|curie", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _provider_for_model(model: str) -> Optional[str]:
+    """Provider implied by the model name alone, or None if it names none."""
+    if _ANTHROPIC_MODEL.search(model):
+        return "anthropic"
+    if _OPENAI_MODEL.search(model):
+        return "openai"
+    return None
+
+
 def _detect_provider(model: str) -> str:
     """Auto-detect provider from model name.
 
@@ -66,17 +88,12 @@ def _detect_provider(model: str) -> str:
     Raises:
         LLMError: If provider cannot be detected
     """
-    model_lower = model.lower()
-
-    # Anthropic models
-    if any(x in model_lower for x in ["claude", "sonnet", "opus", "haiku"]):
-        return "anthropic"
-
-    # OpenAI models
-    if any(x in model_lower for x in ["gpt", "o1", "davinci", "curie"]):
-        return "openai"
+    provider = _provider_for_model(model)
+    if provider:
+        return provider
 
     # Check environment variable
+    load_env()
     env_provider = os.getenv("RAPIDAI_LLM_PROVIDER")
     if env_provider:
         return env_provider
@@ -90,6 +107,7 @@ def _detect_provider(model: str) -> str:
 __all__ = [
     "BaseLLM",
     "LLMConfig",
+    "LLMCache",
     "MockLLM",
     "AnthropicLLM",
     "OpenAILLM",
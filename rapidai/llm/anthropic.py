@@ -3,8 +3,16 @@
 import os
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
+from ..config import load_env
 from ..exceptions import LLMAuthenticationError, LLMError, LLMProviderError
-from .base import BaseLLM, LLMConfig
+from .base import (
+    BaseLLM,
+    LLMConfig,
+    batched_text_stream,
+    loop_local,
+    shared_http_client,
+)
+from .cache import LLMCache
 
 
 class AnthropicLLM(BaseLLM):
@@ -16,6 +24,7 @@ class AnthropicLLM(BaseLLM):
         api_key: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4000,
+        cache: Optional[LLMCache] = None,
         **kwargs: Any,
     ):
         """Initialize Anthropic LLM.
@@ -25,8 +34,10 @@ class AnthropicLLM(BaseLLM):
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache: Optional response cache for temperature-0 calls
             **kwargs: Additional configuration parameters
         """
+        load_env()
         api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise LLMAuthenticationError(
@@ -41,16 +52,32 @@ class AnthropicLLM(BaseLLM):
             max_tokens=max_tokens,
             **kwargs,
         )
-        super().__init__(config)
+        super().__init__(config, cache=cache)
 
         try:
             from anthropic import AsyncAnthropic
-
-            self.client = AsyncAnthropic(api_key=api_key)
-        except ImportError:
+        except ImportError as e:
             raise LLMError(
                 "anthropic package not installed. Install with: pip install anthropic"
-            )
+            ) from e
+        self._sdk_client_class = AsyncAnthropic
+
+    @property
+    def client(self) -> Any:
+        """SDK client for the running event loop.
+
+        Instances with the same API key and timeout share one client, which
+        sends through :func:`shared_http_client`.
+        """
+        config = self.config
+        return loop_local(
+            ("anthropic", config.api_key, config.timeout),
+            lambda: self._sdk_client_class(
+                api_key=config.api_key,
+                http_client=shared_http_client(config.timeout),
+                timeout=config.timeout,
+            ),
+        )
 
     async def chat(
         self,
@@ -77,14 +104,28 @@ class AnthropicLLM(BaseLLM):
             if stream:
                 return self._stream_chat(messages, **kwargs)
             else:
-                response = await self.client.messages.create(
-                    model=self.config.model,
-                    max_tokens=self.config.max_tokens,
-                    temperature=self.config.temperature,
-                    messages=messages,
-                    **kwargs,
-                )
-                return response.content[0].text
+                # Deterministic requests are answered from the cache if present
+                cache = self.cache
+                key = None
+                cached = None
+                if cache is not None:
+                    key = cache.cache_key(self.config, messages, **kwargs)
+                    cached = cache.get(key) if key is not None else None
+                if cached is not None:
+                    return cached
+
+                async with self._semaphore:
+                    response = await self.client.messages.create(
+                        model=self.config.model,
+                        max_tokens=self.config.max_tokens,
+                        temperature=self.config.temperature,
+                        messages=messages,
+                        **kwargs,
+                    )
+                text: str = response.content[0].text
+                if cache is not None and key is not None:
+                    cache.set(key, text)
+                return text
 
         except Exception as e:
             raise LLMProviderError(f"Anthropic API error: {str(e)}")
@@ -102,14 +143,14 @@ class AnthropicLLM(BaseLLM):
             Response chunks
         """
         try:
-            async with self.client.messages.stream(
+            async with self._semaphore, self.client.messages.stream(
                 model=self.config.model,
                 max_tokens=self.config.max_tokens,
                 temperature=self.config.temperature,
                 messages=messages,
                 **kwargs,
             ) as stream:
-                async for text in stream.text_stream:
+                async for text in batched_text_stream(stream.text_stream):
                     yield text
 
         except Exception as e:
@@ -1,9 +1,146 @@
 """Base LLM interface for RapidAI."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Union
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from .cache import LLMCache
+
+
+# Objects bound to an event loop (HTTP connection pools and the SDK clients
+# that send through them), per loop; None holds those made outside any loop.
+# Within a loop, every LLM instance reuses them, so connections (and their
+# TLS sessions) to each API host are shared.
+_loop_objects: Dict[Optional[asyncio.AbstractEventLoop], Dict[Any, Any]] = {}
+
+
+def loop_local(key: Any, factory: Callable[[], Any]) -> Any:
+    """Return the object stored under ``key`` for the running event loop.
+
+    Connections belong to the loop that opened them, so each loop gets its
+    own objects, created by ``factory`` on first use. Objects of loops that
+    have closed since are dropped.
+
+    Args:
+        key: Hashable identifier of the object
+        factory: Callable creating the object
+
+    Returns:
+        The object for the running loop
+    """
+    try:
+        loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    objects = _loop_objects.get(loop)
+    if objects is None:
+        for stale in [other for other in _loop_objects if other is not None and other.is_closed()]:
+            del _loop_objects[stale]
+        objects = _loop_objects[loop] = {}
+    value = objects.get(key)
+    if value is None:
+        value = objects[key] = factory()
+    return value
+
+
+def shared_http_client(timeout: float = 30.0) -> Any:
+    """Return the ``httpx.AsyncClient`` provider SDKs share in the running loop.
+
+    Args:
+        timeout: Request timeout in seconds
+
+    Returns:
+        httpx.AsyncClient with keep-alive limits sized for concurrent calls
+    """
+
+    def create() -> Any:
+        import httpx
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(timeout),
+            follow_redirects=True,
+        )
+
+    return loop_local(("httpx", timeout), create)
+
+
+async def close_shared_http_clients() -> None:
+    """Close the running loop's shared HTTP clients and forget its SDK clients.
+
+    The app calls this on shutdown; LLM instances create new clients if
+    they are used again.
+    """
+    objects = _loop_objects.pop(asyncio.get_running_loop(), {})
+    for key, value in objects.items():
+        if key[0] == "httpx":
+            await value.aclose()
+
+
+async def batched_text_stream(
+    source: AsyncIterator[str], max_chars: int = 64, max_delay: float = 0.02
+) -> AsyncIterator[str]:
+    """Coalesce streamed text fragments into fewer, larger chunks.
+
+    A chunk is yielded once it holds ``max_chars`` characters or its first
+    fragment has waited ``max_delay`` seconds, so a slow model still streams
+    promptly while a fast one is not re-emitted token by token.
+
+    Args:
+        source: Async iterator of text fragments
+        max_chars: Buffer size that triggers a yield
+        max_delay: Longest time in seconds a fragment is held back
+
+    Yields:
+        Concatenated text fragments
+    """
+    iterator = source.__aiter__()
+    loop = asyncio.get_running_loop()
+    buffer: List[str] = []
+    size = 0
+    deadline = 0.0
+    pending = None
+    try:
+        while True:
+            try:
+                if buffer:
+                    # Wait for the next fragment only until the buffer is due
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                    done, _ = await asyncio.wait(
+                        {pending}, timeout=deadline - loop.time()
+                    )
+                    if not done:
+                        yield "".join(buffer)
+                        buffer.clear()
+                        size = 0
+                    text = await pending
+                    pending = None
+                else:
+                    text = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer.append(text)
+            size += len(text)
+            if size >= max_chars:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
 
 @dataclass
 class LLMConfig:
@@ -14,6 +151,7 @@ class LLMConfig:
     temperature: float = 0.7
     max_tokens: int = 4000
     timeout: int = 30
+    max_concurrency: int = 16
 
 
 class BaseLLM(ABC):
@@ -23,13 +161,32 @@ class BaseLLM(ABC):
     LLM providers (OpenAI, Anthropic, Cohere, etc.).
     """
 
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, cache: Optional["LLMCache"] = None):
         """Initialize the LLM provider.
 
         Args:
             config: LLM configuration
+            cache: Optional response cache for temperature-0 calls
         """
         self.config = config
+        self.cache = cache
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore_instance: Optional[asyncio.Semaphore] = None
+
+    @property
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Bounds this instance's in-flight provider requests.
+
+        A large ``asyncio.gather`` queues locally instead of running into rate
+        limits. The semaphore is created in the running loop on first use, and
+        again for each new loop, since LLMs are often built at import time and
+        then used from one or more ``asyncio.run`` calls.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_instance is None or self._semaphore_loop is not loop:
+            self._semaphore_instance = asyncio.Semaphore(max(1, self.config.max_concurrency))
+            self._semaphore_loop = loop
+        return self._semaphore_instance
 
     @abstractmethod
     async def chat(
@@ -0,0 +1,61 @@
+"""Response cache for deterministic LLM calls."""
+
+from typing import Any, Dict, List, Optional
+
+from ..cache import CacheBackend, InMemoryCache, _hash_key, _serialize_key
+from .base import LLMConfig
+
+
+class LLMCache:
+    """Caches chat responses for requests sampled at temperature 0.
+
+    Only non-streaming calls are cached, and only when the configured
+    temperature is 0, since any other setting is expected to vary between
+    calls. Entries are keyed on the model, token limit, messages and any
+    extra request parameters (tools, stop sequences, ...).
+
+    Example:
+        ```python
+        from rapidai.cache import RedisCache
+        from rapidai.llm.cache import LLMCache
+
+        llm = LLM("gpt-4o-mini", temperature=0, cache=LLMCache())
+        shared = LLM("gpt-4o-mini", temperature=0, cache=LLMCache(RedisCache()))
+        ```
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl_seconds: int = 3600):
+        """Initialize the response cache.
+
+        Args:
+            backend: Cache backend to store responses in (in-memory by default)
+            ttl_seconds: Time-to-live of each cached response
+        """
+        self.backend = backend if backend is not None else InMemoryCache()
+        self.ttl_seconds = ttl_seconds
+
+    def cache_key(
+        self, config: LLMConfig, messages: List[Dict[str, str]], **params: Any
+    ) -> Optional[str]:
+        """Build the cache key for a request.
+
+        Args:
+            config: Configuration of the LLM making the request
+            messages: Messages sent to the provider
+            **params: Additional request parameters
+
+        Returns:
+            Cache key, or None if the request must not be cached
+        """
+        if config.temperature > 0:
+            return None
+        request = (config.model, config.max_tokens, messages)
+        return "llm:" + _hash_key(_serialize_key(request, params))
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, if any."""
+        return self.backend.get(key)
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response under a key."""
+        self.backend.set(key, response, self.ttl_seconds)
@@ -1,10 +1,19 @@
 """OpenAI LLM provider."""
 
+import asyncio
 import os
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
+from ..config import load_env
 from ..exceptions import LLMAuthenticationError, LLMError, LLMProviderError
-from .base import BaseLLM, LLMConfig
+from .base import (
+    BaseLLM,
+    LLMConfig,
+    batched_text_stream,
+    loop_local,
+    shared_http_client,
+)
+from .cache import LLMCache
 
 
 class OpenAILLM(BaseLLM):
@@ -16,6 +25,7 @@ class OpenAILLM(BaseLLM):
         api_key: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4000,
+        cache: Optional[LLMCache] = None,
         **kwargs: Any,
     ):
         """Initialize OpenAI LLM.
@@ -25,8 +35,10 @@ class OpenAILLM(BaseLLM):
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache: Optional response cache for temperature-0 calls
             **kwargs: Additional configuration parameters
         """
+        load_env()
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise LLMAuthenticationError(
@@ -41,14 +53,30 @@ class OpenAILLM(BaseLLM):
             max_tokens=max_tokens,
             **kwargs,
         )
-        super().__init__(config)
+        super().__init__(config, cache=cache)
 
         try:
             from openai import AsyncOpenAI
+        except ImportError as e:
+            raise LLMError("openai package not installed. Install with: pip install openai") from e
+        self._sdk_client_class = AsyncOpenAI
 
-            self.client = AsyncOpenAI(api_key=api_key)
-        except ImportError:
-            raise LLMError("openai package not installed. Install with: pip install openai")
+    @property
+    def client(self) -> Any:
+        """SDK client for the running event loop.
+
+        Instances with the same API key and timeout share one client, which
+        sends through :func:`shared_http_client`.
+        """
+        config = self.config
+        return loop_local(
+            ("openai", config.api_key, config.timeout),
+            lambda: self._sdk_client_class(
+                api_key=config.api_key,
+                http_client=shared_http_client(config.timeout),
+                timeout=config.timeout,
+            ),
+        )
 
     async def chat(
         self,
@@ -75,14 +103,28 @@ class OpenAILLM(BaseLLM):
             if stream:
                 return self._stream_chat(messages, **kwargs)
             else:
-                response = await self.client.chat.completions.create(
-                    model=self.config.model,
-                    messages=messages,
-                    temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
-                    **kwargs,
-                )
-                return response.choices[0].message.content or ""
+                # Deterministic requests are answered from the cache if present
+                cache = self.cache
+                key = None
+                cached = None
+                if cache is not None:
+                    key = cache.cache_key(self.config, messages, **kwargs)
+                    cached = cache.get(key) if key is not None else None
+                if cached is not None:
+                    return cached
+
+                async with self._semaphore:
+                    response = await self.client.chat.completions.create(
+                        model=self.config.model,
+                        messages=messages,
+                        temperature=self.config.temperature,
+                        max_tokens=self.config.max_tokens,
+                        **kwargs,
+                    )
+                text = response.choices[0].message.content or ""
+                if cache is not None and key is not None:
+                    cache.set(key, text)
+                return text
 
         except Exception as e:
             raise LLMProviderError(f"OpenAI API error: {str(e)}")
@@ -100,18 +142,23 @@ class OpenAILLM(BaseLLM):
             Response chunks
         """
         try:
-            stream = await self.client.chat.completions.create(
-                model=self.config.model,
-                messages=messages,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                stream=True,
-                **kwargs,
-            )
+            async with self._semaphore:
+                stream = await self.client.chat.completions.create(
+                    model=self.config.model,
+                    messages=messages,
+                    temperature=self.config.temperature,
+                    max_tokens=self.config.max_tokens,
+                    stream=True,
+                    **kwargs,
+                )
 
-            async for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                deltas = (
+                    chunk.choices[0].delta.content
+                    async for chunk in stream
+                    if chunk.choices[0].delta.content
+                )
+                async for text in batched_text_stream(deltas):
+                    yield text
 
         except Exception as e:
             raise LLMProviderError(f"OpenAI streaming error: {str(e)}")
@@ -145,11 +192,43 @@ class OpenAILLM(BaseLLM):
         Returns:
             List of embedding values
         """
+        return (await self.embed_many([text], model=model, **kwargs))[0]
+
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: str = "text-embedding-3-small",
+        batch_size: int = 256,
+        **kwargs: Any,
+    ) -> List[List[float]]:
+        """Generate embeddings for many texts.
+
+        Texts are sent ``batch_size`` at a time as list inputs, and the
+        batches are requested concurrently.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model name
+            batch_size: Maximum number of texts per request
+            **kwargs: Additional parameters
+
+        Returns:
+            One embedding per text, in input order
+        """
+        size = max(1, batch_size)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with self._semaphore:
+                response = await self.client.embeddings.create(
+                    model=model, input=batch, **kwargs
+                )
+            return [data.embedding for data in response.data]
+
         try:
-            response = await self.client.embeddings.create(
-                model=model, input=text, **kwargs
+            results = await asyncio.gather(
+                *(embed_batch(texts[i : i + size]) for i in range(0, len(texts), size))
             )
-            return response.data[0].embedding
-
         except Exception as e:
             raise LLMProviderError(f"OpenAI embedding error: {str(e)}")
+
+        return [embedding for batch in results for embedding in batch]
@@ -1,12 +1,60 @@
 """Conversation memory system for RapidAI."""
 
-from typing import Dict, List, Optional
-from .types import Message, ConversationHistory
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import pickle
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
 from .exceptions import MemoryError
+from .types import ConversationHistory, Message
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger("rapidai")
+
+
+def _dump_history(history: ConversationHistory) -> bytes:
+    """Serialize a conversation history to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(history)
+    return json.dumps(dataclasses.asdict(history)).encode()
+
+
+def _load_history(data: bytes) -> ConversationHistory:
+    """Deserialize a conversation history written by ``_dump_history``.
+
+    Values that are not JSON objects were written by earlier versions with
+    pickle and are still read.
+    """
+    if not data.startswith(b"{"):
+        return pickle.loads(data)
+    fields = orjson.loads(data) if orjson is not None else json.loads(data)
+    fields["messages"] = [Message(**message) for message in fields["messages"]]
+    return ConversationHistory(**fields)
 
 
 class ConversationMemory:
-    """Manages conversation history for a specific user/session."""
+    """Manages conversation history for a specific user/session.
+
+    Reads and writes are synchronous and never yield to the event loop. A
+    handler that awaits between reading the history and adding to it (for
+    example around an LLM call) should hold ``lock`` so concurrent requests
+    for the same user do not interleave::
+
+        async with memory.lock:
+            history = memory.to_dict_list()
+            reply = await llm.chat(message, history=history)
+            memory.add("user", message)
+            memory.add("assistant", reply)
+    """
 
     def __init__(
         self,
@@ -24,6 +72,29 @@ class ConversationMemory:
         self.user_id = user_id
         self.storage = storage
         self.max_history = max_history
+        self._history: Optional[ConversationHistory] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Per-conversation lock for read-modify-write sequences across awaits.
+
+        The lock belongs to the event loop the app runs in; an app serves all
+        requests from a single loop.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _load(self) -> Optional[ConversationHistory]:
+        """Return the history, reusing the hot copy for process-local storage.
+
+        Shared backends (Redis, PostgreSQL) are read on every call, since
+        other workers may have added messages since the last read.
+        """
+        if self._history is None or not self.storage.process_local:
+            self._history = self.storage.get(self.user_id)
+        return self._history
 
     def get(self) -> List[Message]:
         """Get conversation history.
@@ -31,7 +102,7 @@ class ConversationMemory:
         Returns:
             List of messages in the conversation
         """
-        history = self.storage.get(self.user_id)
+        history = self._load()
         if history:
             return history.messages
         return []
@@ -45,20 +116,24 @@ class ConversationMemory:
             metadata: Optional metadata
         """
         message = Message(role=role, content=content, metadata=metadata)
-        history = self.storage.get(self.user_id) or ConversationHistory(
+        history = self._load() or ConversationHistory(
             messages=[], user_id=self.user_id
         )
 
         history.messages.append(message)
 
-        # Trim history if too long
-        if len(history.messages) > self.max_history:
-            history.messages = history.messages[-self.max_history :]
+        # Trim history in place so the stored list is reused, not copied
+        overflow = len(history.messages) - self.max_history
+        if overflow > 0:
+            del history.messages[:overflow]
 
+        # Write through so the persistent backend stays authoritative
+        self._history = history
         self.storage.set(self.user_id, history)
 
     def clear(self) -> None:
         """Clear conversation history."""
+        self._history = None
         self.storage.delete(self.user_id)
 
     def to_dict_list(self) -> List[Dict[str, str]]:
@@ -74,6 +149,10 @@ class ConversationMemory:
 class MemoryStorage:
     """Base class for memory storage backends."""
 
+    # True if no other process can change the stored histories, so a
+    # conversation's in-process copy never goes stale
+    process_local = False
+
     def get(self, user_id: str) -> Optional[ConversationHistory]:
         """Get conversation history for a user."""
         raise NotImplementedError
@@ -86,10 +165,20 @@ class MemoryStorage:
         """Delete conversation history for a user."""
         raise NotImplementedError
 
+    async def flush(self) -> None:
+        """Wait until deferred writes have reached the backend.
+
+        Optional hook for backends that write in the background; the default
+        writes synchronously and has nothing to wait for.
+        """
+        return None
+
 
 class InMemoryStorage(MemoryStorage):
     """In-memory storage backend."""
 
+    process_local = True
+
     def __init__(self) -> None:
         self._storage: Dict[str, ConversationHistory] = {}
 
@@ -104,54 +193,174 @@ class InMemoryStorage(MemoryStorage):
             del self._storage[user_id]
 
 
+# Async Redis clients keyed by (event loop, URL), shared by every RedisStorage
+# so that all instances in a loop write through one connection pool
+_async_clients: Dict[Tuple[asyncio.AbstractEventLoop, str], Any] = {}
+
+
 class RedisStorage(MemoryStorage):
-    """Redis storage backend."""
+    """Redis storage backend.
 
-    def __init__(self, url: str = "redis://localhost:6379", prefix: str = "rapidai:memory:"):
+    Inside a running event loop, writes and deletes are handed to a
+    background task on a ``redis.asyncio`` client, so adding a message never
+    blocks the loop on a Redis round-trip. Writes to one key are applied in
+    order and coalesced to the latest value, and reads see pending writes.
+    A failed write keeps its value pending and raises ``MemoryError`` from
+    the next ``get``/``set``/``delete`` of that key or from :meth:`flush`,
+    which retries it. Outside an event loop writes run synchronously.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379",
+        prefix: str = "rapidai:memory:",
+        max_connections: int = 64,
+    ):
         """Initialize Redis storage.
 
         Args:
             url: Redis connection URL
             prefix: Key prefix for namespacing
+            max_connections: Size of the async connection pool shared by
+                every storage using ``url`` in one event loop
         """
         try:
             import redis
-            import pickle
-        except ImportError:
+            import redis.asyncio
+        except ImportError as e:
             raise MemoryError(
                 "redis not installed. Install with: pip install redis"
-            )
+            ) from e
 
+        self.url = url
         self.prefix = prefix
+        self.max_connections = max_connections
         self.client = redis.from_url(url, decode_responses=False)
+        self._aioredis = redis.asyncio
+        # Latest unwritten value per key (None for a delete), the task
+        # currently writing that key, and the error of its last failed write
+        self._pending: Dict[str, Optional[bytes]] = {}
+        self._writers: Dict[str, asyncio.Task[None]] = {}
+        self._failed: Dict[str, Exception] = {}
+
+    @property
+    def async_client(self) -> Any:
+        """Async client for the running event loop.
+
+        Its connections belong to that loop, so each loop gets its own pool;
+        pools of loops that have closed are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        client = _async_clients.get((loop, self.url))
+        if client is None:
+            for stale in [key for key in _async_clients if key[0].is_closed()]:
+                del _async_clients[stale]
+            client = _async_clients[(loop, self.url)] = self._aioredis.from_url(
+                self.url, decode_responses=False, max_connections=self.max_connections
+            )
+        return client
 
     def get(self, user_id: str) -> Optional[ConversationHistory]:
         """Get conversation history from Redis."""
+        key = self.prefix + user_id
         try:
-            import pickle
-            data = self.client.get(self.prefix + user_id)
+            self._raise_failed(key)
+            if key in self._pending:
+                data = self._pending[key]
+            else:
+                data = self.client.get(key)
             if data:
-                return pickle.loads(data)
+                return _load_history(data)
             return None
         except Exception as e:
-            raise MemoryError(f"Redis get error: {str(e)}")
+            raise MemoryError(f"Redis get error: {str(e)}") from e
 
     def set(self, user_id: str, history: ConversationHistory) -> None:
         """Set conversation history in Redis."""
         try:
-            import pickle
-            serialized = pickle.dumps(history)
-            # Store indefinitely (no expiry)
-            self.client.set(self.prefix + user_id, serialized)
+            serialized = _dump_history(history)
+            if not self._write_behind(self.prefix + user_id, serialized):
+                # Store indefinitely (no expiry)
+                self.client.set(self.prefix + user_id, serialized)
         except Exception as e:
-            raise MemoryError(f"Redis set error: {str(e)}")
+            raise MemoryError(f"Redis set error: {str(e)}") from e
 
     def delete(self, user_id: str) -> None:
         """Delete conversation history from Redis."""
         try:
-            self.client.delete(self.prefix + user_id)
+            if not self._write_behind(self.prefix + user_id, None):
+                self.client.delete(self.prefix + user_id)
+        except Exception as e:
+            raise MemoryError(f"Redis delete error: {str(e)}") from e
+
+    async def flush(self) -> None:
+        """Wait for background writes, retrying any that failed.
+
+        Call this before the event loop stops (the app does so on shutdown),
+        or writes still pending are lost with the process.
+
+        Raises:
+            MemoryError: If a pending write fails again
+        """
+        for key in list(self._pending):
+            self._failed.pop(key, None)
+            self._start_writer(key)
+        if self._writers:
+            await asyncio.gather(*self._writers.values())
+        if self._failed:
+            key, error = self._failed.popitem()
+            raise MemoryError(f"Redis write error for {key}: {str(error)}") from error
+
+    def _raise_failed(self, key: str) -> None:
+        """Raise the error of the last failed background write of a key, once."""
+        error = self._failed.pop(key, None)
+        if error is not None:
+            raise error
+
+    def _write_behind(self, key: str, value: Optional[bytes]) -> bool:
+        """Queue a write (or delete, for None) for the background writer.
+
+        A failed earlier write of the key is raised after the new value is
+        queued; the new value supersedes it.
+
+        Returns:
+            False if no event loop is running and the caller must write
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self._pending[key] = value
+        self._start_writer(key)
+        self._raise_failed(key)
+        return True
+
+    def _start_writer(self, key: str) -> None:
+        """Start a background writer for a key unless one is running."""
+        if key not in self._writers:
+            self._writers[key] = asyncio.get_running_loop().create_task(self._write(key))
+
+    async def _write(self, key: str) -> None:
+        """Write the latest pending value of a key until none is left.
+
+        A value is dropped from ``_pending`` only once Redis has it; on an
+        error, or if the task is cancelled, it stays pending.
+        """
+        try:
+            while key in self._pending:
+                value = self._pending[key]
+                if value is None:
+                    await self.async_client.delete(key)
+                else:
+                    await self.async_client.set(key, value)
+                # A newer value queued during the await is written next
+                if self._pending.get(key, value) is value:
+                    self._pending.pop(key, None)
         except Exception as e:
-            raise MemoryError(f"Redis delete error: {str(e)}")
+            logger.warning("Redis write error for %s: %s", key, e)
+            self._failed[key] = e
+        finally:
+            del self._writers[key]
 
 
 class PostgresStorage(MemoryStorage):
@@ -166,7 +375,6 @@ class PostgresStorage(MemoryStorage):
         """
         try:
             import psycopg2
-            import json
         except ImportError:
             raise MemoryError(
                 "psycopg2 not installed. Install with: pip install psycopg2-binary"
@@ -201,7 +409,6 @@ class PostgresStorage(MemoryStorage):
                 result = cursor.fetchone()
 
                 if result:
-                    import json
                     messages_data = result[0]
                     messages = [
                         Message(**msg) for msg in messages_data
@@ -217,7 +424,6 @@ class PostgresStorage(MemoryStorage):
     def set(self, user_id: str, history: ConversationHistory) -> None:
         """Set conversation history in PostgreSQL."""
         try:
-            import json
             messages_data = [
                 {
                     "role": msg.role,
@@ -254,16 +460,36 @@ class PostgresStorage(MemoryStorage):
 class MemoryManager:
     """Manages conversation memory instances."""
 
-    def __init__(self, backend: str = "memory", max_history: int = 10):
+    def __init__(
+        self,
+        backend: str = "memory",
+        max_history: int = 10,
+        max_cached: int = 1024,
+    ):
         """Initialize memory manager.
 
+        Recently used conversations are kept in an in-process LRU in front of
+        the storage backend. With process-local storage, repeat users are
+        served from their in-process copy; shared backends are re-read on
+        each access, so workers do not overwrite each other's messages.
+        Writes always go through to the backend; backends that write in the
+        background are drained by :meth:`flush`. Conversations still
+        referenced elsewhere (e.g. by an in-flight request) keep their
+        identity after leaving the LRU, so a user never has two live copies.
+
         Args:
             backend: Storage backend ("memory", "redis", "postgres")
             max_history: Maximum messages to keep per conversation
+            max_cached: Maximum conversations held in the in-process cache
         """
         self.max_history = max_history
+        self.max_cached = max_cached
         self.storage = self._create_storage(backend)
-        self._memories: Dict[str, ConversationMemory] = {}
+        self._memories: OrderedDict[str, ConversationMemory] = OrderedDict()
+        # Every live ConversationMemory, including ones evicted from the LRU
+        self._live: weakref.WeakValueDictionary[str, ConversationMemory] = (
+            weakref.WeakValueDictionary()
+        )
 
     def _create_storage(self, backend: str) -> MemoryStorage:
         """Create storage backend instance."""
@@ -276,7 +502,6 @@ class MemoryManager:
             return RedisStorage(url=redis_url)
         elif backend == "postgres":
             from .config import RapidAIConfig
-            import os
             config = RapidAIConfig.load()
             # Get connection string from config or environment
             conn_str = os.getenv("DATABASE_URL") or os.getenv("POSTGRES_URL")
@@ -298,10 +523,31 @@ class MemoryManager:
         Returns:
             ConversationMemory instance
         """
-        if user_id not in self._memories:
-            self._memories[user_id] = ConversationMemory(
+        memory = self._memories.get(user_id)
+        if memory is not None:
+            self._memories.move_to_end(user_id)
+            return memory
+
+        memory = self._live.get(user_id)
+        if memory is None:
+            memory = ConversationMemory(
                 user_id=user_id,
                 storage=self.storage,
                 max_history=self.max_history,
             )
-        return self._memories[user_id]
+            self._live[user_id] = memory
+
+        self._memories[user_id] = memory
+        if len(self._memories) > self.max_cached:
+            # The evicted conversation stays reachable through _live while in
+            # use and otherwise reloads from storage on demand
+            self._memories.popitem(last=False)
+        return memory
+
+    async def flush(self) -> None:
+        """Wait until every write has reached the storage backend.
+
+        Raises:
+            MemoryError: If a deferred write fails
+        """
+        await self.storage.flush()
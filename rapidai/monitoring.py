@@ -1,10 +1,11 @@
 """Monitoring and observability for RapidAI."""
 
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .exceptions import RapidAIException
 
@@ -80,6 +81,17 @@ MODEL_PRICING = {
 }
 
 
+def _per_token_rates(pricing: Dict[str, float]) -> Tuple[float, float]:
+    """Convert per-1M-token pricing into (prompt, completion) per-token rates."""
+    return pricing["prompt"] / 1_000_000, pricing["completion"] / 1_000_000
+
+
+# Per-token rates, precomputed so calculate_cost is one lookup and two multiplies
+_RATES: Dict[str, Tuple[float, float]] = {
+    model: _per_token_rates(pricing) for model, pricing in MODEL_PRICING.items()
+}
+
+
 def calculate_cost(
     model: str,
     prompt_tokens: int = 0,
@@ -95,14 +107,24 @@ def calculate_cost(
     Returns:
         Cost in USD
     """
-    pricing = MODEL_PRICING.get(model, {"prompt": 0, "completion": 0})
-    prompt_cost = (prompt_tokens / 1_000_000) * pricing["prompt"]
-    completion_cost = (completion_tokens / 1_000_000) * pricing["completion"]
-    return prompt_cost + completion_cost
+    rates = _RATES.get(model)
+    if rates is None:
+        pricing = MODEL_PRICING.get(model)
+        if pricing is None:
+            return 0.0
+        # Model added to MODEL_PRICING after import
+        rates = _RATES[model] = _per_token_rates(pricing)
+
+    prompt_rate, completion_rate = rates
+    return prompt_tokens * prompt_rate + completion_tokens * completion_rate
 
 
 class MetricsCollector:
-    """Collects and stores metrics."""
+    """Collects and stores metrics.
+
+    Summary counters are updated as requests are recorded, so
+    :meth:`get_summary` never scans the request history.
+    """
 
     def __init__(self) -> None:
         """Initialize metrics collector."""
@@ -110,6 +132,22 @@ class MetricsCollector:
         self._requests: List[RequestMetrics] = []
         self._model_usage: Dict[str, ModelUsage] = {}
         self._start_time = datetime.now()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._reset_aggregates()
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every change, for caching views of the metrics."""
+        return self._version
+
+    def _reset_aggregates(self) -> None:
+        """Reset running summary counters."""
+        self._total_requests = 0
+        self._successful_requests = 0
+        self._total_duration = 0.0
+        self._total_tokens = 0
+        self._total_cost = 0.0
 
     def record_metric(
         self,
@@ -126,6 +164,7 @@ class MetricsCollector:
         """
         metric = Metric(name=name, value=value, tags=tags or {})
         self._metrics.append(metric)
+        self._version += 1
 
     def record_request(
         self,
@@ -166,17 +205,27 @@ class MetricsCollector:
             cost=cost,
             error=error,
         )
-        self._requests.append(request)
 
-        # Update model usage
-        if model and tokens_used:
-            if model not in self._model_usage:
-                self._model_usage[model] = ModelUsage(model=model)
-            self._model_usage[model].add_tokens(
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                cost=cost or 0.0,
-            )
+        with self._lock:
+            self._requests.append(request)
+            self._version += 1
+
+            self._total_requests += 1
+            if status_code < 400:
+                self._successful_requests += 1
+            self._total_duration += duration
+
+            # Update model usage
+            if model and tokens_used:
+                if model not in self._model_usage:
+                    self._model_usage[model] = ModelUsage(model=model)
+                self._model_usage[model].add_tokens(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cost=cost or 0.0,
+                )
+                self._total_tokens += tokens_used
+                self._total_cost += cost or 0.0
 
     def get_metrics(
         self,
@@ -237,7 +286,8 @@ class MetricsCollector:
         """
         if model:
             return {model: self._model_usage.get(model, ModelUsage(model=model))}
-        return self._model_usage.copy()
+        with self._lock:
+            return self._model_usage.copy()
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics.
@@ -247,35 +297,35 @@ class MetricsCollector:
         """
         uptime = (datetime.now() - self._start_time).total_seconds()
 
-        total_requests = len(self._requests)
-        successful_requests = len([r for r in self._requests if r.status_code < 400])
-        failed_requests = total_requests - successful_requests
-
-        avg_duration = 0.0
-        if self._requests:
-            avg_duration = sum(r.duration for r in self._requests) / total_requests
-
-        total_tokens = sum(u.total_tokens for u in self._model_usage.values())
-        total_cost = sum(u.total_cost for u in self._model_usage.values())
+        with self._lock:
+            total_requests = self._total_requests
+            successful_requests = self._successful_requests
+            total_duration = self._total_duration
+            total_tokens = self._total_tokens
+            total_cost = self._total_cost
+            models_used = len(self._model_usage)
 
         return {
             "uptime_seconds": uptime,
             "total_requests": total_requests,
             "successful_requests": successful_requests,
-            "failed_requests": failed_requests,
+            "failed_requests": total_requests - successful_requests,
             "success_rate": successful_requests / total_requests if total_requests > 0 else 0.0,
-            "average_duration": avg_duration,
+            "average_duration": total_duration / total_requests if total_requests > 0 else 0.0,
             "total_tokens": total_tokens,
             "total_cost": total_cost,
-            "models_used": len(self._model_usage),
+            "models_used": models_used,
         }
 
     def clear(self) -> None:
         """Clear all metrics."""
-        self._metrics.clear()
-        self._requests.clear()
-        self._model_usage.clear()
-        self._start_time = datetime.now()
+        with self._lock:
+            self._metrics.clear()
+            self._requests.clear()
+            self._model_usage.clear()
+            self._reset_aggregates()
+            self._version += 1
+            self._start_time = datetime.now()
 
 
 # Global metrics collector
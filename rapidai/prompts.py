@@ -8,6 +8,7 @@ from functools import wraps
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from .config import load_env
 from .exceptions import RapidAIException
 
 
@@ -36,6 +37,8 @@ class Prompt:
     variables: List[str] = field(default_factory=list)
     versions: List[PromptVersion] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _compiled: Any = field(default=None, init=False, repr=False, compare=False)
+    _compiled_source: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Extract variables from template."""
@@ -66,10 +69,14 @@ class Prompt:
             PromptError: If required variables are missing
         """
         try:
-            from jinja2 import Template
+            # Compile once and reuse; recompile only if the source changed
+            if self._compiled is None or self._compiled_source is not self.template:
+                from jinja2 import Template
 
-            template = Template(self.template)
-            return template.render(**kwargs)
+                self._compiled = Template(self.template)
+                self._compiled_source = self.template
+
+            return self._compiled.render(**kwargs)
         except ImportError:
             raise PromptError("jinja2 not installed. Install with: pip install jinja2")
         except Exception as e:
@@ -302,6 +309,7 @@ def get_prompt_manager(
     if _global_manager is None:
         # Auto-detect reload based on environment
         if auto_reload is None:
+            load_env()
             auto_reload = os.getenv("DEBUG", "").lower() in ("true", "1", "yes")
 
         _global_manager = PromptManager(
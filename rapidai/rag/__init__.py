@@ -15,7 +15,7 @@ from .loaders import (
 )
 from .mocks import MockEmbedding, MockVectorDB
 from .retriever import RAG
-from .vectordb import ChromaDB, VectorDB
+from .vectordb import ChromaDB, NumpyVectorDB, VectorDB
 
 __all__ = [
     # Main classes
@@ -45,6 +45,7 @@ __all__ = [
     "SentenceChunker",
     # Vector DBs
     "ChromaDB",
+    "NumpyVectorDB",
     # Mocks
     "MockEmbedding",
     "MockVectorDB",
@@ -1,5 +1,6 @@
 """Base classes for RAG components."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
@@ -80,11 +81,7 @@ class BaseDocumentLoader(ABC):
         Returns:
             List of loaded documents
         """
-        documents = []
-        for source in sources:
-            doc = await self.load(source)
-            documents.append(doc)
-        return documents
+        return list(await asyncio.gather(*(self.load(source) for source in sources)))
 
 
 class BaseChunker(ABC):
@@ -160,3 +157,14 @@ class BaseVectorDB(ABC):
             name: Collection name
         """
         pass
+
+    async def persist(self, collection: str) -> None:
+        """Flush a collection to durable storage.
+
+        Backends that persist on every write can keep this default no-op.
+
+        Args:
+            collection: Collection name
+        """
+        # Optional hook, deliberately not abstract: most backends need no flush
+        return None
@@ -46,5 +46,7 @@ class RAGConfig(BaseSettings):
     chunking: ChunkingConfig = Field(default_factory=ChunkingConfig)
     vectordb: VectorDBConfig = Field(default_factory=VectorDBConfig)
     top_k: int = 5
+    embed_batch_size: int = 256
+    embed_concurrency: int = 4
     enable_caching: bool = True
     cache_ttl: int = 3600
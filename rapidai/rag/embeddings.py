@@ -4,6 +4,7 @@ import asyncio
 import os
 from typing import List, Optional
 
+from ..config import load_env
 from ..exceptions import EmbeddingError
 from .base import BaseEmbedding
 from .config import EmbeddingConfig
@@ -66,7 +67,8 @@ class SentenceTransformerEmbedding(BaseEmbedding):
         """
         loop = asyncio.get_event_loop()
         embeddings = await loop.run_in_executor(None, self.model.encode, texts)
-        return [emb.tolist() for emb in embeddings]
+        # One tolist() on the whole matrix instead of a call per row
+        return embeddings.tolist()
 
     @property
     def dimension(self) -> int:
@@ -90,6 +92,7 @@ class OpenAIEmbedding(BaseEmbedding):
             api_key: API key (or use OPENAI_API_KEY env var)
             **kwargs: Additional parameters
         """
+        load_env()
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise EmbeddingError(
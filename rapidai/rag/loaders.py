@@ -1,7 +1,13 @@
-"""Document loaders for RAG."""
+"""Document loaders for RAG.
 
+File reads and parsing are blocking, so each loader runs them in a worker
+thread via ``asyncio.to_thread``; loading several documents concurrently
+(e.g. from ``RAG.add_documents``) then overlaps their I/O.
+"""
+
+import asyncio
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 from ..exceptions import DocumentLoaderError
 from ..types import Document
@@ -32,22 +38,24 @@ class PDFLoader(BaseDocumentLoader):
             raise DocumentLoaderError(f"File not found: {path}")
 
         try:
-            reader = PdfReader(path)
+            return await asyncio.to_thread(self._parse, PdfReader, path)
+        except Exception as e:
+            raise DocumentLoaderError(f"Failed to load PDF {path}: {str(e)}")
 
-            content = ""
-            for page in reader.pages:
-                content += page.extract_text() + "\n\n"
+    def _parse(self, reader_class: Any, path: Path) -> Document:
+        """Read and extract a PDF (blocking)."""
+        reader = reader_class(path)
 
-            metadata = {
-                "source": str(path),
-                "type": "pdf",
-                "pages": len(reader.pages),
-                "filename": path.name,
-            }
+        content = "\n\n".join(page.extract_text() for page in reader.pages)
 
-            return Document(content=content.strip(), metadata=metadata)
-        except Exception as e:
-            raise DocumentLoaderError(f"Failed to load PDF {path}: {str(e)}")
+        metadata = {
+            "source": str(path),
+            "type": "pdf",
+            "pages": len(reader.pages),
+            "filename": path.name,
+        }
+
+        return Document(content=content.strip(), metadata=metadata)
 
 
 class DOCXLoader(BaseDocumentLoader):
@@ -74,19 +82,23 @@ class DOCXLoader(BaseDocumentLoader):
             raise DocumentLoaderError(f"File not found: {path}")
 
         try:
-            doc = DocxDocument(path)
+            return await asyncio.to_thread(self._parse, DocxDocument, path)
+        except Exception as e:
+            raise DocumentLoaderError(f"Failed to load DOCX {path}: {str(e)}")
 
-            content = "\n\n".join([para.text for para in doc.paragraphs if para.text])
+    def _parse(self, document_class: Any, path: Path) -> Document:
+        """Read and extract a DOCX file (blocking)."""
+        doc = document_class(path)
 
-            metadata = {
-                "source": str(path),
-                "type": "docx",
-                "filename": path.name,
-            }
+        content = "\n\n".join([para.text for para in doc.paragraphs if para.text])
 
-            return Document(content=content, metadata=metadata)
-        except Exception as e:
-            raise DocumentLoaderError(f"Failed to load DOCX {path}: {str(e)}")
+        metadata = {
+            "source": str(path),
+            "type": "docx",
+            "filename": path.name,
+        }
+
+        return Document(content=content, metadata=metadata)
 
 
 class TextLoader(BaseDocumentLoader):
@@ -106,8 +118,7 @@ class TextLoader(BaseDocumentLoader):
             raise DocumentLoaderError(f"File not found: {path}")
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = await asyncio.to_thread(path.read_text, encoding="utf-8")
 
             metadata = {
                 "source": str(path),
@@ -161,31 +172,35 @@ class HTMLLoader(BaseDocumentLoader):
             raise DocumentLoaderError(f"File not found: {path}")
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                html_content = f.read()
+            return await asyncio.to_thread(self._parse, BeautifulSoup, path)
+        except Exception as e:
+            raise DocumentLoaderError(f"Failed to load HTML {path}: {str(e)}")
 
-            soup = BeautifulSoup(html_content, "html.parser")
+    def _parse(self, soup_class: Any, path: Path) -> Document:
+        """Read and extract an HTML file (blocking)."""
+        with open(path, "r", encoding="utf-8") as f:
+            html_content = f.read()
 
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+        soup = soup_class(html_content, "html.parser")
 
-            content = soup.get_text(separator="\n\n")
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
 
-            # Clean up whitespace
-            lines = (line.strip() for line in content.splitlines())
-            content = "\n\n".join(line for line in lines if line)
+        content = soup.get_text(separator="\n\n")
 
-            metadata = {
-                "source": str(path),
-                "type": "html",
-                "filename": path.name,
-                "title": soup.title.string if soup.title else None,
-            }
+        # Clean up whitespace
+        lines = (line.strip() for line in content.splitlines())
+        content = "\n\n".join(line for line in lines if line)
 
-            return Document(content=content.strip(), metadata=metadata)
-        except Exception as e:
-            raise DocumentLoaderError(f"Failed to load HTML {path}: {str(e)}")
+        metadata = {
+            "source": str(path),
+            "type": "html",
+            "filename": path.name,
+            "title": soup.title.string if soup.title else None,
+        }
+
+        return Document(content=content.strip(), metadata=metadata)
 
 
 def DocumentLoader(source: Union[str, Path]) -> BaseDocumentLoader:
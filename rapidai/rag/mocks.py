@@ -22,6 +22,7 @@ class MockEmbedding(BaseEmbedding):
         super().__init__(config)
         self._dimension = dimension
         self.embed_calls = 0
+        self.batch_calls = 0
 
     async def embed_text(self, text: str) -> List[float]:
         """Return mock embedding.
@@ -46,6 +47,7 @@ class MockEmbedding(BaseEmbedding):
         Returns:
             List of mock embeddings
         """
+        self.batch_calls += 1
         return [await self.embed_text(text) for text in texts]
 
     @property
@@ -1,5 +1,6 @@
 """RAG retriever and orchestrator."""
 
+import asyncio
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -61,6 +62,37 @@ class RAG:
             )
             self._collection_initialized = True
 
+    async def _load(self, source: Union[str, Path, Document]) -> Document:
+        """Load a document from a path, or pass a Document through."""
+        if isinstance(source, (str, Path)):
+            loader = DocumentLoader(source)
+            return await loader.load(source)
+        return source
+
+    async def _embed_chunks(self, chunks: List[DocumentChunk]) -> None:
+        """Embed chunks in place using batched provider requests.
+
+        Chunks are split into groups of ``embed_batch_size`` and the groups
+        are embedded concurrently, at most ``embed_concurrency`` at a time.
+
+        Args:
+            chunks: Chunks to embed
+        """
+        size = max(1, self.config.embed_batch_size)
+        semaphore = asyncio.Semaphore(max(1, self.config.embed_concurrency))
+
+        async def embed_group(group: List[DocumentChunk]) -> None:
+            async with semaphore:
+                embeddings = await self.embedding.embed_batch(
+                    [chunk.content for chunk in group]
+                )
+            for chunk, embedding in zip(group, embeddings):
+                chunk.embedding = embedding
+
+        await asyncio.gather(
+            *(embed_group(chunks[i : i + size]) for i in range(0, len(chunks), size))
+        )
+
     async def add_document(
         self, source: Union[str, Path, Document]
     ) -> List[DocumentChunk]:
@@ -79,39 +111,17 @@ class RAG:
             print(f"Added {len(chunks)} chunks")
             ```
         """
-        await self.initialize()
-
-        # Load document if needed
-        if isinstance(source, (str, Path)):
-            loader = DocumentLoader(source)
-            document = await loader.load(source)
-        else:
-            document = source
-
-        # Chunk document
-        chunks = self.chunker.chunk(document)
-
-        # Generate embeddings
-        texts = [chunk.content for chunk in chunks]
-        embeddings = await self.embedding.embed_batch(texts)
-
-        # Attach embeddings to chunks
-        for chunk, embedding in zip(chunks, embeddings):
-            chunk.embedding = embedding
-
-        # Store in vector DB
-        await self.vectordb.add_chunks(
-            collection=self.config.vectordb.collection_name,
-            chunks=chunks,
-        )
-
-        return chunks
+        results = await self.add_documents([source])
+        return results[0]
 
     async def add_documents(
         self, sources: List[Union[str, Path, Document]]
     ) -> List[List[DocumentChunk]]:
         """Add multiple documents.
 
+        Chunks from all documents are embedded together in batched requests
+        and written to the vector database in a single call.
+
         Args:
             sources: List of file paths or Document objects
 
@@ -128,10 +138,43 @@ class RAG:
             ])
             ```
         """
-        results = []
-        for source in sources:
-            chunks = await self.add_document(source)
-            results.append(chunks)
+        await self.initialize()
+
+        documents = await asyncio.gather(*(self._load(source) for source in sources))
+        results = [self.chunker.chunk(document) for document in documents]
+        all_chunks = [chunk for chunks in results for chunk in chunks]
+
+        if all_chunks:
+            await self._embed_chunks(all_chunks)
+            await self.vectordb.add_chunks(
+                collection=self.config.vectordb.collection_name,
+                chunks=all_chunks,
+            )
+
+        return results
+
+    async def build_index(
+        self, sources: List[Union[str, Path, Document]]
+    ) -> List[List[DocumentChunk]]:
+        """Chunk, embed and store a corpus ahead of time, then persist it.
+
+        Run this once (e.g. from a build script) so the app can start from
+        the persisted index instead of re-embedding documents per request.
+
+        Args:
+            sources: List of file paths or Document objects
+
+        Returns:
+            List of chunk lists (one per document)
+
+        Example:
+            ```python
+            rag = RAG(vectordb=VectorDB(backend="numpy", persist_directory="./rag_index"))
+            await rag.build_index(["docs/manual.pdf", "docs/faq.md"])
+            ```
+        """
+        results = await self.add_documents(sources)
+        await self.vectordb.persist(self.config.vectordb.collection_name)
         return results
 
     async def retrieve(
@@ -161,10 +204,18 @@ class RAG:
         """
         await self.initialize()
 
-        k = top_k or self.config.top_k
-
         # Generate query embedding
         query_embedding = await self.embedding.embed_text(query)
+        return await self._search(query_embedding, top_k, filter_metadata)
+
+    async def _search(
+        self,
+        query_embedding: List[float],
+        top_k: Optional[int],
+        filter_metadata: Optional[Dict[str, Any]],
+    ) -> RetrievalResult:
+        """Search the vector DB and build a RetrievalResult."""
+        k = top_k or self.config.top_k
 
         # Search vector DB
         chunks = await self.vectordb.search(
@@ -188,6 +239,39 @@ class RAG:
             score=None,  # Could add relevance scoring
         )
 
+    async def retrieve_many(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[RetrievalResult]:
+        """Retrieve relevant chunks for several queries at once.
+
+        All queries are embedded in a single batched request.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query (default from config)
+            filter_metadata: Metadata filters
+
+        Returns:
+            One RetrievalResult per query, in order
+        """
+        await self.initialize()
+
+        if not queries:
+            return []
+
+        query_embeddings = await self.embedding.embed_batch(queries)
+        return list(
+            await asyncio.gather(
+                *(
+                    self._search(embedding, top_k, filter_metadata)
+                    for embedding in query_embeddings
+                )
+            )
+        )
+
     async def query(
         self,
         query: str,
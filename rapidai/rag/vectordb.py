@@ -1,5 +1,8 @@
 """Vector database implementations for RAG."""
 
+import json
+import os
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..exceptions import VectorDBError
@@ -7,6 +10,9 @@ from ..types import DocumentChunk
 from .base import BaseVectorDB
 from .mocks import MockVectorDB
 
+# Inverted-index bucket for rows whose metadata value cannot be hashed
+_UNHASHABLE = object()
+
 
 class ChromaDB(BaseVectorDB):
     """ChromaDB vector database implementation."""
@@ -139,11 +145,341 @@ class ChromaDB(BaseVectorDB):
             raise VectorDBError(f"Failed to delete collection {name}: {str(e)}")
 
 
+class NumpyVectorDB(BaseVectorDB):
+    """In-process vector database backed by a contiguous NumPy matrix.
+
+    Embeddings for each collection live in one ``(N, D)`` float32 array with
+    cached reciprocal row norms, so a search is a blocked BLAS matrix-vector
+    product, normalized in place, followed by an O(N) partial selection of
+    the top results.
+    Scalar metadata values are kept in an inverted index, so filtered
+    searches only score the rows that match the filter. With ``quantize=True``
+    embeddings are stored as int8 with a symmetric per-row scale, cutting
+    index memory by 4x; since cosine similarity is scale-invariant the
+    scales are folded into the cached row norms. With ``persist_directory``
+    set, :meth:`persist` writes ``embeddings.npy``, ``chunks.json`` and a
+    ``manifest.json`` per collection, and :meth:`create_collection` memory-maps
+    them back at startup instead of re-chunking and re-embedding the corpus.
+    """
+
+    # Rows scored per block; small enough that each block's scores stay in cache
+    _SCORE_BLOCK_ROWS = 4096
+
+    def __init__(self, persist_directory: Optional[str] = None, quantize: bool = False):
+        """Initialize NumPy vector database.
+
+        Args:
+            persist_directory: Directory to persist collections (optional)
+            quantize: Store new collections as int8 instead of float32
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise VectorDBError(
+                "numpy not installed. Install with: pip install rapidai-framework[rag]"
+            ) from e
+
+        self._np = np
+        self.persist_directory = Path(persist_directory) if persist_directory else None
+        self.quantize = quantize
+        self._embeddings: Dict[str, Any] = {}
+        self._inv_norms: Dict[str, Any] = {}
+        self._chunks: Dict[str, List[DocumentChunk]] = {}
+        self._metadata_index: Dict[str, Dict[str, Dict[Any, List[int]]]] = {}
+
+    def _inverse_row_norms(self, matrix: Any) -> Any:
+        """Compute reciprocal row L2 norms, mapping zero rows to 1."""
+        norms = self._np.linalg.norm(matrix, axis=1).astype(self._np.float32)
+        norms[norms == 0] = 1.0
+        return 1.0 / norms
+
+    def _quantize_rows(self, rows: Any) -> Any:
+        """Quantize float rows to int8 with a symmetric per-row scale."""
+        np = self._np
+        scales = np.abs(rows).max(axis=1, keepdims=True) / 127.0
+        scales[scales == 0] = 1.0
+        return np.round(rows / scales).astype(np.int8)
+
+    def _scores(self, matrix: Any, inv_norms: Any, query: Any) -> Any:
+        """Compute cosine scores ``(matrix @ query) * inv_norms`` block by block.
+
+        Each block is scored and normalized while it is still in cache, and
+        int8 rows are dequantized one block at a time, so no full-size
+        temporary is allocated besides the output buffer.
+        """
+        np = self._np
+        quantized = matrix.dtype == np.int8
+        block = self._SCORE_BLOCK_ROWS
+        scores = np.empty(matrix.shape[0], dtype=np.float32)
+
+        for start in range(0, matrix.shape[0], block):
+            stop = start + block
+            rows = matrix[start:stop]
+            if quantized:
+                rows = rows.astype(np.float32)
+            out = scores[start:stop]
+            np.matmul(rows, query, out=out)
+            out *= inv_norms[start:stop]
+
+        return scores
+
+    def _index_metadata(self, name: str, start: int, chunks: List[DocumentChunk]) -> None:
+        """Add chunk metadata to the collection's inverted index.
+
+        Hashable values are indexed by value; rows whose value is unhashable
+        (lists, dicts, ...) are kept under ``_UNHASHABLE`` and scanned when
+        filtering on that key.
+        """
+        index = self._metadata_index.setdefault(name, {})
+        for row, chunk in enumerate(chunks, start):
+            for key, value in chunk.metadata.items():
+                values = index.setdefault(key, {})
+                try:
+                    values.setdefault(value, []).append(row)
+                except TypeError:
+                    values.setdefault(_UNHASHABLE, []).append(row)
+
+    def _filter_rows(self, name: str, filter_metadata: Dict[str, Any]) -> Any:
+        """Get the sorted row ids matching every metadata filter."""
+        np = self._np
+        index = self._metadata_index.get(name, {})
+        chunks = self._chunks[name]
+
+        rows = None
+        for key, value in filter_metadata.items():
+            values = index.get(key, {})
+            try:
+                indexed = values.get(value, [])
+            except TypeError:
+                # Unhashable filter values can only equal unhashable metadata
+                indexed = []
+            unhashable = [
+                i for i in values.get(_UNHASHABLE, []) if chunks[i].metadata[key] == value
+            ]
+            matches = np.asarray(sorted(indexed + unhashable), dtype=np.intp)
+            rows = matches if rows is None else np.intersect1d(rows, matches, assume_unique=True)
+            if rows.size == 0:
+                break
+        return rows
+
+    def _collection_dir(self, name: str) -> Path:
+        """Get the on-disk directory for a collection."""
+        return self.persist_directory / name  # type: ignore[operator]
+
+    def _load(self, name: str) -> bool:
+        """Load a persisted collection, memory-mapping its embeddings.
+
+        Returns:
+            True if the collection was found on disk
+        """
+        if self.persist_directory is None:
+            return False
+
+        path = self._collection_dir(name)
+        if not (path / "manifest.json").exists():
+            return False
+
+        try:
+            with open(path / "chunks.json", encoding="utf-8") as f:
+                records = json.load(f)
+            self._embeddings[name] = self._np.load(path / "embeddings.npy", mmap_mode="r")
+        except Exception as e:
+            raise VectorDBError(f"Failed to load collection {name}: {str(e)}") from e
+
+        self._inv_norms[name] = self._inverse_row_norms(self._embeddings[name])
+
+        self._chunks[name] = [
+            DocumentChunk(content=r["content"], metadata=r["metadata"]) for r in records
+        ]
+        self._metadata_index.pop(name, None)
+        self._index_metadata(name, 0, self._chunks[name])
+        return True
+
+    async def create_collection(
+        self, name: str, dimension: int, **kwargs: Any
+    ) -> None:
+        """Create a collection, loading it from disk if it was persisted.
+
+        Args:
+            name: Collection name
+            dimension: Embedding dimension
+            **kwargs: Additional parameters
+        """
+        if name in self._embeddings or self._load(name):
+            return
+
+        dtype = self._np.int8 if self.quantize else self._np.float32
+        self._embeddings[name] = self._np.empty((0, dimension), dtype=dtype)
+        self._inv_norms[name] = self._np.empty(0, dtype=self._np.float32)
+        self._chunks[name] = []
+        self._metadata_index[name] = {}
+
+    async def add_chunks(
+        self, collection: str, chunks: List[DocumentChunk]
+    ) -> None:
+        """Add chunks to collection.
+
+        Args:
+            collection: Collection name
+            chunks: List of chunks with embeddings
+        """
+        if not chunks:
+            return
+
+        for i, chunk in enumerate(chunks):
+            if chunk.embedding is None:
+                raise VectorDBError(f"Chunk {i} has no embedding")
+
+        if collection not in self._embeddings:
+            await self.create_collection(collection, dimension=len(chunks[0].embedding))
+
+        new_rows = self._np.asarray([c.embedding for c in chunks], dtype=self._np.float32)
+        if self._embeddings[collection].dtype == self._np.int8:
+            new_rows = self._quantize_rows(new_rows)
+        try:
+            self._embeddings[collection] = self._np.concatenate(
+                [self._embeddings[collection], new_rows]
+            )
+        except ValueError as e:
+            raise VectorDBError(f"Failed to add chunks to {collection}: {str(e)}") from e
+
+        self._inv_norms[collection] = self._np.concatenate(
+            [self._inv_norms[collection], self._inverse_row_norms(new_rows)]
+        )
+
+        start = len(self._chunks[collection])
+        self._chunks[collection].extend(
+            DocumentChunk(content=c.content, metadata=c.metadata) for c in chunks
+        )
+        self._index_metadata(collection, start, chunks)
+
+    async def search(
+        self,
+        collection: str,
+        query_embedding: List[float],
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[DocumentChunk]:
+        """Search for similar chunks by cosine similarity.
+
+        Args:
+            collection: Collection name
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            filter_metadata: Optional metadata filters
+
+        Returns:
+            List of similar chunks
+        """
+        if collection not in self._embeddings:
+            raise VectorDBError(f"Search failed in {collection}: collection does not exist")
+
+        np = self._np
+        chunks = self._chunks[collection]
+        if not chunks or top_k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm:
+            query = query / query_norm
+
+        matrix = self._embeddings[collection]
+        inv_norms = self._inv_norms[collection]
+
+        # Pre-filter: only score rows whose metadata matches
+        rows = None
+        if filter_metadata:
+            rows = self._filter_rows(collection, filter_metadata)
+            if rows.size == 0:
+                return []
+            matrix = matrix[rows]
+            inv_norms = inv_norms[rows]
+
+        scores = self._scores(matrix, inv_norms, query)
+
+        # Partial selection of the k best, then sort only those k
+        n = len(scores)
+        k = min(top_k, n)
+        top = np.argpartition(scores, n - k)[n - k :] if k < n else np.arange(n)
+        top = top[np.argsort(-scores[top])]
+
+        if rows is not None:
+            top = rows[top]
+
+        return [chunks[i] for i in top]
+
+    async def delete_collection(self, name: str) -> None:
+        """Delete a collection from memory and disk.
+
+        Args:
+            name: Collection name
+        """
+        self._embeddings.pop(name, None)
+        self._inv_norms.pop(name, None)
+        self._chunks.pop(name, None)
+        self._metadata_index.pop(name, None)
+
+        if self.persist_directory is not None:
+            path = self._collection_dir(name)
+            for filename in ("embeddings.npy", "chunks.json", "manifest.json"):
+                (path / filename).unlink(missing_ok=True)
+
+    async def persist(self, collection: str) -> None:
+        """Write a collection to ``persist_directory``.
+
+        Args:
+            collection: Collection name
+        """
+        if self.persist_directory is None or collection not in self._embeddings:
+            return
+
+        path = self._collection_dir(collection)
+        matrix = self._embeddings[collection]
+        if (
+            isinstance(matrix, self._np.memmap)
+            and matrix.filename is not None
+            and Path(matrix.filename).resolve() == (path / "embeddings.npy").resolve()
+        ):
+            # Unchanged since it was loaded or last persisted
+            return
+
+        records = [
+            {"content": c.content, "metadata": c.metadata} for c in self._chunks[collection]
+        ]
+        manifest = {
+            "count": int(matrix.shape[0]),
+            "dimension": int(matrix.shape[1]),
+            "dtype": str(matrix.dtype),
+        }
+
+        # Write every file beside its target and swap it into place, manifest
+        # last, so a failed persist never leaves a partial index behind
+        names = ["embeddings.npy", "chunks.json", "manifest.json"]
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            with open(path / "embeddings.npy.tmp", "wb") as f:
+                self._np.save(f, self._np.ascontiguousarray(matrix))
+            with open(path / "chunks.json.tmp", "w", encoding="utf-8") as f:
+                json.dump(records, f)
+            with open(path / "manifest.json.tmp", "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            for name in names:
+                os.replace(path / f"{name}.tmp", path / name)
+        except Exception as e:
+            for name in names:
+                (path / f"{name}.tmp").unlink(missing_ok=True)
+            raise VectorDBError(f"Failed to persist collection {collection}: {str(e)}") from e
+
+        # Serve subsequent reads from the memory-mapped file
+        self._embeddings[collection] = self._np.load(path / "embeddings.npy", mmap_mode="r")
+
+
 def VectorDB(backend: str = "chromadb", **kwargs) -> BaseVectorDB:
     """Factory function to create vector database.
 
     Args:
-        backend: Vector database backend ("chromadb", "mock")
+        backend: Vector database backend ("chromadb", "numpy", "mock")
         **kwargs: Additional parameters for vector database
 
     Returns:
@@ -157,12 +493,17 @@ def VectorDB(backend: str = "chromadb", **kwargs) -> BaseVectorDB:
         # ChromaDB with custom directory
         vectordb = VectorDB(backend="chromadb", persist_directory="./my_data")
 
+        # In-process NumPy index, persisted to disk
+        vectordb = VectorDB(backend="numpy", persist_directory="./rag_index")
+
         # Mock for testing
         vectordb = VectorDB(backend="mock")
         ```
     """
     if backend == "chromadb":
         return ChromaDB(**kwargs)
+    elif backend == "numpy":
+        return NumpyVectorDB(**kwargs)
     elif backend == "mock":
         return MockVectorDB(**kwargs)
     else:
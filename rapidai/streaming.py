@@ -2,8 +2,7 @@
 
 import asyncio
 import json
-from typing import Any, AsyncIterator, Callable
-from functools import wraps
+from typing import Any, AsyncIterator, Callable, Optional
 
 from .types import StreamHandler
 
@@ -14,6 +13,11 @@ def stream(func: StreamHandler) -> StreamHandler:
     This decorator automatically handles SSE setup including proper headers
     and formatting of the event stream.
 
+    The handler may be an async generator, or a coroutine function that
+    returns an async iterator (e.g. the result of ``llm.chat(..., stream=True)``).
+    The handler is marked rather than wrapped, so each chunk is forwarded
+    without an extra generator hop.
+
     Example:
         ```python
         @app.route("/chat", methods=["POST"])
@@ -21,45 +25,43 @@ def stream(func: StreamHandler) -> StreamHandler:
         async def chat(message: str):
             async for chunk in llm.chat(message, stream=True):
                 yield chunk
+
+        # Or hand the provider stream straight through
+        @app.route("/chat", methods=["POST"])
+        @stream
+        async def chat(message: str):
+            return await llm.chat(message, stream=True)
         ```
 
     Args:
-        func: Async generator function that yields chunks
+        func: Async generator function that yields chunks, or coroutine
+            function returning an async iterator
 
     Returns:
-        Wrapped function that handles SSE streaming
+        The same function, marked as a streaming handler
     """
     func._is_stream = True  # type: ignore
+    return func
 
-    @wraps(func)
-    async def wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[str]:
-        """Wrapper that handles SSE streaming."""
-        async for chunk in func(*args, **kwargs):
-            yield chunk
-
-    return wrapper  # type: ignore
 
-
-async def send_sse_event(
-    send: Any,
+def format_sse_event(
     data: str,
     event: str = "message",
-    id: str = None,
-    retry: int = None,
-) -> None:
-    """Send a Server-Sent Event.
+    id: Optional[str] = None,
+    retry: Optional[int] = None,
+) -> bytes:
+    """Encode a Server-Sent Event.
 
     Args:
-        send: ASGI send callable
         data: Event data
         event: Event name (default: "message")
         id: Event ID (optional)
         retry: Retry time in milliseconds (optional)
-    """
-    message = ""
 
-    if event:
-        message += f"event: {event}\n"
+    Returns:
+        The encoded event, ready to be sent as (part of) a body message
+    """
+    message = f"event: {event}\n" if event else ""
 
     if id:
         message += f"id: {id}\n"
@@ -68,11 +70,29 @@ async def send_sse_event(
         message += f"retry: {retry}\n"
 
     message += f"data: {data}\n\n"
+    return message.encode()
+
 
+async def send_sse_event(
+    send: Any,
+    data: str,
+    event: str = "message",
+    id: Optional[str] = None,
+    retry: Optional[int] = None,
+) -> None:
+    """Send a Server-Sent Event.
+
+    Args:
+        send: ASGI send callable
+        data: Event data
+        event: Event name (default: "message")
+        id: Event ID (optional)
+        retry: Retry time in milliseconds (optional)
+    """
     await send(
         {
             "type": "http.response.body",
-            "body": message.encode(),
+            "body": format_sse_event(data, event=event, id=id, retry=retry),
             "more_body": True,
         }
     )
@@ -117,17 +137,34 @@ class StreamingResponse:
 
     This class handles the conversion of async iterators into
     proper SSE responses.
+
+    Events that arrive in quick succession (e.g. LLM tokens) are coalesced
+    into one body message, so the stream costs one ``send`` per buffer
+    instead of one per token. A buffer is sent once it reaches
+    ``flush_bytes`` or once its oldest event has waited ``flush_interval``
+    seconds, whichever comes first.
     """
 
-    def __init__(self, iterator: AsyncIterator[str], event: str = "message"):
+    def __init__(
+        self,
+        iterator: AsyncIterator[str],
+        event: str = "message",
+        flush_bytes: int = 4096,
+        flush_interval: float = 0.02,
+    ):
         """Initialize streaming response.
 
         Args:
             iterator: Async iterator that yields chunks
             event: SSE event name
+            flush_bytes: Buffer size that triggers a send
+            flush_interval: Longest time in seconds an event is held back;
+                0 sends every event as soon as it arrives
         """
         self.iterator = iterator
         self.event = event
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
 
     async def send(self, send: Any) -> None:
         """Send the streaming response.
@@ -137,18 +174,58 @@ class StreamingResponse:
         """
         await send_sse_start(send)
 
+        buffer = bytearray()
+        pending = None
         try:
-            async for chunk in self.iterator:
-                await send_sse_event(send, chunk, event=self.event)
+            iterator = self.iterator.__aiter__()
+            loop = asyncio.get_running_loop()
+            deadline = 0.0
+            while True:
+                if buffer:
+                    # Wait for the next chunk only until the buffer is due
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                    done, _ = await asyncio.wait(
+                        {pending}, timeout=deadline - loop.time()
+                    )
+                    if not done:
+                        await self._flush(send, buffer)
+                    chunk = await pending
+                else:
+                    chunk = await iterator.__anext__()
+
+                if not buffer:
+                    deadline = loop.time() + self.flush_interval
+                buffer += format_sse_event(chunk, event=self.event)
+                if len(buffer) >= self.flush_bytes or self.flush_interval <= 0:
+                    await self._flush(send, buffer)
+
+        except StopAsyncIteration:
+            pass
 
         except Exception as e:
             # Send error event
             error_data = json.dumps({"error": str(e)})
-            await send_sse_event(send, error_data, event="error")
+            buffer += format_sse_event(error_data, event="error")
 
         finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+            if buffer:
+                await self._flush(send, buffer)
             await send_sse_end(send)
 
+    @staticmethod
+    async def _flush(send: Any, buffer: bytearray) -> None:
+        """Send the buffered events as one body message and empty the buffer."""
+        await send(
+            {
+                "type": "http.response.body",
+                "body": bytes(buffer),
+                "more_body": True,
+            }
+        )
+        buffer.clear()
+
 
 def is_stream_handler(func: Callable) -> bool:
     """Check if a function is a stream handler.
@@ -4,11 +4,14 @@ from functools import wraps
 from typing import Any, Callable
 
 
-def page(route: str) -> Callable:
+def page(route: str, static: bool = False) -> Callable:
     """Decorator to serve an HTML page at a route.
 
     Args:
         route: Route path (e.g., "/", "/chat")
+        static: Whether the page is identical on every request. Static pages
+            take no parameters; the app renders them once, keeps the encoded
+            response, and serves it without running middleware.
 
     Returns:
         Decorator function
@@ -40,6 +43,19 @@ def page(route: str) -> Callable:
                 "body": html,
             }
 
+        wrapper._is_static_page = static  # type: ignore
         return wrapper
 
     return decorator
+
+
+def is_static_page(func: Callable) -> bool:
+    """Check if a function is a static page handler.
+
+    Args:
+        func: Function to check
+
+    Returns:
+        True if the function was decorated with ``@page(..., static=True)``
+    """
+    return getattr(func, "_is_static_page", False)
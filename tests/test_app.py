@@ -1,6 +1,9 @@
 """Tests for the App class."""
 
+from typing import Dict
+
 import pytest
+
 from rapidai import App
 
 
@@ -56,3 +59,363 @@ async def test_memory_manager():
     # Test that same user gets same memory instance
     memory2 = app.memory("user123")
     assert memory is memory2
+
+
+@pytest.mark.asyncio
+async def test_raw_response_dict(app, test_client):
+    """Test that status/headers/body dicts are sent as-is."""
+
+    @app.route("/page")
+    async def page_route():
+        return {
+            "status": 201,
+            "headers": {"Content-Type": "text/html; charset=utf-8"},
+            "body": b"<h1>Hi</h1>",
+        }
+
+    response = await test_client.get("/page")
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.text == "<h1>Hi</h1>"
+
+
+@pytest.mark.asyncio
+async def test_static_page_rendered_once(app, test_client):
+    """Test that a static page is rendered on the first request only."""
+    from rapidai.ui import page
+
+    calls = []
+
+    @app.route("/static")
+    @page("/static", static=True)
+    async def static_page():
+        calls.append(1)
+        return "<h1>Static</h1>"
+
+    first = await test_client.get("/static")
+    second = await test_client.get("/static")
+
+    assert len(calls) == 1
+    assert second.status_code == 200
+    assert second.headers["content-type"] == "text/html; charset=utf-8"
+    assert first.text == second.text == "<h1>Static</h1>"
+
+
+@pytest.mark.asyncio
+async def test_annotated_handlers_use_specialized_sender(app, test_client):
+    """Test that return annotations pick the response sender at registration."""
+
+    @app.route("/text")
+    async def text_route() -> str:
+        return "plain"
+
+    @app.route("/data")
+    async def data_route() -> Dict[str, int]:
+        return {"count": 1}
+
+    assert app._find_route("/text", "GET")[0].sender == app._send_text
+    assert app._find_route("/data", "GET")[0].sender == app._send_dict
+
+    text = await test_client.get("/text")
+    assert text.headers["content-type"] == "text/plain"
+    assert text.text == "plain"
+
+    data = await test_client.get("/data")
+    assert data.json() == {"count": 1}
+
+
+@pytest.mark.asyncio
+async def test_msgspec_struct_response(app, test_client):
+    """Test that msgspec structs are encoded as JSON."""
+    msgspec = pytest.importorskip("msgspec")
+
+    class Health(msgspec.Struct):
+        status: str
+
+    @app.route("/health")
+    async def health() -> Health:
+        return Health(status="healthy")
+
+    assert app._find_route("/health", "GET")[0].sender == app._send_struct
+
+    response = await test_client.get("/health")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_static_json_route(app, test_client):
+    """Test that a static route runs its handler once and replays the JSON."""
+    calls = []
+
+    @app.route("/health", static=True)
+    async def health():
+        calls.append(1)
+        return {"status": "healthy"}
+
+    for _ in range(2):
+        response = await test_client.get("/health")
+        assert response.json() == {"status": "healthy"}
+    assert len(calls) == 1
+
+    missing = await test_client.get("/missing")
+    assert missing.status_code == 404
+    assert missing.json() == {"error": "Not Found"}
+
+
+@pytest.mark.asyncio
+async def test_json_response_serializes_datetimes(app, test_client):
+    """Test that datetimes in JSON responses are encoded as ISO strings."""
+    from datetime import datetime
+
+    created = datetime(2024, 1, 2, 3, 4, 5)
+
+    @app.route("/job")
+    async def job_route():
+        return {"created_at": created, "counts": {1: "one"}}
+
+    response = await test_client.get("/job")
+    assert response.status_code == 200
+    assert response.json() == {
+        "created_at": "2024-01-02T03:04:05",
+        "counts": {"1": "one"},
+    }
+
+
+def test_run_passes_event_loop(app, monkeypatch):
+    """Test that run() forwards the event loop choice to uvicorn."""
+    import uvicorn
+
+    calls = []
+    monkeypatch.setattr(uvicorn, "run", lambda *args, **kwargs: calls.append(kwargs))
+
+    app.run()
+    app.run(loop="asyncio")
+
+    assert calls[0]["loop"] == "auto"
+    assert calls[1]["loop"] == "asyncio"
+
+
+@pytest.mark.asyncio
+async def test_route_dispatch(app, test_client):
+    """Test static, parameterized and method-based route dispatch."""
+
+    @app.route("/users/<user_id>")
+    async def get_user(user_id: str):
+        return {"user_id": user_id}
+
+    @app.route("/users/me")
+    async def get_me():
+        return {"user_id": "me"}
+
+    @app.route("/users/<user_id>/posts/<post_id>", methods=["POST"])
+    async def get_post(user_id: str, post_id: str):
+        return {"user_id": user_id, "post_id": post_id}
+
+    assert (await test_client.get("/users/me")).json() == {"user_id": "me"}
+    assert (await test_client.get("/users/42")).json() == {"user_id": "42"}
+    response = await test_client.post("/users/42/posts/7")
+    assert response.json() == {"user_id": "42", "post_id": "7"}
+    assert (await test_client.get("/users/42/posts/7")).status_code == 404
+    assert (await test_client.get("/users/42/extra")).status_code == 404
+
+    # Routes added after the first request join the dispatch regex
+    @app.route("/teams/<team_id>/users/<user_id>")
+    async def get_member(team_id: str, user_id: str):
+        return {"team_id": team_id, "user_id": user_id}
+
+    response = await test_client.get("/teams/a/users/b")
+    assert response.json() == {"team_id": "a", "user_id": "b"}
+    assert (await test_client.get("/users/42")).json() == {"user_id": "42"}
+
+
+@pytest.mark.asyncio
+async def test_route_resolves_signature_at_registration(app, test_client):
+    """Test that handler parameters are resolved once and applied per request."""
+
+    @app.route("/greet", methods=["POST"])
+    async def greet(name: str, greeting: str = "Hello"):
+        return {"message": f"{greeting}, {name}!"}
+
+    route = app._routes[-1]
+    assert route.required == ("name",)
+    assert route.defaults == {"greeting": "Hello"}
+
+    response = await test_client.post("/greet", json={"name": "Ada"})
+    assert response.json() == {"message": "Hello, Ada!"}
+    response = await test_client.post("/greet", json={"name": "Ada", "greeting": "Hi"})
+    assert response.json() == {"message": "Hi, Ada!"}
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_body_is_ignored(app, test_client):
+    """Test that a malformed JSON body falls back to query parameters."""
+
+    @app.route("/echo", methods=["POST"])
+    async def echo(text: str = "default"):
+        return {"text": text}
+
+    response = await test_client.post("/echo?text=query", content=b"{not json")
+    assert response.json() == {"text": "query"}
+
+
+@pytest.mark.asyncio
+async def test_receive_body_joins_chunks(app):
+    """Test that multi-message request bodies are reassembled in order."""
+    messages = [
+        {"type": "http.request", "body": b'{"a": ', "more_body": True},
+        {"type": "http.request", "body": b"", "more_body": True},
+        {"type": "http.request", "body": b"1}", "more_body": False},
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    assert await app._receive_body(receive) == b'{"a": 1}'
+
+
+def test_parse_request_query_string(app):
+    """Test query parsing keeps single values scalar and collects repeats."""
+    scope = {"query_string": b"q=rapid&tag=a&tag=b&tag=c&empty="}
+
+    assert app._parse_request(scope, b"") == {"q": "rapid", "tag": ["a", "b", "c"]}
+
+
+@pytest.mark.asyncio
+async def test_middleware_order_and_late_registration(app, test_client):
+    """Test middleware runs in registration order, including ones added later."""
+    calls = []
+
+    def make_middleware(name):
+        async def middleware(request, next):
+            calls.append(f"{name}:before")
+            response = await next()
+            calls.append(f"{name}:after")
+            return response
+
+        return middleware
+
+    @app.route("/mw")
+    async def handler():
+        calls.append("handler")
+        return {"ok": True}
+
+    app.use(make_middleware("first"))
+    await test_client.get("/mw")
+    assert calls == ["first:before", "handler", "first:after"]
+
+    calls.clear()
+    app.use(make_middleware("second"))
+    await test_client.get("/mw")
+    assert calls == [
+        "first:before",
+        "second:before",
+        "handler",
+        "second:after",
+        "first:after",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_route_response_cache(app, test_client):
+    """Test that a route-level cache answers repeated messages."""
+    from rapidai.cache import InMemoryCache
+
+    calls = []
+
+    @app.route("/ask", methods=["POST"], cache=InMemoryCache())
+    async def ask(message: str, style: str = "plain"):
+        calls.append(message)
+        return {"response": f"{style}:{message}"}
+
+    first = await test_client.post("/ask", json={"message": "hi"})
+    second = await test_client.post("/ask", json={"message": "hi"})
+    other = await test_client.post("/ask", json={"message": "bye"})
+
+    assert first.json() == second.json() == {"response": "plain:hi"}
+    assert other.json() == {"response": "plain:bye"}
+    assert calls == ["hi", "bye"]
+    assert app._routes[-1].defaults == {"style": "plain"}
+
+
+@pytest.mark.asyncio
+async def test_route_response_cache_is_scoped_to_the_route(app, test_client):
+    """Test that routes sharing a cache backend do not answer for each other."""
+    from rapidai.cache import InMemoryCache
+
+    shared = InMemoryCache()
+
+    @app.route("/summarize", methods=["POST"], cache=shared)
+    async def summarize(message: str):
+        return {"summary": message}
+
+    @app.route("/translate", methods=["POST"], cache=shared)
+    async def translate(message: str):
+        return {"translation": message}
+
+    summary = await test_client.post("/summarize", json={"message": "hi"})
+    translation = await test_client.post("/translate", json={"message": "hi"})
+
+    assert summary.json() == {"summary": "hi"}
+    assert translation.json() == {"translation": "hi"}
+
+
+@pytest.mark.asyncio
+async def test_route_response_cache_runs_slow_backends_off_loop(app, test_client):
+    """Test that backends other than InMemoryCache are not called on the event loop."""
+    import threading
+
+    from rapidai.cache import CacheBackend
+
+    class RecordingCache(CacheBackend):
+        def __init__(self):
+            self.data = {}
+            self.threads = []
+
+        def get(self, key):
+            self.threads.append(threading.get_ident())
+            return self.data.get(key)
+
+        def set(self, key, value, ttl=3600):
+            self.threads.append(threading.get_ident())
+            self.data[key] = value
+
+    backend = RecordingCache()
+
+    @app.route("/ask", methods=["POST"], cache=backend)
+    async def ask(message: str):
+        return {"response": message}
+
+    await test_client.post("/ask", json={"message": "hi"})
+    cached = await test_client.post("/ask", json={"message": "hi"})
+
+    assert cached.json() == {"response": "hi"}
+    assert list(backend.data) == ["/ask hi"]
+    assert len(backend.threads) == 3
+    assert threading.get_ident() not in backend.threads
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shutdown_flushes_memory(app, monkeypatch):
+    """Test that shutdown waits for deferred memory writes and reports failures."""
+    from rapidai.exceptions import MemoryError
+
+    async def failing_flush():
+        raise MemoryError("Redis write error")
+
+    monkeypatch.setattr(app._memory_manager, "flush", failing_flush)
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app({"type": "lifespan"}, receive, send)
+
+    assert sent == [
+        {"type": "lifespan.startup.complete"},
+        {"type": "lifespan.shutdown.failed", "message": "Redis write error"},
+    ]
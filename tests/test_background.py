@@ -6,13 +6,47 @@ from datetime import datetime, timedelta
 
 from rapidai.background import (
     background,
+    BackgroundJob,
     JobStatus,
     JobResult,
     InMemoryQueue,
+    JobError,
+    RedisQueue,
     get_queue,
+    resolve_job_function,
 )
 
 
+# Job functions for RedisQueue workers must be importable by path
+_flaky_calls = []
+
+
+async def flaky_job(value):
+    _flaky_calls.append(value)
+    if len(_flaky_calls) == 1:
+        raise ValueError("first attempt fails")
+    return value * 2
+
+
+async def failing_job():
+    raise ValueError("always fails")
+
+
+async def slow_job():
+    await asyncio.sleep(0.05)
+    return "done"
+
+
+@background(queue=InMemoryQueue())
+def sync_background_job(value):
+    return value + 1
+
+
+@background(queue=InMemoryQueue())
+async def async_background_job(value):
+    return value * 3
+
+
 class TestJobDecorator:
     """Test @background decorator."""
 
@@ -29,6 +63,18 @@ class TestJobDecorator:
         assert hasattr(test_job, "get_result")
         assert hasattr(test_job, "cancel")
 
+    @pytest.mark.asyncio
+    async def test_background_job_runs_directly(self):
+        """Calling the decorated function should run it and keep its metadata."""
+
+        @background(max_retries=1)
+        def add_one(x: int):
+            return x + 1
+
+        assert isinstance(add_one, BackgroundJob)
+        assert add_one.__name__ == "add_one"
+        assert await add_one(1) == 2
+
     @pytest.mark.asyncio
     async def test_enqueue_job(self):
         """Should enqueue job and return job ID."""
@@ -244,6 +290,196 @@ class TestInMemoryQueue:
         assert len(completed_jobs) > 0
         assert all(j.status == JobStatus.COMPLETED for j in completed_jobs)
 
+    @pytest.mark.asyncio
+    async def test_status_index_follows_transitions(self, queue):
+        """Status listings should track jobs as they move between states."""
+        release = asyncio.Event()
+
+        async def blocked():
+            await release.wait()
+
+        await queue.enqueue("first", blocked, (), {}, max_retries=1)
+        await queue.enqueue("second", blocked, (), {}, max_retries=1)
+        await asyncio.sleep(0)
+
+        running = await queue.list_jobs(status=JobStatus.RUNNING)
+        assert [j.job_id for j in running] == ["second", "first"]
+        assert [j.job_id for j in await queue.list_jobs()] == ["second", "first"]
+
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert await queue.list_jobs(status=JobStatus.RUNNING) == []
+        completed = await queue.list_jobs(status=JobStatus.COMPLETED)
+        assert {j.job_id for j in completed} == {"first", "second"}
+
+    def test_retry_delay_uses_full_jitter(self):
+        """Retry delays should be seeded-reproducible and within the capped window."""
+        import random
+
+        def delays():
+            queue = InMemoryQueue(retry_cap=5.0, rng=random.Random(42))
+            return [queue._retry_delay(attempt) for attempt in range(1, 6)]
+
+        assert delays() == delays()
+        assert all(0 <= d <= min(5.0, 2 ** a) for a, d in enumerate(delays(), start=1))
+
+
+class TestRedisQueue:
+    """Test RedisQueue workers against an in-process Redis with Lua support."""
+
+    @pytest.fixture
+    def queue(self, monkeypatch):
+        """Create a RedisQueue backed by fakeredis."""
+        pytest.importorskip("msgpack")
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        import redis.asyncio
+
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(
+            redis.asyncio,
+            "from_url",
+            lambda url, **kwargs: fakeredis.FakeAsyncRedis(server=server, **kwargs),
+        )
+        queue = RedisQueue()
+        monkeypatch.setattr(queue, "_retry_delay", lambda attempt: 0.0)
+        return queue
+
+    async def _lists(self, queue):
+        return (
+            await queue.client.lrange(queue._queue_key, 0, -1),
+            await queue.client.lrange(queue._processing_key, 0, -1),
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_is_requeued_then_completes(self, queue):
+        """A failing attempt should go back on the queue and succeed on retry."""
+        _flaky_calls.clear()
+        await queue.enqueue("job1", flaky_job, (21,), {}, max_retries=3)
+
+        assert await queue.run_next() is True
+        result = await queue.get_result("job1")
+        assert result.status == JobStatus.PENDING
+        assert result.attempts == 1
+        assert result.error == "first attempt fails"
+        assert await self._lists(queue) == ([b"job1"], [])
+
+        assert await queue.run_next() is True
+        result = await queue.get_result("job1")
+        assert result.status == JobStatus.COMPLETED
+        assert result.result == 42
+        assert result.attempts == 2
+        assert await self._lists(queue) == ([], [])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "job, expected",
+        [(sync_background_job, 2), (async_background_job, 3)],
+    )
+    async def test_runs_background_decorated_jobs(self, queue, job, expected):
+        """@background jobs should run the undecorated function, sync or async."""
+        await queue.enqueue("job1", job.func, (1,), {}, max_retries=1)
+
+        assert await queue.run_next() is True
+        result = await queue.get_result("job1")
+        assert result.status == JobStatus.COMPLETED
+        assert result.result == expected
+        assert result.attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_job_fails_after_max_retries(self, queue):
+        """The last allowed attempt should mark the job failed, not requeue it."""
+        await queue.enqueue("job1", failing_job, (), {}, max_retries=1)
+
+        assert await queue.run_next() is True
+        result = await queue.get_result("job1")
+        assert result.status == JobStatus.FAILED
+        assert result.error == "always fails"
+        assert result.completed_at is not None
+        assert await self._lists(queue) == ([], [])
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_backoff_is_not_requeued(self, queue, monkeypatch):
+        """A job cancelled while waiting to retry should stay cancelled."""
+        monkeypatch.setattr(queue, "_retry_delay", lambda attempt: 0.05)
+        await queue.enqueue("job1", failing_job, (), {}, max_retries=3)
+
+        worker = asyncio.create_task(queue.run_next())
+        await asyncio.sleep(0.01)
+        assert await queue.cancel("job1") is True
+        assert await worker is True
+
+        assert (await queue.get_result("job1")).status == JobStatus.CANCELLED
+        assert await self._lists(queue) == ([], [])
+        assert await queue.run_next(timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_running_is_not_overwritten(self, queue):
+        """A job cancelled mid-run should not be marked completed afterwards."""
+        await queue.enqueue("job1", slow_job, (), {})
+
+        worker = asyncio.create_task(queue.run_next())
+        await asyncio.sleep(0.01)
+        assert await queue.cancel("job1") is True
+        assert await worker is True
+
+        result = await queue.get_result("job1")
+        assert result.status == JobStatus.CANCELLED
+        assert result.result is None
+        assert await self._lists(queue) == ([], [])
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_skipped(self, queue):
+        """A job cancelled before a worker claims it should never run."""
+        await queue.enqueue("job1", failing_job, (), {}, max_retries=1)
+        assert await queue.cancel("job1") is True
+
+        assert await queue.run_next(timeout=0.01) is False
+        assert (await queue.get_result("job1")).status == JobStatus.CANCELLED
+        assert await self._lists(queue) == ([], [])
+
+    @pytest.mark.asyncio
+    async def test_work_runs_queued_jobs(self, queue):
+        """work() should keep claiming and running jobs until cancelled."""
+        _flaky_calls[:] = ["skip the failing first call"]
+        await queue.enqueue("job1", flaky_job, (1,), {})
+        await queue.enqueue("job2", flaky_job, (2,), {})
+
+        worker = asyncio.create_task(queue.work(timeout=0.01))
+        for _ in range(100):
+            jobs = await queue.list_jobs(status=JobStatus.COMPLETED)
+            if len(jobs) == 2:
+                break
+            await asyncio.sleep(0.01)
+        worker.cancel()
+
+        assert {job.result for job in jobs} == {2, 4}
+
+    def test_redis_timestamps_round_trip_as_nanoseconds(self):
+        """Nanosecond epoch timestamps stored in Redis should read back as datetimes."""
+        from rapidai.background import _from_ns
+
+        moment = datetime(2024, 5, 6, 7, 8, 9, 123456)
+        stored = str(int(moment.timestamp()) * 1_000_000_000 + 123456789).encode()
+
+        assert _from_ns(stored) == moment
+
+    def test_resolve_job_function(self):
+        """Stored import paths should resolve back to the function."""
+        assert resolve_job_function("rapidai.background:get_queue") is get_queue
+        assert (
+            resolve_job_function(f"{__name__}:sync_background_job")
+            is sync_background_job.func
+        )
+        assert (
+            resolve_job_function("rapidai.background:InMemoryQueue._retry_delay")
+            is InMemoryQueue._retry_delay
+        )
+        with pytest.raises(JobError) as exc_info:
+            resolve_job_function("rapidai.background:missing")
+        assert isinstance(exc_info.value.__cause__, AttributeError)
+
 
 class TestQueueFactory:
     """Test get_queue factory function."""
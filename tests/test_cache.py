@@ -1,8 +1,10 @@
 """Tests for caching system."""
 
-import pytest
 import asyncio
-from rapidai.cache import InMemoryCache, CacheManager, cache
+
+import pytest
+
+from rapidai.cache import CacheManager, InMemoryCache, cache
 
 
 def test_in_memory_cache():
@@ -52,6 +54,30 @@ def test_cache_clear():
     assert cache_backend.get("key2") is None
 
 
+def test_cache_evicts_least_recently_used():
+    """Test that the in-memory cache stays within max_entries."""
+    cache_backend = InMemoryCache(max_entries=2)
+
+    cache_backend.set("key1", "value1")
+    cache_backend.set("key2", "value2")
+    cache_backend.get("key1")
+    cache_backend.set("key3", "value3")
+
+    assert cache_backend.get("key1") == "value1"
+    assert cache_backend.get("key2") is None
+    assert cache_backend.get("key3") == "value3"
+
+
+def test_cache_sweeps_expired_entries_on_set():
+    """Test that expired entries are removed without being read."""
+    cache_backend = InMemoryCache()
+
+    cache_backend.set("stale", "value", ttl=-1)
+    cache_backend.set("fresh", "value")
+
+    assert "stale" not in cache_backend._cache
+
+
 @pytest.mark.asyncio
 async def test_cache_decorator():
     """Test cache decorator."""
@@ -95,3 +121,159 @@ async def test_cache_decorator_different_args():
     await add(2, 3)  # Different args - not cached
 
     assert call_count == 2
+
+
+class _FakeSentenceTransformer:
+    """Deterministic stand-in for sentence_transformers.SentenceTransformer."""
+
+    def __init__(self, model_name: str) -> None:
+        self.encode_calls = 0
+
+    def encode(self, text, batch_size=32):
+        import numpy as np
+
+        self.encode_calls += 1
+        if isinstance(text, list):
+            return np.stack([self._encode_one(t) for t in text])
+        return self._encode_one(text)
+
+    @staticmethod
+    def _encode_one(text):
+        import numpy as np
+
+        vec = np.zeros(8, dtype=np.float32)
+        for word in text.lower().split():
+            vec[sum(map(ord, word)) % 8] += 1.0
+        return vec
+
+
+@pytest.fixture
+def semantic_cache(monkeypatch):
+    """Create a SemanticCache backed by the fake encoder."""
+    import sys
+    import types
+
+    pytest.importorskip("numpy")
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = _FakeSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+
+    from rapidai.cache import SemanticCache
+
+    return SemanticCache(threshold=0.95)
+
+
+def test_semantic_cache_exact_match_skips_embedding(semantic_cache):
+    """Normalized exact matches are served without embedding the query."""
+    semantic_cache.set("Summarize this text.", "summary", ttl=60)
+    calls = semantic_cache.model.encode_calls
+
+    assert semantic_cache.get("  summarize   THIS text. ") == "summary"
+    assert semantic_cache.model.encode_calls == calls
+
+
+def test_semantic_cache_similar_match(semantic_cache):
+    """Near-identical prompts hit via embedding similarity."""
+    semantic_cache.set("summarize the quarterly report", "summary", ttl=60)
+
+    assert semantic_cache.get("the quarterly report summarize") == "summary"
+    assert semantic_cache.get("completely unrelated question here") is None
+
+
+def test_semantic_cache_delete_and_expiry(semantic_cache):
+    """Deleted and expired entries leave the embedding matrix compact."""
+    semantic_cache.set("first prompt here", "first", ttl=60)
+    semantic_cache.set("second prompt here", "second", ttl=60)
+    semantic_cache.set("third prompt here", "third", ttl=-1)
+
+    semantic_cache.delete("first prompt here")
+    assert semantic_cache.get("here prompt second") == "second"
+    assert semantic_cache._keys == ["second prompt here"]
+    assert semantic_cache.get("first prompt here") is None
+
+
+def test_semantic_cache_quantized_scores_match_float(semantic_cache):
+    """int8 storage scores within rounding error of float32 storage."""
+    import numpy as np
+
+    from rapidai.cache import SemanticCache
+
+    quantized = SemanticCache(threshold=0.95, quantize=True)
+    for instance in (semantic_cache, quantized):
+        instance.set("summarize the quarterly report", "summary", ttl=60)
+        instance.set("translate this sentence", "translation", ttl=60)
+
+    query = quantized._embed("summarize the report")
+    assert quantized._embeddings.dtype == np.int8
+    np.testing.assert_allclose(
+        quantized._similarities(2, query),
+        semantic_cache._similarities(2, query),
+        atol=0.01,
+    )
+    assert quantized.get("the quarterly report summarize") == "summary"
+
+
+def test_semantic_cache_set_many_embeds_in_one_call(semantic_cache):
+    """Bulk inserts embed all keys in a single model call."""
+    calls = semantic_cache.model.encode_calls
+    semantic_cache.set_many(
+        {"summarize the quarterly report": "summary", "translate this sentence": "translation"},
+        ttl=60,
+    )
+
+    assert semantic_cache.model.encode_calls == calls + 1
+    assert semantic_cache.get("the quarterly report summarize") == "summary"
+    assert semantic_cache.get("this sentence translate") == "translation"
+
+
+def test_semantic_cache_preallocates_capacity(semantic_cache):
+    """The embedding matrix is allocated at the requested capacity once."""
+    from rapidai.cache import SemanticCache
+
+    cache = SemanticCache(threshold=0.95, capacity=64)
+    cache.set_many({f"prompt number {i}": i for i in range(40)}, ttl=60)
+    matrix = cache._embeddings
+    cache.set("one more prompt", "extra", ttl=60)
+
+    assert matrix.shape[0] == 64
+    assert cache._embeddings is matrix
+
+
+def test_make_key_is_stable_with_and_without_speedups(monkeypatch):
+    """Test that cache keys are deterministic with or without orjson/xxhash."""
+    import sys
+
+    cache_module = sys.modules["rapidai.cache"]
+
+    manager = CacheManager()
+    key = manager._make_key("fn", "text", n=1)
+    assert key == manager._make_key("fn", "text", n=1)
+    assert key != manager._make_key("fn", "text", n=2)
+
+    monkeypatch.setattr(cache_module, "xxhash", None)
+    assert manager._make_key("fn", "text", n=1) == manager._make_key("fn", "text", n=1)
+
+    monkeypatch.setattr(cache_module, "orjson", None)
+    assert manager._make_key("fn", n=1, m=2) == manager._make_key("fn", m=2, n=1)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_make_key_falls_back_for_non_json_arguments(monkeypatch, use_orjson):
+    """Test that arguments plain JSON cannot encode still get distinct keys."""
+    import sys
+
+    cache_module = sys.modules["rapidai.cache"]
+
+    if not use_orjson:
+        monkeypatch.setattr(cache_module, "orjson", None)
+        monkeypatch.setattr(cache_module, "xxhash", None)
+    manager = CacheManager()
+
+    key = manager._make_key("fn", {1: "a"})
+    assert key == manager._make_key("fn", {1: "a"})
+    assert key != manager._make_key("fn", {"1": "a"})
+    assert manager._make_key("fn", {1: "a", 2: "b"}) == manager._make_key("fn", {2: "b", 1: "a"})
+    assert manager._make_key("fn", {1: "a", "x": {"1": "b"}}) != manager._make_key(
+        "fn", {1: "a", "x": {1: "b"}}
+    )
+    assert manager._make_key("fn", 1) != manager._make_key("fn", True)
@@ -0,0 +1,59 @@
+"""Tests for configuration loading."""
+
+import pytest
+from pydantic import ValidationError
+
+from rapidai.config import RapidAIConfig
+
+
+def test_load_is_cached_until_reset(monkeypatch):
+    """Test that load() reuses one instance until the cache is reset."""
+    RapidAIConfig.reset_cache()
+    first = RapidAIConfig.load()
+    assert RapidAIConfig.load() is first
+
+    monkeypatch.setenv("RAPIDAI_PORT", "9001")
+    assert RapidAIConfig.load().server.port == first.server.port
+
+    RapidAIConfig.reset_cache()
+    assert RapidAIConfig.load().server.port == 9001
+    RapidAIConfig.reset_cache()
+
+
+def test_rag_config_is_built_on_first_access():
+    """Test that RAG settings are kept raw until rag is read."""
+    config = RapidAIConfig(rag={"top_k": 9})
+
+    assert config.rag_settings == {"top_k": 9}
+    assert config.rag.top_k == 9
+    assert config.rag is config.rag
+
+
+def test_rag_config_instance_is_accepted():
+    """Test that a ready RAGConfig can still be passed as rag."""
+    from rapidai.rag.config import RAGConfig
+
+    rag = RAGConfig(top_k=3)
+    config = RapidAIConfig(rag=rag)
+
+    assert config.rag is rag
+    with pytest.raises(ValidationError):
+        RapidAIConfig(rag="top_k=3")
+
+
+def test_loaded_config_is_read_only():
+    """Test that the shared config returned by load() cannot be mutated."""
+    config = RapidAIConfig.load()
+    with pytest.raises(ValidationError):
+        config.server.port = 1
+
+
+def test_config_import_does_not_load_rag():
+    """Test that importing the config module leaves the RAG package unloaded."""
+    import subprocess
+    import sys
+
+    code = "import sys, rapidai.config; print('rapidai.rag' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
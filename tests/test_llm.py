@@ -1,6 +1,7 @@
 """Tests for LLM functionality."""
 
 import pytest
+
 from rapidai import MockLLM
 from rapidai.config import LLMConfig
 from rapidai.llm import _detect_provider
@@ -62,3 +63,199 @@ def test_provider_detection_failure():
     """Test provider detection with unknown model."""
     with pytest.raises(Exception):
         _detect_provider("unknown-model-xyz")
+
+
+def test_anthropic_instances_share_client(monkeypatch):
+    """Test that instances with the same API key reuse one SDK client."""
+    import sys
+    import types
+
+    from rapidai.llm import AnthropicLLM
+    from rapidai.llm import base as base_module
+
+    fake_sdk = types.ModuleType("anthropic")
+    fake_sdk.AsyncAnthropic = lambda api_key, http_client, timeout: types.SimpleNamespace(
+        http_client=http_client
+    )
+    monkeypatch.setitem(sys.modules, "anthropic", fake_sdk)
+    monkeypatch.setattr(base_module, "_loop_objects", {})
+
+    first = AnthropicLLM(model="claude-3-haiku-20240307", api_key="key-a")
+    second = AnthropicLLM(model="claude-3-5-sonnet-20241022", api_key="key-a")
+    other = AnthropicLLM(model="claude-3-haiku-20240307", api_key="key-b")
+
+    assert first.client is second.client
+    assert first.client is not other.client
+    assert first.client.http_client is other.client.http_client
+
+
+def test_shared_http_client_is_per_event_loop(monkeypatch):
+    """Test that each event loop gets its own HTTP pool with the configured timeout."""
+    import asyncio
+
+    from rapidai.llm import base as base_module
+    from rapidai.llm.base import close_shared_http_clients, shared_http_client
+
+    monkeypatch.setattr(base_module, "_loop_objects", {})
+
+    async def use_client():
+        client = shared_http_client(12.5)
+        assert shared_http_client(12.5) is client
+        assert client.timeout.read == 12.5
+        await close_shared_http_clients()
+        assert client.is_closed
+        return client
+
+    assert asyncio.run(use_client()) is not asyncio.run(use_client())
+    assert not base_module._loop_objects
+
+
+@pytest.mark.asyncio
+async def test_batched_text_stream_coalesces_fragments():
+    """Test that streamed fragments are joined by size and on idle."""
+    import asyncio
+
+    from rapidai.llm.base import batched_text_stream
+
+    async def fragments():
+        for text in ["a", "b", "c", "d", "e"]:
+            yield text
+        await asyncio.sleep(0.05)
+        yield "f"
+
+    chunks = [
+        chunk
+        async for chunk in batched_text_stream(fragments(), max_chars=2, max_delay=0.01)
+    ]
+
+    assert chunks == ["ab", "cd", "e", "f"]
+
+
+@pytest.mark.asyncio
+async def test_anthropic_limits_concurrent_requests(monkeypatch):
+    """Test that max_concurrency bounds in-flight provider calls."""
+    import asyncio
+    import sys
+    import types
+
+    from rapidai.llm import AnthropicLLM
+    from rapidai.llm import base as base_module
+
+    active = peak = 0
+
+    async def create(**kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return types.SimpleNamespace(content=[types.SimpleNamespace(text="ok")])
+
+    fake_sdk = types.ModuleType("anthropic")
+    fake_sdk.AsyncAnthropic = lambda api_key, http_client, timeout: types.SimpleNamespace(
+        messages=types.SimpleNamespace(create=create)
+    )
+    monkeypatch.setitem(sys.modules, "anthropic", fake_sdk)
+    monkeypatch.setattr(base_module, "_loop_objects", {})
+
+    llm = AnthropicLLM(api_key="key", max_concurrency=2)
+    replies = await asyncio.gather(*(llm.chat("hi") for _ in range(6)))
+
+    assert replies == ["ok"] * 6
+    assert peak == 2
+
+
+def test_concurrency_limit_works_across_event_loops(monkeypatch):
+    """Test an LLM built outside any loop under repeated asyncio.run calls."""
+    import asyncio
+    import sys
+    import types
+
+    from rapidai.llm import AnthropicLLM
+    from rapidai.llm import base as base_module
+
+    async def create(**kwargs):
+        await asyncio.sleep(0.001)
+        return types.SimpleNamespace(content=[types.SimpleNamespace(text="ok")])
+
+    fake_sdk = types.ModuleType("anthropic")
+    fake_sdk.AsyncAnthropic = lambda api_key, http_client, timeout: types.SimpleNamespace(
+        messages=types.SimpleNamespace(create=create)
+    )
+    monkeypatch.setitem(sys.modules, "anthropic", fake_sdk)
+    monkeypatch.setattr(base_module, "_loop_objects", {})
+
+    llm = AnthropicLLM(api_key="key", max_concurrency=1)
+
+    async def burst():
+        return await asyncio.gather(*(llm.chat("hi") for _ in range(3)))
+
+    assert asyncio.run(burst()) == ["ok"] * 3
+    assert asyncio.run(burst()) == ["ok"] * 3
+
+
+@pytest.mark.asyncio
+async def test_openai_embed_many_batches_inputs(monkeypatch):
+    """Test that embed_many sends list inputs in batches and keeps order."""
+    import sys
+    import types
+
+    from rapidai.llm import OpenAILLM
+    from rapidai.llm import base as base_module
+
+    batches = []
+
+    async def create(model, input):
+        batches.append(input)
+        return types.SimpleNamespace(
+            data=[types.SimpleNamespace(embedding=[float(len(text))]) for text in input]
+        )
+
+    fake_sdk = types.ModuleType("openai")
+    fake_sdk.AsyncOpenAI = lambda api_key, http_client, timeout: types.SimpleNamespace(
+        embeddings=types.SimpleNamespace(create=create)
+    )
+    monkeypatch.setitem(sys.modules, "openai", fake_sdk)
+    monkeypatch.setattr(base_module, "_loop_objects", {})
+
+    llm = OpenAILLM(api_key="key")
+    texts = ["a" * n for n in range(1, 6)]
+
+    assert await llm.embed_many(texts, batch_size=2) == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert batches == [["a", "aa"], ["aaa", "aaaa"], ["aaaaa"]]
+    assert await llm.embed("abc") == [3.0]
+
+
+@pytest.mark.asyncio
+async def test_openai_caches_deterministic_responses(monkeypatch):
+    """Test that temperature-0 chat responses are served from the cache."""
+    import sys
+    import types
+
+    from rapidai.llm import LLMCache, OpenAILLM
+    from rapidai.llm import base as base_module
+
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        message = types.SimpleNamespace(content=f"reply {len(calls)}")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    fake_sdk = types.ModuleType("openai")
+    fake_sdk.AsyncOpenAI = lambda api_key, http_client, timeout: types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+    )
+    monkeypatch.setitem(sys.modules, "openai", fake_sdk)
+    monkeypatch.setattr(base_module, "_loop_objects", {})
+
+    cache = LLMCache()
+    deterministic = OpenAILLM(api_key="key", temperature=0, cache=cache)
+    sampled = OpenAILLM(api_key="key", temperature=0.7, cache=cache)
+
+    assert await deterministic.chat("hi") == "reply 1"
+    assert await deterministic.complete("hi") == "reply 1"
+    assert await deterministic.chat("hello") == "reply 2"
+    assert await sampled.chat("hi") == "reply 3"
+    assert await sampled.chat("hi") == "reply 4"
+    assert len(calls) == 4
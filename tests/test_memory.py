@@ -2,7 +2,7 @@
 
 import pytest
 from rapidai.memory import ConversationMemory, InMemoryStorage, MemoryManager
-from rapidai.types import Message
+from rapidai.types import ConversationHistory, Message
 
 
 def test_in_memory_storage():
@@ -102,3 +102,174 @@ def test_memory_manager():
     # Same user should get same memory instance
     memory1_again = manager.get("user1")
     assert memory1 is memory1_again
+
+
+def test_memory_manager_evicts_least_recently_used():
+    """Test that evicted conversations reload from storage."""
+    manager = MemoryManager(backend="memory", max_cached=2)
+
+    manager.get("user1").add("user", "Hello")
+    manager.get("user2")
+    manager.get("user1")
+    manager.get("user3")
+
+    assert list(manager._memories) == ["user1", "user3"]
+
+    manager.get("user2").add("user", "Back again")
+    assert "user1" not in manager._memories
+
+    reloaded = manager.get("user1")
+    assert [msg.content for msg in reloaded.get()] == ["Hello"]
+
+
+@pytest.mark.asyncio
+async def test_memory_manager_keeps_identity_of_conversations_in_use():
+    """Test that a conversation in use is returned again after LRU eviction."""
+    manager = MemoryManager(backend="memory", max_cached=1)
+    memory1 = manager.get("user1")
+
+    async with memory1.lock:
+        manager.get("user2")
+        assert "user1" not in manager._memories
+        assert manager.get("user1") is memory1
+
+    manager.get("user2")
+    assert "user1" not in manager._memories
+
+
+def test_history_serialization_round_trip():
+    """Test that stored histories round-trip and legacy pickles still load."""
+    import pickle
+
+    from rapidai.memory import _dump_history, _load_history
+
+    history = ConversationHistory(
+        messages=[
+            Message(role="user", content="Hi"),
+            Message(role="assistant", content="Hello", metadata={"tokens": 1}),
+        ],
+        user_id="user123",
+    )
+
+    assert _dump_history(history).startswith(b"{")
+    assert _load_history(_dump_history(history)) == history
+    assert _load_history(pickle.dumps(history)) == history
+
+
+@pytest.fixture
+def redis_storage(monkeypatch):
+    """Create a RedisStorage backed by fakeredis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    import redis
+    import redis.asyncio
+
+    from rapidai import memory
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis, "from_url", lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs)
+    )
+    monkeypatch.setattr(
+        redis.asyncio,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeAsyncRedis(server=server, **kwargs),
+    )
+    monkeypatch.setattr(memory, "_async_clients", {})
+    return memory.RedisStorage(prefix="test:")
+
+
+def _history(content):
+    return ConversationHistory(messages=[Message(role="user", content=content)])
+
+
+@pytest.mark.asyncio
+async def test_redis_storage_writes_behind_inside_event_loop(redis_storage):
+    """Test that Redis writes are deferred, ordered and visible to reads."""
+    import json
+
+    storage = redis_storage
+    for i in range(3):
+        storage.set("user1", _history(str(i)))
+        assert storage.get("user1").messages[0].content == str(i)
+    assert storage.client.get("test:user1") is None
+
+    await storage.flush()
+    stored = json.loads(storage.client.get("test:user1"))
+    assert [m["content"] for m in stored["messages"]] == ["2"]
+
+    storage.delete("user1")
+    assert storage.get("user1") is None
+    await storage.flush()
+    assert storage.client.get("test:user1") is None
+    assert not storage._pending
+
+
+@pytest.mark.asyncio
+async def test_redis_storage_keeps_and_reports_failed_writes(redis_storage, monkeypatch):
+    """Test that a failed background write is raised and retried, not dropped."""
+    import asyncio
+    import json
+
+    from rapidai.exceptions import MemoryError
+
+    storage = redis_storage
+    working_set = storage.async_client.set
+
+    async def broken_set(key, value):
+        raise ConnectionError("connection refused")
+
+    monkeypatch.setattr(storage.async_client, "set", broken_set)
+    storage.set("user1", _history("hello"))
+    await asyncio.gather(*storage._writers.values())
+
+    # The failure is reported once; the value stays pending and readable
+    with pytest.raises(MemoryError):
+        storage.get("user1")
+    assert storage.get("user1").messages[0].content == "hello"
+
+    # flush() retries the write and raises if it fails again
+    with pytest.raises(MemoryError):
+        await storage.flush()
+
+    monkeypatch.setattr(storage.async_client, "set", working_set)
+    await storage.flush()
+    stored = json.loads(storage.client.get("test:user1"))
+    assert stored["messages"][0]["content"] == "hello"
+
+
+def test_shared_storage_is_reread_on_each_access():
+    """Test that histories from shared backends are not served stale."""
+
+    class SharedStorage(InMemoryStorage):
+        process_local = False
+
+    storage = SharedStorage()
+    worker_a = ConversationMemory(user_id="user1", storage=storage)
+    worker_b = ConversationMemory(user_id="user1", storage=storage)
+
+    worker_a.add("user", "Hello")
+    assert len(worker_b.get()) == 1
+
+    # Simulate another process replacing the stored history
+    storage.set("user1", ConversationHistory(messages=[Message(role="user", content="Hi")]))
+    worker_b.add("assistant", "Hi there!")
+
+    assert [m.content for m in worker_a.get()] == ["Hi", "Hi there!"]
+
+
+def test_redis_storage_uses_a_client_per_event_loop(redis_storage):
+    """Test that background writes work across separate asyncio.run calls."""
+    import asyncio
+
+    storage = redis_storage
+
+    async def write(content):
+        storage.set("user1", _history(content))
+        await storage.flush()
+        return storage.async_client
+
+    first = asyncio.run(write("one"))
+    second = asyncio.run(write("two"))
+
+    assert first is not second
+    assert storage.get("user1").messages[0].content == "two"
@@ -232,6 +232,26 @@ class TestMetricsCollector:
         assert summary["successful_requests"] >= 2
         assert summary["failed_requests"] >= 1
 
+    def test_summary_aggregates_incrementally(self, collector):
+        """Should keep summary totals in sync with recorded requests."""
+        collector.record_request("/a", "GET", 1.0, 200, tokens_used=100, model="gpt-4o")
+        collector.record_request("/b", "GET", 3.0, 500, tokens_used=50, model="gpt-4o")
+
+        summary = collector.get_summary()
+
+        assert summary["total_requests"] == 2
+        assert summary["failed_requests"] == 1
+        assert summary["average_duration"] == 2.0
+        assert summary["total_tokens"] == 150
+        assert summary["total_cost"] == pytest.approx(
+            collector.get_model_usage()["gpt-4o"].total_cost
+        )
+
+        collector.clear()
+        summary = collector.get_summary()
+        assert summary["total_requests"] == 0
+        assert summary["total_tokens"] == 0
+
     def test_clear(self, collector):
         """Should clear all metrics."""
         collector.record_metric("test", 1.0)
@@ -288,6 +308,16 @@ class TestCostCalculation:
 
         assert cost == 0.0
 
+    def test_calculate_cost_model_added_at_runtime(self, monkeypatch):
+        """Should price models added to MODEL_PRICING after import."""
+        from rapidai.monitoring import MODEL_PRICING
+
+        monkeypatch.setitem(MODEL_PRICING, "custom-model", {"prompt": 2.0, "completion": 4.0})
+
+        cost = calculate_cost(model="custom-model", prompt_tokens=1000, completion_tokens=500)
+
+        assert cost == pytest.approx(0.004)
+
     def test_calculate_cost_zero_tokens(self):
         """Should handle zero tokens."""
         cost = calculate_cost(
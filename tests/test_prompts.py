@@ -227,3 +227,17 @@ def test_get_global_prompt_manager():
 
     # Should return the same instance
     assert manager1 is manager2
+
+
+def test_prompt_render_reuses_compiled_template():
+    """Rendering compiles the template once and recompiles on change."""
+    p = Prompt(name="greeting", template="Hello {{ name }}!")
+
+    assert p.render(name="Alice") == "Hello Alice!"
+    compiled = p._compiled
+    assert p.render(name="Bob") == "Hello Bob!"
+    assert p._compiled is compiled
+
+    p.template = "Hi {{ name }}!"
+    assert p.render(name="Bob") == "Hi Bob!"
+    assert p._compiled is not compiled
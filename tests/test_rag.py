@@ -8,6 +8,7 @@ from rapidai.rag import (
     RAG,
     MockEmbedding,
     MockVectorDB,
+    NumpyVectorDB,
     RecursiveChunker,
     SentenceChunker,
     rag,
@@ -216,3 +217,217 @@ async def test_rag_decorator_basic():
     # Note: Full decorator test would require app integration
     # This tests the decorator wrapping
     assert callable(ask)
+
+
+@pytest.mark.asyncio
+async def test_numpy_vectordb_search_and_filter():
+    """Test NumPy vector database cosine search with metadata filters."""
+    vectordb = NumpyVectorDB()
+    await vectordb.create_collection("docs", dimension=3)
+    await vectordb.add_chunks(
+        "docs",
+        [
+            DocumentChunk(content="a", metadata={"type": "pdf"}, embedding=[1.0, 0.0, 0.0]),
+            DocumentChunk(content="b", metadata={"type": "txt"}, embedding=[0.9, 0.1, 0.0]),
+            DocumentChunk(content="c", metadata={"type": "pdf"}, embedding=[0.0, 1.0, 0.0]),
+        ],
+    )
+
+    results = await vectordb.search("docs", [1.0, 0.0, 0.0], top_k=2)
+    assert [c.content for c in results] == ["a", "b"]
+
+    results = await vectordb.search(
+        "docs", [1.0, 0.0, 0.0], top_k=5, filter_metadata={"type": "pdf"}
+    )
+    assert [c.content for c in results] == ["a", "c"]
+
+    results = await vectordb.search("docs", [0.0, 2.0, 0.0], top_k=1)
+    assert [c.content for c in results] == ["c"]
+
+    results = await vectordb.search(
+        "docs", [0.0, 1.0, 0.0], top_k=1, filter_metadata={"type": "txt"}
+    )
+    assert [c.content for c in results] == ["b"]
+
+    results = await vectordb.search(
+        "docs", [1.0, 0.0, 0.0], filter_metadata={"type": "docx"}
+    )
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_numpy_vectordb_filters_on_any_metadata_value():
+    """Test that tuple, list and dict metadata values can be filtered on."""
+    vectordb = NumpyVectorDB()
+    await vectordb.create_collection("docs", dimension=2)
+    await vectordb.add_chunks(
+        "docs",
+        [
+            DocumentChunk(content="a", metadata={"tags": ("x", "y")}, embedding=[1.0, 0.0]),
+            DocumentChunk(content="b", metadata={"tags": ["x", "y"]}, embedding=[0.9, 0.1]),
+            DocumentChunk(content="c", metadata={"tags": {"x": 1}}, embedding=[0.0, 1.0]),
+            DocumentChunk(content="d", metadata={"tags": ["z"]}, embedding=[0.5, 0.5]),
+        ],
+    )
+
+    async def search(tags):
+        results = await vectordb.search(
+            "docs", [1.0, 0.0], top_k=5, filter_metadata={"tags": tags}
+        )
+        return [c.content for c in results]
+
+    assert await search(("x", "y")) == ["a"]
+    assert await search(["x", "y"]) == ["b"]
+    assert await search({"x": 1}) == ["c"]
+    assert await search(["z"]) == ["d"]
+    assert await search(["w"]) == []
+
+
+@pytest.mark.asyncio
+async def test_rag_build_index_persists(tmp_path):
+    """Test that a built index is reloaded from disk without re-embedding."""
+    docs = [
+        Document(content="RapidAI supports RAG.", metadata={"source": "a.txt"}),
+        Document(content="Caching makes it fast.", metadata={"source": "b.txt"}),
+    ]
+
+    rag_system = RAG(
+        embedding=MockEmbedding(dimension=32),
+        vectordb=NumpyVectorDB(persist_directory=str(tmp_path)),
+    )
+    await rag_system.build_index(docs)
+    collection = rag_system.config.vectordb.collection_name
+    assert (tmp_path / collection / "embeddings.npy").exists()
+
+    embedding = MockEmbedding(dimension=32)
+    reloaded = RAG(
+        embedding=embedding,
+        vectordb=NumpyVectorDB(persist_directory=str(tmp_path)),
+    )
+    result = await reloaded.retrieve("RAG", top_k=2)
+    assert len(result.sources) == 2
+    assert embedding.embed_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_rag_add_documents_batches_embeddings():
+    """Test that chunks from all documents share batched embedding calls."""
+    embedding = MockEmbedding(dimension=16)
+    vectordb = MockVectorDB()
+    rag_system = RAG(embedding=embedding, vectordb=vectordb)
+    rag_system.config.embed_batch_size = 2
+
+    docs = [
+        Document(content=f"Document {i} content", metadata={"source": f"doc{i}.txt"})
+        for i in range(5)
+    ]
+    all_chunks = await rag_system.add_documents(docs)
+
+    assert len(all_chunks) == 5
+    assert all(c.embedding is not None for chunks in all_chunks for c in chunks)
+    assert embedding.batch_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_rag_retrieve_many():
+    """Test that multiple queries are embedded in one batch."""
+    embedding = MockEmbedding(dimension=16)
+    rag_system = RAG(embedding=embedding, vectordb=MockVectorDB())
+    await rag_system.add_document(
+        Document(content="RapidAI supports RAG.", metadata={"source": "a.txt"})
+    )
+    embedding.batch_calls = 0
+
+    results = await rag_system.retrieve_many(["RAG?", "caching?"], top_k=1)
+
+    assert len(results) == 2
+    assert all(len(r.sources) == 1 for r in results)
+    assert embedding.batch_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_numpy_vectordb_quantized(tmp_path):
+    """Test int8 storage keeps ranking and survives persistence."""
+    vectordb = NumpyVectorDB(persist_directory=str(tmp_path), quantize=True)
+    await vectordb.create_collection("docs", dimension=4)
+    await vectordb.add_chunks(
+        "docs",
+        [
+            DocumentChunk(content="a", metadata={}, embedding=[0.9, 0.1, 0.0, 0.0]),
+            DocumentChunk(content="b", metadata={}, embedding=[0.0, 0.0, 5.0, 1.0]),
+            DocumentChunk(content="c", metadata={}, embedding=[0.0, 0.0, 0.0, 0.0]),
+        ],
+    )
+    await vectordb.persist("docs")
+
+    reloaded = NumpyVectorDB(persist_directory=str(tmp_path))
+    await reloaded.create_collection("docs", dimension=4)
+    assert reloaded._embeddings["docs"].dtype.name == "int8"
+
+    results = await reloaded.search("docs", [0.0, 0.0, 1.0, 0.2], top_k=2)
+    assert [c.content for c in results][0] == "b"
+
+
+def _numpy_chunks(count, offset=0):
+    return [
+        DocumentChunk(content=str(offset + i), metadata={}, embedding=[1.0, float(offset + i)])
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_numpy_vectordb_persist_twice(tmp_path):
+    """Test that persisting an already-persisted collection keeps the index intact."""
+    vectordb = NumpyVectorDB(persist_directory=str(tmp_path))
+    await vectordb.create_collection("docs", dimension=2)
+    await vectordb.add_chunks("docs", _numpy_chunks(500))
+    await vectordb.persist("docs")
+    await vectordb.persist("docs")
+
+    reloaded = NumpyVectorDB(persist_directory=str(tmp_path))
+    await reloaded.create_collection("docs", dimension=2)
+    assert reloaded._embeddings["docs"].shape == (500, 2)
+    assert sorted(tmp_path.joinpath("docs").iterdir()) == sorted(
+        tmp_path / "docs" / name for name in ("chunks.json", "embeddings.npy", "manifest.json")
+    )
+
+
+@pytest.mark.asyncio
+async def test_numpy_vectordb_load_persist_reload(tmp_path):
+    """Test persisting a loaded collection, with and without new chunks."""
+    vectordb = NumpyVectorDB(persist_directory=str(tmp_path))
+    await vectordb.create_collection("docs", dimension=2)
+    await vectordb.add_chunks("docs", _numpy_chunks(500))
+    await vectordb.persist("docs")
+
+    loaded = NumpyVectorDB(persist_directory=str(tmp_path))
+    await loaded.create_collection("docs", dimension=2)
+    await loaded.persist("docs")
+    await loaded.add_chunks("docs", _numpy_chunks(10, offset=500))
+    await loaded.persist("docs")
+
+    reloaded = NumpyVectorDB(persist_directory=str(tmp_path))
+    await reloaded.create_collection("docs", dimension=2)
+    assert reloaded._embeddings["docs"].shape == (510, 2)
+    assert [c.content for c in reloaded._chunks["docs"]][-1] == "509"
+    assert list(reloaded._embeddings["docs"][-1]) == [1.0, 509.0]
+
+
+@pytest.mark.asyncio
+async def test_rag_add_documents_from_files(tmp_path):
+    """Test loading several files concurrently through add_documents."""
+    paths = []
+    for i, ext in enumerate([".txt", ".md", ".txt"]):
+        path = tmp_path / f"doc{i}{ext}"
+        path.write_text(f"File {i} talks about topic {i}.", encoding="utf-8")
+        paths.append(path)
+
+    rag_system = RAG(embedding=MockEmbedding(dimension=16), vectordb=MockVectorDB())
+    all_chunks = await rag_system.add_documents(paths)
+
+    assert [chunks[0].metadata["filename"] for chunks in all_chunks] == [
+        "doc0.txt",
+        "doc1.md",
+        "doc2.txt",
+    ]
+    assert all_chunks[1][0].metadata["type"] == "markdown"
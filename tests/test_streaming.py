@@ -1,7 +1,8 @@
 """Tests for streaming functionality."""
 
 import pytest
-from rapidai.streaming import stream, is_stream_handler
+
+from rapidai.streaming import is_stream_handler, stream
 
 
 @pytest.mark.asyncio
@@ -54,3 +55,73 @@ def test_is_stream_handler():
 
     assert is_stream_handler(stream_handler) is True
     assert is_stream_handler(normal_handler) is False
+
+
+@pytest.mark.asyncio
+async def test_stream_handler_returning_iterator(app, test_client):
+    """Coroutine handlers can return an async iterator to be streamed."""
+
+    async def source(message: str):
+        for word in message.split():
+            yield word
+
+    @app.route("/chat", methods=["POST"])
+    @stream
+    async def chat(message: str):
+        return source(message)
+
+    response = await test_client.post("/chat", json={"message": "hello world"})
+
+    assert response.status_code == 200
+    assert "data: hello\n\n" in response.text
+    assert "data: world\n\n" in response.text
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_coalesces_events():
+    """Events arriving together are sent in one body message."""
+    from rapidai.streaming import StreamingResponse
+
+    async def tokens():
+        for token in ["a", "b", "c"]:
+            yield token
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await StreamingResponse(tokens(), flush_interval=1.0).send(send)
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+    assert bodies == [
+        b"event: message\ndata: a\n\nevent: message\ndata: b\n\nevent: message\ndata: c\n\n",
+        b"",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_flushes_after_interval():
+    """A buffered event is not held back while the source is slow."""
+    import asyncio
+
+    from rapidai.streaming import StreamingResponse
+
+    async def tokens():
+        yield "a"
+        await asyncio.sleep(0.05)
+        yield "b"
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await StreamingResponse(tokens(), flush_interval=0.01).send(send)
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+    assert bodies == [
+        b"event: message\ndata: a\n\n",
+        b"event: message\ndata: b\n\n",
+        b"",
+    ]